@@ -1,15 +1,48 @@
+import math
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
 import pygame
 
 from config import GameConfig
-from engine import InputSystem, RenderSystem, SoundSystem, SceneManager, ServiceLocator
+from engine import (
+    CpuCapture,
+    AnimationSystem,
+    EntityPool,
+    FixedTimestep,
+    FontRegistry,
+    FrameProfiler,
+    InputScript,
+    InputSystem,
+    MemoryCapture,
+    ProfilerOverlay,
+    RenderSystem,
+    Scheduler,
+    SceneManager,
+    ServiceLocator,
+    SoundSystem,
+    StateInterpolator,
+    TransformSystem,
+    World,
+)
 from game import BootScene
 from logger import get_logger
-from utils import load_font_with_fallback
 from utils.resources import get_resource_path
 from utils.responsive import ResponsiveScaleManager
 
 log = get_logger("main")
 
+# Show/hide the frame profiler overlay
+PROFILER_OVERLAY_KEY = pygame.K_F3
+# Write the recorded frames as a Chrome trace to the logs directory
+PROFILER_TRACE_KEY = pygame.K_F4
+# cProfile the next GAME_CPU_CAPTURE_FRAMES frames into the logs directory
+CPU_CAPTURE_KEY = pygame.K_F5
+# tracemalloc diff of the next scene change into the logs directory
+MEMORY_CAPTURE_KEY = pygame.K_F6
+
 
 class GameApp:
     def __init__(
@@ -17,22 +50,43 @@ class GameApp:
         width=GameConfig.WINDOW_WIDTH,
         height=GameConfig.WINDOW_HEIGHT,
         fps=GameConfig.FPS,
+        headless: Optional[bool] = None,
+        input_script: Optional[InputScript] = None,
     ):
+        # Headless: no window, no audio device, nothing presented
+        self.headless = GameConfig.HEADLESS if headless is None else headless
+        if self.headless:
+            # Must be set before pygame initializes its video/audio subsystems
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
 
-        # Set the icon
-        icon_path = get_resource_path("assets/icon.png")
-        icon = pygame.image.load(icon_path)
-        pygame.display.set_caption(GameConfig.WINDOW_TITLE)
+        if self.headless:
+            # Images are still converted for the display format, so one is needed
+            self.screen = pygame.display.set_mode((width, height))
+        else:
+            # Set the icon
+            icon_path = get_resource_path("assets/icon.png")
+            icon = pygame.image.load(icon_path)
+            pygame.display.set_caption(GameConfig.WINDOW_TITLE)
 
-        # Initialize screen with RESIZABLE flag
-        self.screen = pygame.display.set_mode(
-            (width, height), pygame.RESIZABLE)
+            # Initialize screen with RESIZABLE flag
+            self.screen = pygame.display.set_mode(
+                (width, height), pygame.RESIZABLE)
 
-        pygame.display.set_icon(icon)
+            pygame.display.set_icon(icon)
 
         self.clock = pygame.time.Clock()
-        self.fps = fps
+        # Headless frames run uncapped; each one advances time by one nominal frame
+        self.fps = 0 if self.headless else fps
+        self._headless_frame_time = 1.0 / (fps or GameConfig.FPS)
+
+        # Events injected into the loop at given frame numbers
+        if input_script is None and GameConfig.INPUT_SCRIPT:
+            input_script = InputScript.load(GameConfig.INPUT_SCRIPT)
+        self.input_script = input_script
+        # Frames run so far (the first frame is 1)
+        self.frame = 0
 
         # Create virtual surface for fixed aspect ratio rendering
         self.virtual_surface = pygame.Surface(
@@ -45,145 +99,435 @@ class GameApp:
         )
         self.scale_manager.update_window_size(width, height)
 
+        # Every font is loaded once and shared by the app, systems and scenes
+        self.fonts = FontRegistry()
+        ServiceLocator.provide("font_registry", self.fonts)
+
         # Load custom font from file, fallback to system font if file is not available
-        self.font = load_font_with_fallback(GameConfig.DEFAULT_FONT_SIZE)
+        self.font = self.fonts.get(GameConfig.DEFAULT_FONT_SIZE)
 
         self.running = True
 
         # Initialize render system with virtual surface instead of screen
-        self.render_system = RenderSystem(self.virtual_surface, self.font)
+        self.render_system = RenderSystem(
+            self.virtual_surface,
+            self.font,
+            use_dirty_rects=GameConfig.DIRTY_RECTS,
+            fonts=self.fonts,
+        )
+        # The whole window must be presented (first frame, after a resize)
+        self._present_full = True
+        # Whether the last full-redraw frame drew anything new
+        self._frame_changed = True
+        self._scaled_surface = None
+        self._update_scaled_surface()
         self.input_system = InputSystem()
+        self.animation_system = AnimationSystem()
         self.sound_system = SoundSystem()
+        self.transform_system = TransformSystem()
+
+        # Events collected by run() and dispatched by the "input" system
+        self._pending_events: list = []
+        # Frame phases are timed while profiling (GAME_PROFILER or the overlay)
+        self.profiler = FrameProfiler(enabled=GameConfig.PROFILER)
+        self._profiler_overlay = None
+        self.show_profiler = False
+        self.scheduler = Scheduler(
+            workers=GameConfig.SCHEDULER_WORKERS, profiler=self.profiler
+        )
+        # Scene logic, animation and transforms: run by the "simulation" system
+        self.simulation = Scheduler(
+            workers=GameConfig.SCHEDULER_WORKERS, profiler=self.profiler
+        )
+        self._register_systems()
+        self.scheduler.add_sync(self._apply_commands)
+        self.simulation.add_sync(self._apply_commands)
+
+        # Fixed-timestep mode: the simulation ticks at a constant rate and
+        # rendering interpolates between the last two ticks
+        self.timestep = None
+        self.interpolator = None
+        self._blending = False
+        if GameConfig.FIXED_TICK_RATE > 0:
+            self.timestep = FixedTimestep(
+                GameConfig.FIXED_TICK_RATE, GameConfig.MAX_FIXED_STEPS
+            )
+            self.interpolator = StateInterpolator()
+            self.render_system.blend = self.interpolator.blend
+
+        # Scenes release their entities here on exit and UIBuilder reuses them
+        if GameConfig.ENTITY_POOL_SIZE > 0:
+            self.entity_pool = EntityPool(GameConfig.ENTITY_POOL_SIZE)
+            ServiceLocator.provide("entity_pool", self.entity_pool)
 
         self.scene_manager = SceneManager(self)
         self.scene_manager.change(BootScene(self))
 
+        # On-demand captures for stutter reports (F5/F6 or GAME_*_CAPTURE)
+        logs_dir = GameConfig.logging.logs_dir
+        self.cpu_capture = CpuCapture(logs_dir, GameConfig.CAPTURE_TOP)
+        self.memory_capture = MemoryCapture(logs_dir, GameConfig.CAPTURE_TOP)
+        self.scene_manager.add_hooks(
+            self.memory_capture.before_change, self.memory_capture.after_change
+        )
+        if GameConfig.CPU_CAPTURE:
+            self.cpu_capture.request(GameConfig.CPU_CAPTURE_FRAMES)
+        if GameConfig.MEMORY_CAPTURE:
+            self.memory_capture.arm()
+
         ServiceLocator.provide("app", self)
         ServiceLocator.provide("sound_system", self.sound_system)
 
-    def run(self):
-        while self.running:
-            delta_time = self.clock.tick(self.fps) / 1000.0
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    break
-
-                # Handle window resize events
-                if event.type == pygame.VIDEORESIZE:
-                    log.debug(f"Window resized to: {event.w}x{event.h}")
-                    self.screen = pygame.display.set_mode(
-                        (event.w, event.h), pygame.RESIZABLE
-                    )
-                    self.scale_manager.update_window_size(event.w, event.h)
-                    log.debug(f"Scale factor updated to: {
-                              self.scale_manager.scale}")
-                    log.debug(
-                        f"Offset calculated as: ({self.scale_manager.offset_x}, {
-                            self.scale_manager.offset_y})"
-                    )
-
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    # Convert screen coordinates to virtual coordinates before processing
-                    vx, vy = self.scale_manager.screen_to_world(*event.pos)
-                    if self.scene_manager.current:
-                        self.input_system.handle_mouse_down(
-                            vx, vy, self.scene_manager.current.entities
-                        )
-                    # Process sound system for clicked buttons
-                    if self.scene_manager.current:
-                        self.sound_system.update(
-                            self.scene_manager.current.entities)
-
-                if event.type == pygame.MOUSEBUTTONUP:
-                    # Convert screen coordinates to virtual coordinates before processing
-                    vx, vy = self.scale_manager.screen_to_world(*event.pos)
-                    if self.scene_manager.current:
-                        self.input_system.handle_mouse_up(
-                            vx, vy, self.scene_manager.current.entities
-                        )
-                    # Process sound system for clicked buttons
-                    if self.scene_manager.current:
-                        self.sound_system.update(
-                            self.scene_manager.current.entities)
-
-                if event.type == pygame.MOUSEMOTION:
-                    # Convert screen coordinates to virtual coordinates before processing
-                    vx, vy = self.scale_manager.screen_to_world(*event.pos)
-                    if self.scene_manager.current:
-                        self.input_system.handle_mouse_motion(
-                            vx, vy, self.scene_manager.current.entities
-                        )
-
-                if event.type == pygame.KEYDOWN:
-                    # Handle global sound toggle (Ctrl+M) - works in all scenes
-                    if event.key == pygame.K_m and (event.mod & pygame.KMOD_CTRL):
-                        if self.sound_system:
-                            was_enabled = self.sound_system.enabled
-                            if self.sound_system.enabled:
-                                self.sound_system.disable_sounds()
-                            else:
-                                self.sound_system.enable_sounds()
-
-                            # Play button click sound if sound was just enabled
-                            if not was_enabled and self.sound_system.enabled:
-                                self.sound_system.play_sound("button_click")
-
-                            # Update the sound button image (safe to call on any scene)
-                            if self.scene_manager.current:
-                                self.scene_manager.current.update_sound_button_image(
-                                    self.sound_system.enabled
-                                )
-                    else:
-                        # Handle other keyboard events
-                        self.input_system.handle_key(event)
-                        if self.scene_manager.current:
-                            self.scene_manager.current.handle_event(event)
+    def _register_systems(self):
+        """Register the frame's systems; conflicting systems run in this order."""
+        self.scheduler.add_system("input", self._run_input, exclusive=True)
+        # Runs the simulation systems below once per frame or once per tick
+        self.scheduler.add_system("simulation", self._run_simulation, exclusive=True)
+        self.simulation.add_system("scene", self._run_scene, exclusive=True)
+        # Tween completion callbacks run scene code (and tweens may write anything)
+        self.simulation.add_system("animation", self._run_animation, exclusive=True)
+        self.simulation.add_system(
+            "transform",
+            self._run_transform,
+            reads=TransformSystem.READS,
+            writes=TransformSystem.WRITES,
+        )
+        self.scheduler.add_system(
+            "sound",
+            self._run_sound,
+            reads=SoundSystem.READS,
+            writes=SoundSystem.WRITES,
+        )
+        self.scheduler.add_system(
+            "render",
+            self._run_render,
+            reads=RenderSystem.READS,
+            writes=RenderSystem.WRITES,
+        )
 
+    def _apply_commands(self):
+        """Sync point: apply structural changes the systems recorded."""
+        if self.scene_manager.current:
+            entities = self.scene_manager.current.entities
+            if isinstance(entities, World):
+                entities.apply_commands()
+
+    def _run_input(self, delta_time: float):
+        """Dispatch the events collected this frame (button callbacks run here)."""
+        events, self._pending_events = self._pending_events, []
+        for event in events:
+            self._dispatch_event(event)
+
+    def _dispatch_event(self, event: pygame.event.Event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Convert screen coordinates to virtual coordinates before processing
+            vx, vy = self.scale_manager.screen_to_world(*event.pos)
+            if self.scene_manager.current:
+                self.input_system.handle_mouse_down(
+                    vx, vy, self.scene_manager.current.entities
+                )
+            # Process sound system for clicked buttons
             if self.scene_manager.current:
-                try:
-                    self.scene_manager.current.update(delta_time)
-                except Exception as e:
-                    log.exception("Scene update error: %s", e)
+                self.sound_system.update(
+                    self.scene_manager.current.entities)
 
-            # Process sound system for any entities with sound components
+        if event.type == pygame.MOUSEBUTTONUP:
+            # Convert screen coordinates to virtual coordinates before processing
+            vx, vy = self.scale_manager.screen_to_world(*event.pos)
+            if self.scene_manager.current:
+                self.input_system.handle_mouse_up(
+                    vx, vy, self.scene_manager.current.entities
+                )
+            # Process sound system for clicked buttons
             if self.scene_manager.current:
-                self.sound_system.update(self.scene_manager.current.entities)
+                self.sound_system.update(
+                    self.scene_manager.current.entities)
 
-            # Render to virtual surface first
-            self.virtual_surface.fill(GameConfig.BACKGROUND_COLOR)
+        if event.type == pygame.MOUSEMOTION:
+            # Convert screen coordinates to virtual coordinates before processing
+            vx, vy = self.scale_manager.screen_to_world(*event.pos)
             if self.scene_manager.current:
-                try:
-                    self.render_system.update(
-                        self.scene_manager.current.entities)
-                except Exception as e:
-                    log.exception("Render error: %s", e)
-
-            # Scale and blit virtual surface to actual screen with letterboxing
-            self.screen.fill(
-                (30, 30, 30)
-            )  # Letterbox background (same as BACKGROUND_COLOR)
-
-            # Calculate scaled dimensions
-            scaled_width = int(
-                self.virtual_surface.get_width() * self.scale_manager.scale
-            )
-            scaled_height = int(
-                self.virtual_surface.get_height() * self.scale_manager.scale
-            )
+                self.input_system.handle_mouse_motion(
+                    vx, vy, self.scene_manager.current.entities
+                )
+
+        if event.type == pygame.KEYDOWN:
+            # Handle global sound toggle (Ctrl+M) - works in all scenes
+            if event.key == pygame.K_m and (event.mod & pygame.KMOD_CTRL):
+                if self.sound_system:
+                    was_enabled = self.sound_system.enabled
+                    if self.sound_system.enabled:
+                        self.sound_system.disable_sounds()
+                    else:
+                        self.sound_system.enable_sounds()
 
-            # Scale the virtual surface
-            scaled_surface = pygame.transform.scale(
-                self.virtual_surface, (scaled_width, scaled_height)
-            )
+                    # Play button click sound if sound was just enabled
+                    if not was_enabled and self.sound_system.enabled:
+                        self.sound_system.play_sound("button_click")
 
-            # Blit scaled surface to screen with offset for centering
-            self.screen.blit(
-                scaled_surface,
-                (self.scale_manager.offset_x, self.scale_manager.offset_y),
+                    # Update the sound button image (safe to call on any scene)
+                    if self.scene_manager.current:
+                        self.scene_manager.current.update_sound_button_image(
+                            self.sound_system.enabled
+                        )
+            else:
+                # Handle other keyboard events
+                self.input_system.handle_key(event)
+                if self.scene_manager.current:
+                    self.scene_manager.current.handle_event(event)
+
+    def _run_simulation(self, delta_time: float):
+        """Advance scene logic and animation by the frame time."""
+        if self.timestep is None:
+            self.simulation.run(delta_time)
+            return
+
+        for _ in range(self.timestep.advance(delta_time)):
+            # The scene may change during a tick, so look it up every time
+            entities = self._current_entities()
+            self.interpolator.begin_tick(entities)
+            self.simulation.run(self.timestep.step)
+            self.interpolator.end_tick(self._current_entities())
+        self.interpolator.alpha = self.timestep.alpha
+
+        # Blended frames change without any component changing; redraw them
+        # and, once blending stops, the final state once more
+        blending = self.interpolator.active
+        if blending or self._blending:
+            self.render_system.invalidate()
+        self._blending = blending
+
+    def _current_entities(self) -> list:
+        scene = self.scene_manager.current
+        return scene.entities if scene else []
+
+    def _run_scene(self, delta_time: float):
+        if self.scene_manager.current:
+            self.scene_manager.current.update(delta_time)
+
+    def _run_animation(self, delta_time: float):
+        # Fades, progress bars and tweens advance by the real frame time
+        if self.scene_manager.current:
+            self.animation_system.update(
+                self.scene_manager.current.entities, delta_time
             )
 
-            pygame.display.flip()
+    def _run_transform(self, delta_time: float):
+        # Move children of containers that moved during input/scene update
+        if self.scene_manager.current:
+            self.transform_system.update(self.scene_manager.current.entities)
+
+    def _run_sound(self, delta_time: float):
+        # Process sound system for any entities with sound components
+        if self.scene_manager.current:
+            self.sound_system.update(self.scene_manager.current.entities)
+
+    def _run_render(self, delta_time: float):
+        if not self.scene_manager.current:
+            return
+        entities = self.scene_manager.current.entities
+        # Dirty-rect mode clears only what it redraws
+        if self.render_system.use_dirty_rects:
+            self.render_system.update(entities)
+            return
+        # An unchanged scene keeps last frame's virtual surface (and skips presenting)
+        if not self.render_system.needs_redraw(entities):
+            return
+        self._frame_changed = True
+        # Render to virtual surface first
+        self.virtual_surface.fill(GameConfig.BACKGROUND_COLOR)
+        self.render_system.update(entities)
+
+    def _present(self) -> bool:
+        """
+        Show the virtual surface in the window (whole or only its dirty rects).
+
+        Returns whether anything was presented.
+        """
+        dirty_rects = self.render_system.dirty_rects
+        # The overlay changes every frame and is drawn over the whole window
+        if self.show_profiler:
+            self._present_full = True
+        profiler = self.profiler
+        if self._present_full or (dirty_rects is None and self._frame_changed):
+            self._present_full = False
+            self._frame_changed = False
+            with profiler.section("scale"):
+                # Letterbox background (same as BACKGROUND_COLOR)
+                self.screen.fill((30, 30, 30))
+                offset = (self.scale_manager.offset_x, self.scale_manager.offset_y)
+                if self._scaled_surface is None:
+                    # Integer scale factor of 1: no scaling needed at all
+                    self.screen.blit(self.virtual_surface, offset)
+                else:
+                    # Scale into the persistent surface instead of allocating one
+                    pygame.transform.scale(
+                        self.virtual_surface,
+                        self._scaled_surface.get_size(),
+                        self._scaled_surface,
+                    )
+                    self.screen.blit(self._scaled_surface, offset)
+            if self.show_profiler:
+                self._profiler_overlay.draw(self.screen)
+            with profiler.section("flip"):
+                pygame.display.flip()
+            return True
+        if dirty_rects:
+            with profiler.section("scale"):
+                rects = [self._present_rect(r) for r in dirty_rects]
+            with profiler.section("flip"):
+                pygame.display.update(rects)
+            return True
+        # Nothing changed: the window keeps showing the last frame
+        return False
+
+    def _update_scaled_surface(self):
+        """(Re)create the window-sized surface the virtual surface is scaled into."""
+        size = (
+            int(self.virtual_surface.get_width() * self.scale_manager.scale),
+            int(self.virtual_surface.get_height() * self.scale_manager.scale),
+        )
+        if size == self.virtual_surface.get_size():
+            self._scaled_surface = None
+        elif self._scaled_surface is None or self._scaled_surface.get_size() != size:
+            self._scaled_surface = pygame.Surface(size, 0, self.virtual_surface)
+        self._present_full = True
+
+    def _present_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """Scale one region of the virtual surface to the window; returns the window rect."""
+        scale = self.scale_manager.scale
+        if scale != int(scale):
+            # One extra pixel around the region hides seams from scaling rounding
+            rect = rect.inflate(2, 2).clip(self.virtual_surface.get_rect())
+        left = math.floor(self.scale_manager.offset_x + rect.left * scale)
+        top = math.floor(self.scale_manager.offset_y + rect.top * scale)
+        right = math.ceil(self.scale_manager.offset_x + rect.right * scale)
+        bottom = math.ceil(self.scale_manager.offset_y + rect.bottom * scale)
+        scaled = pygame.transform.scale(
+            self.virtual_surface.subsurface(rect), (right - left, bottom - top)
+        )
+        return self.screen.blit(scaled, (left, top))
+
+    def _is_idle(self, events: list, presented: bool) -> bool:
+        """Check whether the last frame had no input, animation or visible change."""
+        scene = self.scene_manager.current
+        return not (
+            events
+            or presented
+            or self.animation_system.active
+            or (scene is not None and scene.is_busy())
+        )
+
+    def _wait_for_events(self) -> list:
+        """Block until input arrives (or the idle timeout passes)."""
+        event = pygame.event.wait(GameConfig.IDLE_WAIT_TIMEOUT_MS)
+        # Time spent waiting is not frame time: restart the clock
+        self.clock.tick()
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
 
+    def run(self):
+        idle = False
+        while self.running:
+            if idle:
+                # Nothing moves: sleep in the event queue instead of ticking at FPS
+                events = self._wait_for_events()
+                delta_time = 1.0 / self.fps if self.fps else 0.0
+            else:
+                delta_time = self.clock.tick(self.fps) / 1000.0
+                events = None
+            if self.headless:
+                delta_time = self._headless_frame_time
+            self.frame += 1
+            # Frame time is measured from here: FPS capping and idle waits
+            # are not work
+            self.profiler.begin_frame()
+            self.cpu_capture.begin_frame()
+            with self.profiler.section("events"):
+                if events is None:
+                    events = pygame.event.get()
+                if self.input_script is not None:
+                    events.extend(self.input_script.events(self.frame))
+                self._collect_events(events)
+
+            # Input, scene update, sound and rendering
+            self.scheduler.run(delta_time)
+
+            # Headless runs skip scaling and presenting (and never wait)
+            if not self.headless:
+                presented = self._present()
+                idle = GameConfig.IDLE_WAIT and self._is_idle(events, presented)
+            self.profiler.end_frame()
+            self.cpu_capture.end_frame()
+            self.memory_capture.end_frame()
+
+        self.scheduler.shutdown()
+        self.simulation.shutdown()
         pygame.quit()
         log.info("GameApp terminated")
+
+    def _collect_events(self, events: list):
+        """Handle window-level events; queue the rest for the "input" system."""
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+                break
+
+            # Handle window resize events
+            if event.type == pygame.VIDEORESIZE:
+                log.debug(f"Window resized to: {event.w}x{event.h}")
+                self.screen = pygame.display.set_mode(
+                    (event.w, event.h), pygame.RESIZABLE
+                )
+                self.scale_manager.update_window_size(event.w, event.h)
+                self._update_scaled_surface()
+                log.debug(f"Scale factor updated to: {
+                          self.scale_manager.scale}")
+                log.debug(
+                    f"Offset calculated as: ({self.scale_manager.offset_x}, {
+                        self.scale_manager.offset_y})"
+                )
+                continue
+
+            # The window content may have been lost (e.g. after minimizing)
+            if event.type == pygame.WINDOWEXPOSED:
+                self._present_full = True
+
+            if event.type == pygame.KEYDOWN and self._handle_profiler_key(event):
+                continue
+
+            self._pending_events.append(event)
+
+    def _handle_profiler_key(self, event) -> bool:
+        """Handle the profiling hotkeys; returns whether ``event`` was one."""
+        if event.key == PROFILER_OVERLAY_KEY:
+            self.show_profiler = not self.show_profiler
+            if self.show_profiler and self._profiler_overlay is None:
+                self._profiler_overlay = ProfilerOverlay(
+                    self.profiler, self.fonts.get(GameConfig.BUTTON_TAG_FONT_SIZE)
+                )
+            self.profiler.enabled = self.show_profiler or GameConfig.PROFILER
+            # Showing or removing the overlay needs the whole window redrawn
+            self._present_full = True
+            return True
+        if event.key == PROFILER_TRACE_KEY:
+            self.export_trace()
+            return True
+        if event.key == CPU_CAPTURE_KEY:
+            self.cpu_capture.request(GameConfig.CPU_CAPTURE_FRAMES)
+            return True
+        if event.key == MEMORY_CAPTURE_KEY:
+            self.memory_capture.arm()
+            return True
+        return False
+
+    def export_trace(self) -> Optional[Path]:
+        """Write the profiler's recent frames as a Chrome trace into the logs dir."""
+        if not self.profiler.frames:
+            log.warning("No frames profiled yet (F3 or GAME_PROFILER=True)")
+            return None
+        name = time.strftime("trace-%Y%m%d-%H%M%S.json")
+        return self.profiler.export_chrome_trace(
+            Path(GameConfig.logging.logs_dir) / name
+        )
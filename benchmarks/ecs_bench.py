@@ -0,0 +1,189 @@
+"""
+Headless ECS micro-benchmarks.
+
+Populates Worlds with a synthetic mix of Position, LabelComponent,
+ButtonComponent, AlphaComponent and SoundComponent at several scales and
+times the per-frame entry points of the systems under the SDL dummy video
+driver:
+
+* RenderSystem.update
+* AnimationSystem.update (every alpha fading)
+* InputSystem.handle_mouse_motion
+* SoundSystem.update
+* BaseScene._handle_fade_out
+
+Results are written as JSON (median/min/max seconds per call for every
+benchmark and size) so runs can be compared between releases.  Rendering
+dominates the run time: at 1M entities a single RenderSystem.update takes
+about a minute, so use --sizes/--repeat for quick runs.
+
+Usage:
+    python -m benchmarks.ecs_bench [--sizes 10000,100000,1000000]
+                                   [--repeat 5] [--columnar]
+                                   [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+
+def build_world(count: int, columnar: bool = False):
+    """Build a World of ``count`` synthetic UI entities."""
+    from engine.components import (
+        AlphaComponent,
+        ButtonComponent,
+        LabelComponent,
+        Position,
+        SoundComponent,
+    )
+    from engine.ecs import GameObject
+    from engine.world import World
+
+    entities = []
+    for i in range(count):
+        e = GameObject()
+        e.add(Position(i % 640, i % 400))
+        if i % 2:
+            btn = ButtonComponent(f"B{i % 100}")
+            btn.width, btn.height = 80, 30
+            e.add(btn)
+        else:
+            e.add(LabelComponent(f"L{i % 100}"))
+        alpha = AlphaComponent(1.0)
+        # A quarter of the entities are mid-animation
+        if i % 4 == 0:
+            alpha.target_alpha = 0.5
+        e.add(alpha)
+        if i % 10 == 0:
+            e.add(SoundComponent("button_click"))
+        entities.append(e)
+    return World(entities, columnar=columnar)
+
+
+def time_calls(fn, repeat: int) -> dict:
+    """Call ``fn`` ``repeat`` times and summarize the wall times in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "repeat": repeat,
+    }
+
+
+def run_size(count: int, repeat: int, columnar: bool, screen, font) -> dict:
+    from engine.base_scene import BaseScene
+    from engine.components import AlphaComponent
+    from engine.systems import (
+        AnimationSystem,
+        InputSystem,
+        RenderSystem,
+        SoundSystem,
+    )
+
+    world = build_world(count, columnar)
+    render_system = RenderSystem(screen, font)
+    input_system = InputSystem()
+    sound_system = SoundSystem()
+    # Sound playback itself is not part of the benchmark
+    sound_system.enabled = False
+    animation_system = AnimationSystem()
+
+    # Warm up the query cache so every benchmark measures steady-state frames
+    render_system.update(world)
+
+    motion_points = [(100, 100), (320, 200), (600, 380)]
+    motion_index = [0]
+
+    def mouse_motion():
+        mx, my = motion_points[motion_index[0] % len(motion_points)]
+        motion_index[0] += 1
+        input_system.handle_mouse_motion(mx, my, world)
+
+    results = {
+        "render_update": time_calls(lambda: render_system.update(world), repeat),
+        "input_mouse_motion": time_calls(mouse_motion, repeat),
+        "sound_update": time_calls(lambda: sound_system.update(world), repeat),
+    }
+
+    # Every entity fades out, so each frame steps every alpha
+    for _, alpha in world.query(AlphaComponent):
+        alpha.target_alpha = 0.0
+    results["animation_update"] = time_calls(
+        lambda: animation_system.update(world, 0.001), repeat
+    )
+
+    # Worst case for the "all faded?" check: only the last entity is still
+    # visible, so every frame scans the whole World
+    scene = BaseScene(None)
+    scene.entities = world
+    scene.start_fade_out()
+    alphas = [alpha for _, alpha in world.query(AlphaComponent)]
+    for alpha in alphas:
+        alpha.alpha = 0.0
+    alphas[-1].alpha = 1.0
+    results["fade_out_check"] = time_calls(
+        lambda: scene._handle_fade_out(0.016), repeat
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--columnar", action="store_true")
+    parser.add_argument("--output", help="JSON file to write (default: stdout)")
+    args = parser.parse_args()
+
+    import logging
+
+    from utils import load_font_with_fallback
+
+    logging.disable(logging.CRITICAL)
+    pygame.init()
+    pygame.display.set_mode((640, 400))
+    screen = pygame.Surface((640, 400))
+    font = load_font_with_fallback(24)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "columnar": args.columnar,
+        },
+        "sizes": {},
+    }
+    for size in (int(s) for s in args.sizes.split(",")):
+        print(f"running {size} entities...", file=sys.stderr)
+        results["sizes"][str(size)] = run_size(
+            size, args.repeat, args.columnar, screen, font
+        )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
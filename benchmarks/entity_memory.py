@@ -0,0 +1,81 @@
+"""
+Memory benchmark for ECS entities.
+
+Builds N entities with a typical UI component mix (Position, Label or Button,
+Alpha) and reports the traced memory per entity plus the time of a
+render-like attribute access loop.
+
+Usage:
+    python -m benchmarks.entity_memory [--count 100000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from engine.components import (
+    AlphaComponent,
+    ButtonComponent,
+    LabelComponent,
+    Position,
+)
+from engine.ecs import GameObject
+
+
+def build_entities(count: int) -> list:
+    entities = []
+    for i in range(count):
+        e = GameObject()
+        e.add(Position(i % 640, i % 400))
+        if i % 2:
+            e.add(ButtonComponent(f"Button {i}"))
+        else:
+            e.add(LabelComponent(f"Label {i}"))
+        e.add(AlphaComponent(1.0))
+        entities.append(e)
+    return entities
+
+
+def measure_memory(count: int) -> int:
+    """Return the bytes allocated while building ``count`` entities."""
+    gc.collect()
+    tracemalloc.start()
+    entities = build_entities(count)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return allocated
+
+
+def measure_access(count: int, rounds: int = 5) -> float:
+    """Return seconds per pass of a render/input-like attribute access loop."""
+    entities = build_entities(count)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for e in entities:
+            comps = e.components
+            pos = comps[Position]
+            alpha = comps[AlphaComponent]
+            _ = pos.x + pos.y + alpha.alpha
+            btn = comps.get(ButtonComponent)
+            if btn is not None and btn.hover:
+                btn.hover = False
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    allocated = measure_memory(args.count)
+    access = measure_access(args.count)
+    print(f"entities:          {args.count}")
+    print(f"total allocated:   {allocated / 1024 / 1024:.1f} MiB")
+    print(f"bytes per entity:  {allocated / args.count:.0f}")
+    print(f"access pass:       {access * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Scene-enter latency benchmark.
+
+Creates the real GameApp under the SDL dummy drivers and measures how long
+``scene.enter()`` plus the first ``RenderSystem.update`` take for the menu
+and game scenes (the first frame is where lazily loaded images used to be
+resolved).
+
+Usage:
+    python -m benchmarks.scene_enter [--rounds 200]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def measure(app, scene_cls, rounds: int) -> tuple:
+    """Return per-round seconds of enter() and of the first render of ``scene_cls``."""
+    enter_times, frame_times = [], []
+    for _ in range(rounds):
+        scene = scene_cls(app)
+        start = time.perf_counter()
+        scene.enter()
+        entered = time.perf_counter()
+        app.render_system.update(scene.entities)
+        enter_times.append(entered - start)
+        frame_times.append(time.perf_counter() - entered)
+        scene.exit()
+    return enter_times, frame_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    from app import GameApp
+    from game.scenes.game import GameScene
+    from game.scenes.menu import MenuScene
+
+    app = GameApp()
+    # Scenes log on every enter/exit (and complain about missing services)
+    logging.disable(logging.CRITICAL)
+    for scene_cls in (MenuScene, GameScene):
+        enter_times, frame_times = measure(app, scene_cls, args.rounds)
+        print(
+            f"{scene_cls.__name__:<10}"
+            f" enter {statistics.median(enter_times) * 1000:.3f} ms"
+            f"  first frame {statistics.median(frame_times) * 1000:.3f} ms"
+            " (medians)"
+        )
+
+
+if __name__ == "__main__":
+    main()
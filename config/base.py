@@ -47,6 +47,9 @@ class ColorConfig(BaseModel):
 
     active_button_text_color: Tuple[int, int, int] = (0, 0, 0)
     progress_bar_border_color: Tuple[int, int, int] = (255, 255, 255)
+    # Modal overlay panel (dialogs, results)
+    modal_panel_color: Tuple[int, int, int] = (45, 45, 55)
+    modal_border_color: Tuple[int, int, int] = (90, 90, 110)
 
     # Colors for top score highlights
     top_score_1_color: Tuple[int, int, int] = (
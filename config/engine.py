@@ -0,0 +1,58 @@
+"""Engine configuration models using Pydantic."""
+
+from pydantic import BaseModel, field_validator
+
+
+class EngineConfig(BaseModel):
+    """Configuration for ECS engine internals."""
+
+    # Keep Position/AlphaComponent data in NumPy columns (requires numpy)
+    columnar_storage: bool = False
+    # Threads used to run independent systems of a frame in parallel (0/1 = no pool)
+    scheduler_workers: int = 0
+    # Max free entities (and components per type) kept for reuse (0 = no pooling)
+    entity_pool_size: int = 256
+    # Redraw and present only changed screen regions instead of every frame
+    dirty_rects: bool = False
+    # Block on input events while nothing animates instead of running at full FPS
+    idle_wait: bool = False
+    # Longest idle wait in ms before an (empty) frame runs anyway (0 = no limit)
+    idle_wait_timeout_ms: int = 250
+
+    # Simulation ticks per second (0 = one variable-length update per frame)
+    fixed_tick_rate: int = 0
+    # Most ticks run in one frame; a longer backlog is dropped, not caught up
+    max_fixed_steps: int = 5
+    # No window or audio device (SDL dummy drivers), uncapped simulated frames
+    headless: bool = False
+    # JSON file of input events to inject (see engine.input_script)
+    input_script: str = ""
+    # Time every frame phase from the start (F3 shows them, F4 writes a trace)
+    profiler: bool = False
+    # cProfile the first `cpu_capture_frames` frames (F5 captures on demand)
+    cpu_capture: bool = False
+    # Frames in one cProfile capture
+    cpu_capture_frames: int = 300
+    # tracemalloc diff of the first scene change (F6 arms the next one)
+    memory_capture: bool = False
+    # Functions/lines logged per capture (full results go to the logs directory)
+    capture_top: int = 20
+
+    @field_validator(
+        "scheduler_workers",
+        "entity_pool_size",
+        "idle_wait_timeout_ms",
+        "fixed_tick_rate",
+    )
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Value must not be negative")
+        return v
+
+    @field_validator("max_fixed_steps", "cpu_capture_frames", "capture_top")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
@@ -3,6 +3,7 @@
 from pydantic import BaseModel
 
 from .base import ColorConfig, WindowConfig, DifficultyConfig
+from .engine import EngineConfig
 from .logging import LoggingConfig
 from .stats import StatsConfig
 from .ui import UIConfig
@@ -17,6 +18,7 @@ class GameConfig(BaseModel):
     stats: StatsConfig = StatsConfig()
     ui: UIConfig = UIConfig()
     logging: LoggingConfig = LoggingConfig()
+    engine: EngineConfig = EngineConfig()
 
     @property
     def WINDOW_WIDTH(self) -> int:
@@ -181,6 +183,14 @@ class GameConfig(BaseModel):
     def PROGRESS_BAR_BORDER_COLOR(self) -> tuple:
         return self.colors.progress_bar_border_color
 
+    @property
+    def MODAL_PANEL_COLOR(self) -> tuple:
+        return self.colors.modal_panel_color
+
+    @property
+    def MODAL_BORDER_COLOR(self) -> tuple:
+        return self.colors.modal_border_color
+
     @property
     def TOP_SCORE_1_COLOR(self) -> tuple:
         return self.colors.top_score_1_color
@@ -227,6 +237,10 @@ class GameConfig(BaseModel):
     def PROGRESS_BAR_BORDER_RADIUS(self) -> int:
         return self.ui.progress_bar_border_radius
 
+    @property
+    def TEXT_CACHE_MAX_BYTES(self) -> int:
+        return self.ui.text_cache_max_bytes
+
     @property
     def INPUT_FIELD_WIDTH(self) -> int:
         return self.ui.input_field_width
@@ -265,3 +279,64 @@ class GameConfig(BaseModel):
     @property
     def STATS_MAX_TOP_ATTEMPTS(self) -> int:
         return self.stats.max_top_attempts
+
+    # Engine configuration
+    @property
+    def ECS_COLUMNAR_STORAGE(self) -> bool:
+        return self.engine.columnar_storage
+
+    @property
+    def SCHEDULER_WORKERS(self) -> int:
+        return self.engine.scheduler_workers
+
+    @property
+    def ENTITY_POOL_SIZE(self) -> int:
+        return self.engine.entity_pool_size
+
+    @property
+    def DIRTY_RECTS(self) -> bool:
+        return self.engine.dirty_rects
+
+    @property
+    def IDLE_WAIT(self) -> bool:
+        return self.engine.idle_wait
+
+    @property
+    def IDLE_WAIT_TIMEOUT_MS(self) -> int:
+        return self.engine.idle_wait_timeout_ms
+
+    @property
+    def FIXED_TICK_RATE(self) -> int:
+        return self.engine.fixed_tick_rate
+
+    @property
+    def MAX_FIXED_STEPS(self) -> int:
+        return self.engine.max_fixed_steps
+
+    @property
+    def HEADLESS(self) -> bool:
+        return self.engine.headless
+
+    @property
+    def INPUT_SCRIPT(self) -> str:
+        return self.engine.input_script
+
+    @property
+    def PROFILER(self) -> bool:
+        return self.engine.profiler
+
+    @property
+    def CPU_CAPTURE(self) -> bool:
+        return self.engine.cpu_capture
+
+    @property
+    def CPU_CAPTURE_FRAMES(self) -> int:
+        return self.engine.cpu_capture_frames
+
+    @property
+    def MEMORY_CAPTURE(self) -> bool:
+        return self.engine.memory_capture
+
+    @property
+    def CAPTURE_TOP(self) -> int:
+        return self.engine.capture_top
@@ -32,6 +32,24 @@ class Settings(BaseSettings):
 
     # UI settings
     scene_max_win_top_scores: Optional[int] = None
+    text_cache_max_bytes: Optional[int] = None
+
+    # Engine settings
+    columnar_storage: Optional[bool] = None
+    scheduler_workers: Optional[int] = None
+    entity_pool_size: Optional[int] = None
+    dirty_rects: Optional[bool] = None
+    idle_wait: Optional[bool] = None
+    idle_wait_timeout_ms: Optional[int] = None
+    fixed_tick_rate: Optional[int] = None
+    max_fixed_steps: Optional[int] = None
+    headless: Optional[bool] = None
+    input_script: Optional[str] = None
+    profiler: Optional[bool] = None
+    cpu_capture: Optional[bool] = None
+    cpu_capture_frames: Optional[int] = None
+    memory_capture: Optional[bool] = None
+    capture_top: Optional[int] = None
 
     def get_config(self) -> GameConfig:
         """Get the game configuration, potentially modified by environment variables."""
@@ -58,6 +76,38 @@ class Settings(BaseSettings):
             config.stats.max_top_attempts = self.stats_max_top_attempts
         if self.scene_max_win_top_scores is not None:
             config.ui.scene_max_win_top_scores = self.scene_max_win_top_scores
+        if self.text_cache_max_bytes is not None:
+            config.ui.text_cache_max_bytes = self.text_cache_max_bytes
+        if self.columnar_storage is not None:
+            config.engine.columnar_storage = self.columnar_storage
+        if self.scheduler_workers is not None:
+            config.engine.scheduler_workers = self.scheduler_workers
+        if self.entity_pool_size is not None:
+            config.engine.entity_pool_size = self.entity_pool_size
+        if self.dirty_rects is not None:
+            config.engine.dirty_rects = self.dirty_rects
+        if self.idle_wait is not None:
+            config.engine.idle_wait = self.idle_wait
+        if self.idle_wait_timeout_ms is not None:
+            config.engine.idle_wait_timeout_ms = self.idle_wait_timeout_ms
+        if self.fixed_tick_rate is not None:
+            config.engine.fixed_tick_rate = self.fixed_tick_rate
+        if self.max_fixed_steps is not None:
+            config.engine.max_fixed_steps = self.max_fixed_steps
+        if self.headless is not None:
+            config.engine.headless = self.headless
+        if self.input_script is not None:
+            config.engine.input_script = self.input_script
+        if self.profiler is not None:
+            config.engine.profiler = self.profiler
+        if self.cpu_capture is not None:
+            config.engine.cpu_capture = self.cpu_capture
+        if self.cpu_capture_frames is not None:
+            config.engine.cpu_capture_frames = self.cpu_capture_frames
+        if self.memory_capture is not None:
+            config.engine.memory_capture = self.memory_capture
+        if self.capture_top is not None:
+            config.engine.capture_top = self.capture_top
 
         return config
 
@@ -49,6 +49,9 @@ class UIConfig(BaseModel):
     input_mouse_detection_width: int = 120
     input_mouse_detection_height: int = 20
 
+    # Memory budget (bytes) for pre-rendered text surfaces kept by the RenderSystem
+    text_cache_max_bytes: int = 4 * 1024 * 1024
+
     @field_validator(
         "default_font_size",
         "h1_font_size",
@@ -59,6 +62,7 @@ class UIConfig(BaseModel):
         "progress_bar_border_radius",
         "input_field_default_max_length",
         "scene_max_history_entries",
+        "text_cache_max_bytes",
     )
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
@@ -1,5 +1,7 @@
 __all__ = [
     "GameObject",
+    "EntityPool",
+    "World",
     "Position",
     "LabelComponent",
     "H1Component",
@@ -11,14 +13,38 @@ __all__ = [
     "AlphaComponent",
     "ImageComponent",
     "SoundComponent",
+    "HierarchyComponent",
+    "LayerComponent",
+    "OverlayComponent",
+    "TweenComponent",
+    "attach",
+    "detach",
+    "tween",
+    "cancel_tweens",
+    "EASINGS",
     "EventBus",
     "ServiceLocator",
     "AssetLoader",
+    "DrawList",
+    "LAYER_DEFAULT",
+    "LAYER_MODAL",
+    "FontRegistry",
+    "FontTask",
+    "FixedTimestep",
+    "FrameProfiler",
+    "ProfilerOverlay",
+    "CpuCapture",
+    "MemoryCapture",
+    "StateInterpolator",
+    "AnimationSystem",
     "RenderSystem",
     "InputSystem",
+    "InputScript",
     "SoundSystem",
+    "TransformSystem",
     "BaseScene",
     "SceneManager",
+    "Scheduler",
     "UIBuilder",
 ]
 
@@ -29,17 +55,39 @@ from .components import (
     H1Component,
     H2Component,
     H3Component,
+    HierarchyComponent,
     ImageComponent,
     InputFieldComponent,
     LabelComponent,
+    LayerComponent,
+    OverlayComponent,
     Position,
     ProgressBarComponent,
     SoundComponent,
+    TweenComponent,
 )
-from .asset_loader import AssetLoader
+from .asset_loader import AssetLoader, FontTask
+from .draw_list import LAYER_DEFAULT, LAYER_MODAL, DrawList
+from .easing import EASINGS
 from .ecs import GameObject
 from .event_bus import EventBus
+from .fonts import FontRegistry
+from .hierarchy import attach, detach
+from .input_script import InputScript
+from .pool import EntityPool
+from .profiler import FrameProfiler, ProfilerOverlay
+from .capture import CpuCapture, MemoryCapture
 from .scene_manager import SceneManager
+from .scheduler import Scheduler
 from .service_locator import ServiceLocator
-from .systems import InputSystem, RenderSystem, SoundSystem
+from .systems import (
+    AnimationSystem,
+    InputSystem,
+    RenderSystem,
+    SoundSystem,
+    TransformSystem,
+)
+from .timestep import FixedTimestep, StateInterpolator
+from .tweens import cancel_tweens, tween
 from .ui_builder import UIBuilder
+from .world import World
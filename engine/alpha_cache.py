@@ -0,0 +1,84 @@
+"""Cache of alpha-modulated surface variants for fades."""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+from pygame.surface import Surface
+
+from logger import get_logger
+
+log = get_logger("engine/alpha_cache")
+
+
+class AlphaVariantCache:
+    """
+    Hands out translucent versions of surfaces without allocating per frame.
+
+    Alpha is quantized into ``buckets`` steps, so a fade only ever produces
+    ``buckets`` different variants of a surface.
+
+    * Surfaces without per-pixel alpha get one copy per bucket with its
+      surface alpha set via ``set_alpha`` (the shared source is never
+      modified).
+    * Per-pixel alpha surfaces (e.g. antialiased text) get one
+      ``BLEND_RGBA_MULT``-modulated copy per bucket.
+
+    Both kinds share one LRU of ``max_entries`` variants.  Each variant
+    keeps its alpha, so draws deferred to the end of the frame still come
+    out at the alpha they were queued with.
+
+    Sources are used as dict keys, so they should be long-lived surfaces
+    (cached text, loaded images) rather than per-frame temporaries.
+    """
+
+    def __init__(self, buckets: int = 32, max_entries: int = 512):
+        self.buckets = buckets
+        self.max_entries = max_entries
+        self._variants: "OrderedDict[Tuple[Surface, int], Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize(self, alpha: float) -> int:
+        """Map ``alpha`` (0.0-1.0) to its 0-255 bucket value."""
+        step = round(max(0.0, min(alpha, 1.0)) * self.buckets)
+        return int(255 * step / self.buckets)
+
+    def get(self, surface: Surface, alpha: float) -> Surface:
+        """Get ``surface`` at ``alpha``, reusing a cached variant when possible."""
+        if alpha >= 1.0:
+            return surface
+        value = self.quantize(alpha)
+
+        key = (surface, value)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return variant
+
+        self.misses += 1
+        variant = surface.copy()
+        if surface.get_flags() & pygame.SRCALPHA:
+            variant.fill((255, 255, 255, value), special_flags=pygame.BLEND_RGBA_MULT)
+        else:
+            variant.set_alpha(value)
+        self._variants[key] = variant
+        if len(self._variants) > self.max_entries:
+            self._variants.popitem(last=False)
+            self.evictions += 1
+        return variant
+
+    def clear(self):
+        """Drop every cached variant (counters are kept)."""
+        self._variants.clear()
+
+    def stats(self) -> dict:
+        """Get the hit/miss/eviction counters and the number of cached variants."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "variants": len(self._variants),
+        }
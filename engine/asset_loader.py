@@ -1,10 +1,13 @@
 """Asset loading system for the ECS framework."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, List
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List
 
 from logger import get_logger
 
+if TYPE_CHECKING:
+    from .fonts import FontRegistry
+
 log = get_logger("engine/asset_loader")
 
 
@@ -31,6 +34,26 @@ class SimpleTask(LoadingTask):
         return self.function()
 
 
+class FontTask(LoadingTask):
+    """A task that preloads fonts into a FontRegistry"""
+
+    def __init__(
+        self, description: str, registry: "FontRegistry", specs: Iterable[tuple]
+    ):
+        """
+        Args:
+            registry: Registry the fonts are loaded into
+            specs: ``FontRegistry.get`` argument tuples, e.g. ``(18,)`` or ``(16, None, "bold")``
+        """
+        super().__init__(description)
+        self.registry = registry
+        self.specs = list(specs)
+
+    def execute(self) -> Any:
+        self.registry.preload(self.specs)
+        return self.registry
+
+
 class AssetLoader:
     """Handles loading assets with progress tracking and milestones"""
 
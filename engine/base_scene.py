@@ -1,6 +1,10 @@
 from pygame.event import Event
 
+from config import GameConfig
+from .commands import CommandBuffer
 from .ecs import GameObject
+from .service_locator import ServiceLocator
+from .world import World, query
 from logger import get_logger
 
 log = get_logger("engine/scenes")
@@ -9,11 +13,28 @@ log = get_logger("engine/scenes")
 class BaseScene:
     def __init__(self, app):
         self.app = app
-        self.entities: list[GameObject] = []
+        self.entities = []
         # Fade out variables
         self._fading_out = False
         self._fade_out_complete_callback = None
 
+    @property
+    def entities(self) -> World:
+        """The scene's entities, kept in a World for cached component queries"""
+        return self._entities
+
+    @entities.setter
+    def entities(self, value: list[GameObject]):
+        # Scenes assign plain lists in enter(); wrap them so systems can query
+        if not isinstance(value, World):
+            value = World(value, columnar=GameConfig.ECS_COLUMNAR_STORAGE)
+        self._entities = value
+
+    @property
+    def commands(self) -> CommandBuffer:
+        """Structural changes applied to the scene's World at the next sync point"""
+        return self._entities.commands
+
     def enter(self):
         """Called when the scene is entered"""
         pass
@@ -23,9 +44,36 @@ class BaseScene:
         # Handle fade out if needed
         self._handle_fade_out(delta_time)
 
+    def is_busy(self) -> bool:
+        """
+        Whether update() has work to do even without input or animation.
+
+        The app's idle mode keeps running frames at full rate while this is
+        True; override it in scenes that work in the background (loading).
+        """
+        return False
+
     def exit(self):
         """Called when the scene is exited"""
-        pass
+        self.release_entities()
+
+    def release_entities(self):
+        """Hand the scene's entities back to the entity pool (if the app provides one)"""
+        pool = ServiceLocator.get("entity_pool")
+        if pool is None:
+            return
+        entities = list(self.entities)
+        self.entities.clear()
+
+        # Don't keep typing into an input component that is about to be reused
+        input_system = getattr(self.app, "input_system", None)
+        focused = getattr(input_system, "focused_input", None)
+        if focused is not None and any(
+            c is focused for e in entities for c in e.components.values()
+        ):
+            input_system.set_focus(None)
+
+        pool.release_all(entities)
 
     def handle_event(self, event: Event):
         """Handle events like key presses, mouse clicks, etc."""
@@ -54,10 +102,13 @@ class BaseScene:
         self._target_scene = target_scene
         self._fade_out_complete_callback = on_complete_callback
 
-        for entity in self.entities:
-            alpha_comp = entity.get(AlphaComponent)
-            if alpha_comp:
-                alpha_comp.target_alpha = 0.0  # Fade to transparent
+        columns = self.entities.columns
+        if columns is not None:
+            columns.set_target_alpha(0.0)  # Fade everything in one operation
+            return
+
+        for _, alpha_comp in query(self.entities, AlphaComponent):
+            alpha_comp.target_alpha = 0.0  # Fade to transparent
 
     def _handle_fade_out(self, delta_time: float):
         """Handle fade out logic - checks if fade out is complete and calls callback"""
@@ -68,10 +119,12 @@ class BaseScene:
         from .components import AlphaComponent
 
         # Check if all entities have faded out (current alpha is at or near target alpha of 0)
-        all_faded = True
-        for entity in self.entities:
-            alpha_comp = entity.get(AlphaComponent)
-            if alpha_comp:
+        columns = self.entities.columns
+        if columns is not None:
+            all_faded = columns.all_faded(0.01)
+        else:
+            all_faded = True
+            for _, alpha_comp in query(self.entities, AlphaComponent):
                 # Check if alpha is still above a very small threshold (close enough to 0)
                 if alpha_comp.alpha > 0.01:  # Still visible, not fully faded
                     all_faded = False
@@ -0,0 +1,91 @@
+"""Pre-rendered button backgrounds."""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import pygame
+from pygame.surface import Surface
+
+from utils import apply_alpha
+
+# How far the shadow sticks out below the button box
+SHADOW_OFFSET = 3
+# Opacity of the top edge of the highlight gradient
+HIGHLIGHT_MAX_ALPHA = 70
+
+SkinKey = Tuple[int, int, tuple, int, int]
+
+
+class ButtonSkinCache:
+    """
+    Rasterizes button skins (shadow, rounded box and highlight gradient) once.
+
+    A skin is keyed on (width, height, background color, border radius,
+    alpha).  The background color stands for the button state (normal,
+    hover, inactive); pressed buttons reuse the skin of their color and are
+    just blitted 2px lower.  Alpha should be quantized by the caller (e.g.
+    ``AlphaVariantCache.quantize``) so fades only produce a few skins.
+    The skin surface is ``SHADOW_OFFSET`` pixels taller than the box.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._skins: "OrderedDict[SkinKey, Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, width: int, height: int, bg_color, radius: int, alpha: int = 255
+    ) -> Surface:
+        """Get the skin for a ``width`` x ``height`` box; ``alpha`` is 0-255."""
+        key = (width, height, tuple(bg_color), radius, alpha)
+        skin = self._skins.get(key)
+        if skin is not None:
+            self._skins.move_to_end(key)
+            self.hits += 1
+            return skin
+
+        self.misses += 1
+        skin = self._build(width, height, tuple(bg_color), radius, alpha)
+        self._skins[key] = skin
+        if len(self._skins) > self.max_entries:
+            self._skins.popitem(last=False)
+        return skin
+
+    @staticmethod
+    def _build(width: int, height: int, bg_color: tuple, radius: int, alpha: int):
+        shadow_color = tuple(max(c - 40, 0) for c in bg_color)
+        if alpha < 255:
+            # Fading buttons darken like the rest of the UI
+            bg_color = apply_alpha(bg_color, alpha / 255)
+            shadow_color = apply_alpha(shadow_color, alpha / 255)
+
+        skin = pygame.Surface((width, height + SHADOW_OFFSET), pygame.SRCALPHA)
+        box = pygame.Rect(0, 0, width, height)
+
+        # Shadow under the button (a bit lower)
+        pygame.draw.rect(
+            skin, shadow_color, box.move(0, SHADOW_OFFSET), border_radius=radius
+        )
+        # Main button box
+        pygame.draw.rect(skin, bg_color, box, border_radius=radius)
+
+        # Soft gradient highlight over the top half of the button
+        highlight_height = max(4, height // 2)
+        highlight_surf = pygame.Surface((width - 4, highlight_height), pygame.SRCALPHA)
+        for y in range(highlight_height):
+            t = y / highlight_height  # 0..1
+            a = int(HIGHLIGHT_MAX_ALPHA * (1.0 - t))  # from max alpha to 0
+            pygame.draw.line(
+                highlight_surf, (255, 255, 255, a), (0, y), (width - 4, y)
+            )
+        skin.blit(highlight_surf, (2, 2))
+        return skin
+
+    def clear(self):
+        """Drop every cached skin."""
+        self._skins.clear()
+
+    def stats(self) -> dict:
+        """Get the hit/miss counters and the number of cached skins."""
+        return {"hits": self.hits, "misses": self.misses, "skins": len(self._skins)}
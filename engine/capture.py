@@ -0,0 +1,178 @@
+"""On-demand cProfile and tracemalloc captures written to the logs directory."""
+
+import cProfile
+import gc
+import io
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+from logger import get_logger
+
+log = get_logger("engine/capture")
+
+
+def _capture_path(logs_dir, prefix: str, suffix: str) -> Path:
+    """Timestamped file name in ``logs_dir`` that no earlier capture used."""
+    logs_dir = Path(logs_dir)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    stem = time.strftime(f"{prefix}-%Y%m%d-%H%M%S")
+    path = logs_dir / f"{stem}{suffix}"
+    n = 1
+    while path.exists():
+        n += 1
+        path = logs_dir / f"{stem}-{n}{suffix}"
+    return path
+
+
+class CpuCapture:
+    """
+    Runs the next ``frames`` frames under ``cProfile``.
+
+    ``request()`` schedules a capture; it starts at the next
+    ``begin_frame()`` and ends after that many ``end_frame()`` calls.  The
+    stats are written as ``cpu-<time>.prof`` (``python -m pstats``,
+    snakeviz) and the ``top`` functions by cumulative time are logged.
+
+    Only the main thread is profiled; systems run by scheduler workers show
+    up as time spent waiting for them.
+    """
+
+    def __init__(self, logs_dir, top: int = 20):
+        self.logs_dir = logs_dir
+        self.top = top
+        self._requested = 0
+        self.remaining = 0
+        self._profile: Optional[cProfile.Profile] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether a capture is running or about to start."""
+        return self._profile is not None or self._requested > 0
+
+    def request(self, frames: int) -> bool:
+        """Capture the next ``frames`` frames; False if one is already running."""
+        if self.active:
+            log.warning("CPU capture already running")
+            return False
+        self._requested = max(1, frames)
+        log.info(f"CPU capture of the next {self._requested} frames requested")
+        return True
+
+    def begin_frame(self):
+        """Call at the start of every frame."""
+        if not self._requested:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler (debugger, coverage, ...) is already attached
+            log.warning(f"CPU capture not started: {e}")
+            self._requested = 0
+            return
+        self._profile = profile
+        self.remaining = self._requested
+        self._requested = 0
+
+    def end_frame(self) -> Optional[Path]:
+        """Call at the end of every frame; returns the stats file once written."""
+        if self._profile is None:
+            return None
+        self.remaining -= 1
+        if self.remaining > 0:
+            return None
+        profile, self._profile = self._profile, None
+        profile.disable()
+
+        path = _capture_path(self.logs_dir, "cpu", ".prof")
+        profile.dump_stats(path)
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        log.info(f"CPU capture written: {path}\n{summary.getvalue()}")
+        return path
+
+
+class MemoryCapture:
+    """
+    Compares ``tracemalloc`` snapshots taken before and after a scene change.
+
+    ``arm()`` starts tracing; the next scene change takes the "before"
+    snapshot and the end of the frame it happened in the "after" one, once
+    the old scene's update has returned and garbage was collected.  The
+    differences by source line are written to ``memory-<time>.txt`` and
+    the ``top`` ones are logged.  Tracing stops again afterwards (unless it
+    was already on, e.g. with ``PYTHONTRACEMALLOC``).
+
+    Only memory allocated while tracing shows up, so arm the capture a
+    little before the change to look at.
+    """
+
+    def __init__(self, logs_dir, top: int = 20):
+        self.logs_dir = logs_dir
+        self.top = top
+        self.armed = False
+        self._started_tracing = False
+        self._before: Optional[tracemalloc.Snapshot] = None
+        self._scenes = ""
+        self._changed = False
+
+    def arm(self) -> bool:
+        """Capture the next scene change; False if already armed."""
+        if self.armed:
+            log.warning("Memory capture already armed")
+            return False
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.armed = True
+        log.info("Memory capture armed for the next scene change")
+        return True
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        gc.collect()
+        return tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+
+    def before_change(self, old_scene, new_scene):
+        """SceneManager hook: snapshot before the old scene exits."""
+        if self.armed and self._before is None:
+            self._before = self._snapshot()
+            old_name = type(old_scene).__name__ if old_scene else "None"
+            self._scenes = f"{old_name} -> {type(new_scene).__name__}"
+
+    def after_change(self, old_scene, new_scene):
+        """SceneManager hook: snapshot at the end of this frame."""
+        if self._before is not None:
+            self._changed = True
+
+    def end_frame(self) -> Optional[Path]:
+        """Call at the end of every frame; returns the report once written."""
+        if not self._changed:
+            return None
+        diffs = self._snapshot().compare_to(self._before, "lineno")
+        diffs = [diff for diff in diffs if diff.size_diff]
+        self._before = None
+        self._changed = False
+        self.armed = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        total = sum(diff.size_diff for diff in diffs)
+        header = f"Memory over scene change {self._scenes}: {total / 1024:+.1f} KiB"
+        path = _capture_path(self.logs_dir, "memory", ".txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(header + "\n")
+            f.writelines(f"{diff}\n" for diff in diffs)
+        top = "\n".join(str(diff) for diff in diffs[: self.top])
+        log.info(f"Memory capture written: {path}\n{header}\n{top}")
+        return path
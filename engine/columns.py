@@ -0,0 +1,198 @@
+"""Structure-of-arrays storage for Position and AlphaComponent data."""
+
+from typing import Dict
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from .components import AlphaComponent, Position
+from .ecs import GameObject
+
+
+def _column(name: str) -> property:
+    """Property that reads/writes one row of a ColumnStore array."""
+
+    def fget(self):
+        return getattr(self._store, name).item(self._row)
+
+    def fset(self, value):
+        getattr(self._store, name)[self._row] = value
+
+    return property(fget, fset)
+
+
+class PositionView(Position):
+    """Position whose x/y live in a ColumnStore row."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ColumnStore", row: int):
+        self._store = store
+        self._row = row
+
+    x = _column("x")
+    y = _column("y")
+
+
+class AlphaView(AlphaComponent):
+    """AlphaComponent whose values live in a ColumnStore row."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ColumnStore", row: int):
+        self._store = store
+        self._row = row
+
+    alpha = _column("alpha")
+    target_alpha = _column("target_alpha")
+    animation_speed = _column("animation_speed")
+
+
+class ColumnStore:
+    """
+    Keeps x/y/alpha/target_alpha/animation_speed of a World's entities in
+    contiguous NumPy arrays (one row per entity), so alpha animation and the
+    "all faded" check run as single vectorized operations.
+
+    Entities keep ordinary-looking Position/AlphaComponent objects - they are
+    swapped for views into the arrays when the entity joins the World.
+    """
+
+    FIELDS = ("x", "y", "alpha", "target_alpha", "animation_speed")
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise RuntimeError(
+                "Columnar storage requires numpy - install it or disable "
+                "GAME_COLUMNAR_STORAGE"
+            )
+        self.capacity = capacity
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        # Rows whose entity has an AlphaComponent
+        self.has_alpha = np.zeros(capacity, dtype=bool)
+        self.size = 0  # High-water mark of used rows
+        self._free: list[int] = []
+        self._rows: Dict[GameObject, int] = {}
+        # Row -> AlphaView, used to stamp change ticks after bulk updates
+        self._alpha_views: Dict[int, AlphaView] = {}
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self.size == self.capacity:
+            self._grow()
+        row = self.size
+        self.size += 1
+        return row
+
+    def _grow(self):
+        new_capacity = self.capacity * 2
+        for name in self.FIELDS + ("has_alpha",):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[: self.capacity] = old
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    def adopt(self, e: GameObject):
+        """Move the entity's Position/AlphaComponent data into the arrays."""
+        pos = e.components.get(Position)
+        alpha = e.components.get(AlphaComponent)
+        row = self._rows.get(e)
+        if row is None:
+            if pos is None and alpha is None:
+                return
+            row = self._allocate()
+            self._rows[e] = row
+
+        if pos is not None and not isinstance(pos, PositionView):
+            self.x[row] = pos.x
+            self.y[row] = pos.y
+            view = PositionView(self, row)
+            view.touch()
+            e.components[Position] = view
+
+        if alpha is None:
+            self._alpha_views.pop(row, None)
+            self.has_alpha[row] = False
+            self.animation_speed[row] = 0.0
+        elif not isinstance(alpha, AlphaView):
+            self.alpha[row] = alpha.alpha
+            self.target_alpha[row] = alpha.target_alpha
+            self.animation_speed[row] = alpha.animation_speed
+            self.has_alpha[row] = True
+            view = AlphaView(self, row)
+            view.touch()
+            self._alpha_views[row] = view
+            e.components[AlphaComponent] = view
+
+    def release(self, e: GameObject):
+        """Copy the entity's data back into plain components and free its row."""
+        row = self._rows.pop(e, None)
+        if row is None:
+            return
+
+        pos = e.components.get(Position)
+        if isinstance(pos, PositionView):
+            plain_pos = Position(pos.x, pos.y)
+            plain_pos.touch()
+            e.components[Position] = plain_pos
+
+        alpha = e.components.get(AlphaComponent)
+        if isinstance(alpha, AlphaView):
+            plain = AlphaComponent(alpha.alpha)
+            plain.target_alpha = alpha.target_alpha
+            plain.animation_speed = alpha.animation_speed
+            plain.touch()
+            e.components[AlphaComponent] = plain
+
+        self._alpha_views.pop(row, None)
+        self.has_alpha[row] = False
+        self.animation_speed[row] = 0.0
+        self._free.append(row)
+
+    def step_alpha(self, dt: float):
+        """Move every alpha towards its target by animation_speed * dt."""
+        n = self.size
+        alpha = self.alpha[:n]
+        diff = self.target_alpha[:n] - alpha
+        step = self.animation_speed[:n] * dt
+        # Snap to the target when it is within one step, like min()/max() did
+        new = np.where(
+            np.abs(diff) <= step,
+            self.target_alpha[:n],
+            alpha + np.sign(diff) * step,
+        )
+        self._touch_rows(new != alpha)
+        np.copyto(alpha, new)
+
+    def animating(self) -> bool:
+        """Check whether any AlphaComponent has not reached its target yet."""
+        n = self.size
+        return bool(
+            np.any(self.has_alpha[:n] & (self.alpha[:n] != self.target_alpha[:n]))
+        )
+
+    def set_target_alpha(self, value: float):
+        """Set target_alpha for every entity that has an AlphaComponent."""
+        n = self.size
+        target = self.target_alpha[:n]
+        mask = self.has_alpha[:n]
+        self._touch_rows(mask & (target != value))
+        target[mask] = value
+
+    def _touch_rows(self, mask):
+        """Stamp change ticks on the AlphaViews of the rows set in ``mask``."""
+        views = self._alpha_views
+        for row in np.flatnonzero(mask):
+            view = views.get(int(row))
+            if view is not None:
+                view.touch()
+
+    def all_faded(self, threshold: float = 0.01) -> bool:
+        """Check whether every AlphaComponent is at or below the threshold."""
+        n = self.size
+        return not np.any(self.has_alpha[:n] & (self.alpha[:n] > threshold))
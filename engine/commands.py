@@ -0,0 +1,103 @@
+"""Deferred structural changes for a World."""
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+from .components.base import Component
+from .ecs import GameObject
+
+if TYPE_CHECKING:
+    from .world import World
+
+SPAWN = "spawn"
+DESPAWN = "despawn"
+ADD_COMPONENT = "add_component"
+REMOVE_COMPONENT = "remove_component"
+CALL = "call"
+
+# Component additions and removals are applied together as one run
+_GROUPS = {ADD_COMPONENT: "components", REMOVE_COMPONENT: "components"}
+
+
+class CommandBuffer:
+    """
+    Records spawn / despawn / add-component / remove-component operations so
+    they can be applied in one batch at a sync point, instead of changing the
+    World while a system is still iterating a query.
+
+    Commands are applied in the order they were recorded.  Consecutive
+    spawns are added with one ``extend``, consecutive despawns are removed in
+    a single pass, and consecutive component changes move each entity to its
+    new archetype only once.
+    """
+
+    def __init__(self):
+        self._commands: List[Tuple[str, GameObject, object]] = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def spawn(self, e: GameObject) -> GameObject:
+        """Add an entity to the World at the next sync point."""
+        self._commands.append((SPAWN, e, None))
+        return e
+
+    def despawn(self, e: GameObject):
+        """Remove an entity from the World at the next sync point."""
+        self._commands.append((DESPAWN, e, None))
+
+    def add_component(self, e: GameObject, component):
+        """Add (or replace) a component at the next sync point."""
+        self._commands.append((ADD_COMPONENT, e, component))
+
+    def remove_component(self, e: GameObject, component_type: type):
+        """Remove a component at the next sync point."""
+        self._commands.append((REMOVE_COMPONENT, e, component_type))
+
+    def call(self, callback: Callable[[], None]):
+        """Run an arbitrary callback at the next sync point (in order)."""
+        self._commands.append((CALL, None, callback))
+
+    def clear(self):
+        """Drop all recorded commands."""
+        self._commands.clear()
+
+    def apply(self, world: "World"):
+        """Apply and clear all recorded commands."""
+        # Commands recorded while applying (e.g. by callbacks) go to the next batch
+        commands, self._commands = self._commands, []
+
+        i = 0
+        while i < len(commands):
+            kind = commands[i][0]
+            group = _GROUPS.get(kind, kind)
+            j = i
+            while j < len(commands) and _GROUPS.get(commands[j][0], commands[j][0]) == group:
+                j += 1
+            run = commands[i:j]
+            if kind == SPAWN:
+                world.extend(e for _, e, _ in run)
+            elif kind == DESPAWN:
+                world.remove_many(e for _, e, _ in run)
+            elif kind == CALL:
+                for _, _, callback in run:
+                    callback()
+            else:
+                self._apply_component_changes(world, commands, i, j)
+            i = j
+
+    @staticmethod
+    def _apply_component_changes(world: "World", commands: list, start: int, end: int):
+        """Apply add/remove component commands[start:end] with one archetype move per entity."""
+        changed: Dict[GameObject, None] = {}
+        for kind, e, arg in commands[start:end]:
+            if kind == ADD_COMPONENT:
+                e.components[type(arg)] = arg
+                if isinstance(arg, Component):
+                    arg.touch()
+            else:
+                e.components.pop(arg, None)
+            changed[e] = None
+
+        for e in changed:
+            if e._world is world:
+                world._on_components_changed(e)
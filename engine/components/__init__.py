@@ -1,4 +1,7 @@
 __all__ = [
+    "Component",
+    "change_tick",
+    "changed_since",
     "Position",
     "LabelComponent",
     "H1Component",
@@ -10,15 +13,25 @@ __all__ = [
     "AlphaComponent",
     "ImageComponent",
     "SoundComponent",
+    "HierarchyComponent",
+    "LayerComponent",
+    "OverlayComponent",
+    "Tween",
+    "TweenComponent",
 ]
 
 
 from .alpha import AlphaComponent
+from .base import Component, change_tick, changed_since
 from .button import ButtonComponent
 from .headers import H1Component, H2Component, H3Component
+from .hierarchy import HierarchyComponent
 from .input import InputFieldComponent
 from .label import LabelComponent
+from .layer import LayerComponent
+from .overlay import OverlayComponent
 from .position import Position
 from .progress_bar import ProgressBarComponent
 from .image import ImageComponent
 from .sound import SoundComponent
+from .tween import Tween, TweenComponent
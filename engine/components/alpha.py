@@ -1,7 +1,11 @@
 from config import GameConfig
 
+from .base import Component
+
+
+class AlphaComponent(Component):
+    __slots__ = ("alpha", "target_alpha", "animation_speed")
 
-class AlphaComponent:
     def __init__(self, alpha: float = 1.0):
         """
         Alpha component for transparency
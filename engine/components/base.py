@@ -0,0 +1,110 @@
+"""Base class for components with change tracking."""
+
+import threading
+from typing import Dict, Tuple
+
+# Shared change tick: every change stamps the current value, and each
+# change_tick() checkpoint moves it on, so all changes between two
+# checkpoints (typically within one frame) carry the same small int
+_tick = 1
+_tick_lock = threading.Lock()
+_MISSING = object()
+# Component class -> every slot name along its MRO (cached for clone())
+_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _fields(cls: type) -> Tuple[str, ...]:
+    names = _FIELDS.get(cls)
+    if names is None:
+        names = tuple(
+            dict.fromkeys(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get("__slots__", ())
+                if name != "changed_tick"
+            )
+        )
+        _FIELDS[cls] = names
+    return names
+
+
+def change_tick() -> int:
+    """
+    Take a checkpoint of the change clock.
+
+    Every component change that happens after this call gets a larger
+    ``changed_tick``, so the returned value can be stored and later passed to
+    ``query_changed(since=...)`` / ``changed_since(...)``.
+    """
+    global _tick
+    with _tick_lock:
+        since = _tick
+        _tick += 1
+    return since
+
+
+class Component:
+    """
+    Base class for all components.
+
+    Fields are plain slots, so reads and writes cost nothing extra.  Code
+    that changes a component after it was added to an entity stamps it
+    with ``touch()`` - or uses ``set()``, which only stamps when a value
+    actually differs (setting ``hover = False`` every frame is no change).
+    Adding a component (``GameObject.add``, clones, pooled copies) stamps
+    it as well.
+    """
+
+    __slots__ = ("changed_tick",)
+
+    # Fields holding callbacks or other entities; EntityPool clears them
+    # when it keeps a released component
+    REFERENCES: Tuple[str, ...] = ()
+
+    def clone(self):
+        """
+        Shallow-copy the component without running ``__init__``.
+
+        Field values are shared (they are immutable or, like surfaces, meant
+        to be shared); the copy is stamped as changed.
+        """
+        cls = type(self)
+        return self.copy_to(cls.__new__(cls))
+
+    def copy_to(self, target: "Component") -> "Component":
+        """Overwrite every field of ``target`` (same type) with this component's values."""
+        for name in _fields(type(self)):
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                setattr(target, name, value)
+            elif hasattr(target, name):
+                object.__delattr__(target, name)
+        target.changed_tick = _tick
+        return target
+
+    def touch(self):
+        """Mark the component as changed."""
+        self.changed_tick = _tick
+
+    def set(self, **fields) -> bool:
+        """Assign ``fields``; stamps the component if any value changed."""
+        changed = False
+        for name, value in fields.items():
+            old = getattr(self, name, _MISSING)
+            if old is not value and old != value:
+                setattr(self, name, value)
+                changed = True
+        if changed:
+            self.changed_tick = _tick
+        return changed
+
+
+def changed_since(since: int, *components: Component) -> bool:
+    """
+    Check whether any of the given components changed after tick ``since``.
+
+    Components that were never added or stamped count as unchanged.
+    """
+    return any(
+        c is not None and getattr(c, "changed_tick", 0) > since for c in components
+    )
@@ -1,7 +1,23 @@
 from typing import Callable, Optional
 
+from .base import Component
+
+
+class ButtonComponent(Component):
+    __slots__ = (
+        "text",
+        "on_click",
+        "hover",
+        "active",
+        "width",
+        "height",
+        "min_width",
+        "min_height",
+        "keyboard_shortcut",
+        "pressed",
+    )
+    REFERENCES = ("on_click",)
 
-class ButtonComponent:
     def __init__(self, text: str, keyboard_shortcut: Optional[str] = None):
         self.text = text
         self.on_click: Optional[Callable[[], None]] = None
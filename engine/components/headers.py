@@ -1,21 +1,29 @@
 from config import GameConfig
 
+from .base import Component
+
+
+class H1Component(Component):
+    __slots__ = ("text", "color", "size")
 
-class H1Component:
     def __init__(self, text: str, color=GameConfig.H1_DEFAULT_COLOR):
         self.text: str = text
         self.color: tuple = color
         self.size: int = GameConfig.H1_FONT_SIZE
 
 
-class H2Component:
+class H2Component(Component):
+    __slots__ = ("text", "color", "size")
+
     def __init__(self, text: str, color=GameConfig.H2_DEFAULT_COLOR):
         self.text: str = text
         self.color: tuple = color
         self.size: int = GameConfig.H2_FONT_SIZE
 
 
-class H3Component:
+class H3Component(Component):
+    __slots__ = ("text", "color", "size")
+
     def __init__(self, text: str, color=GameConfig.H3_DEFAULT_COLOR):
         self.text: str = text
         self.color: tuple = color
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING, List, Optional
+
+from .base import Component
+
+if TYPE_CHECKING:
+    from ..ecs import GameObject
+
+
+class HierarchyComponent(Component):
+    __slots__ = ("parent", "children", "local_x", "local_y")
+    REFERENCES = ("parent", "children")
+
+    def __init__(
+        self, parent: Optional["GameObject"] = None, local_x: int = 0, local_y: int = 0
+    ):
+        """
+        Parent/child link for positioned entities
+        :param parent: Parent entity, None for a root
+        :param local_x: X offset from the parent's Position (ignored for roots)
+        :param local_y: Y offset from the parent's Position (ignored for roots)
+        """
+        self.parent: Optional["GameObject"] = parent
+        self.children: List["GameObject"] = []
+        self.local_x: int = local_x
+        self.local_y: int = local_y
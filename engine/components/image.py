@@ -3,10 +3,14 @@
 from typing import Optional
 import pygame
 
+from .base import Component
 
-class ImageComponent:
+
+class ImageComponent(Component):
     """Component to hold image-related data."""
 
+    __slots__ = ("image_path", "width", "height", "pygame_image")
+
     def __init__(
         self,
         image_path: str,
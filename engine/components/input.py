@@ -1,7 +1,11 @@
 from config import GameConfig
 
+from .base import Component
+
+
+class InputFieldComponent(Component):
+    __slots__ = ("text", "max_length", "focused", "placeholder")
 
-class InputFieldComponent:
     def __init__(self, max_length: int = GameConfig.INPUT_FIELD_DEFAULT_MAX_LENGTH):
         self.text: str = ""
         self.max_length: int = max_length
@@ -9,4 +13,4 @@ class InputFieldComponent:
         self.placeholder: str = ""
 
     def clear(self):
-        self.text: str = ""
+        self.set(text="")
@@ -1,7 +1,15 @@
 from config import GameConfig
 
+from .base import Component
 
-class LabelComponent:
-    def __init__(self, text: str, color=GameConfig.LABEL_DEFAULT_COLOR):
+
+class LabelComponent(Component):
+    __slots__ = ("text", "color", "dynamic")
+
+    def __init__(
+        self, text: str, color=GameConfig.LABEL_DEFAULT_COLOR, dynamic: bool = False
+    ):
         self.text: str = text
         self.color: tuple = color
+        # Frequently changing text is composed from a glyph atlas
+        self.dynamic: bool = dynamic
@@ -0,0 +1,12 @@
+from .base import Component
+
+
+class LayerComponent(Component):
+    __slots__ = ("layer",)
+
+    def __init__(self, layer: int = 0):
+        """
+        Draw layer of an entity
+        :param layer: higher layers are drawn on top (entities without one are on 0)
+        """
+        self.layer: int = layer
@@ -0,0 +1,26 @@
+from typing import Tuple
+
+from config import GameConfig
+
+from .base import Component
+
+
+class OverlayComponent(Component):
+    __slots__ = ("width", "height", "color", "border_color", "border_radius")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        color=GameConfig.MODAL_PANEL_COLOR,
+        border_color=GameConfig.MODAL_BORDER_COLOR,
+        border_radius: int = GameConfig.BUTTON_RADIUS,
+    ):
+        """
+        Modal panel drawn centered on the entity's position, behind its content
+        """
+        self.width: int = width
+        self.height: int = height
+        self.color: Tuple[int, int, int] = color
+        self.border_color: Tuple[int, int, int] = border_color
+        self.border_radius: int = border_radius
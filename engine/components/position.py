@@ -1,4 +1,9 @@
-class Position:
+from .base import Component
+
+
+class Position(Component):
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         self.x: int = x
         self.y: int = y
@@ -2,8 +2,22 @@ from typing import Tuple
 
 from config import GameConfig
 
+from .base import Component
+
+
+class ProgressBarComponent(Component):
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "color",
+        "fill_color",
+        "progress",
+        "target_progress",
+        "animation_speed",
+    )
 
-class ProgressBarComponent:
     def __init__(
         self,
         x: int,
@@ -1,9 +1,13 @@
 """Sound component for the ECS system."""
 
+from .base import Component
 
-class SoundComponent:
+
+class SoundComponent(Component):
     """Component to hold sound-related data."""
 
+    __slots__ = ("sound_name", "play_on_add", "volume", "loop")
+
     def __init__(self, sound_name: str):
         """
         Initialize the sound component.
@@ -0,0 +1,53 @@
+from typing import Callable, List, Optional
+
+from ..easing import Easing, linear
+from .base import Component
+
+
+class Tween:
+    """One animated attribute: ``component_type.attr`` from start to end."""
+
+    __slots__ = (
+        "component_type",
+        "attr",
+        "start",
+        "end",
+        "duration",
+        "easing",
+        "delay",
+        "elapsed",
+        "on_complete",
+    )
+
+    def __init__(
+        self,
+        component_type: type,
+        attr: str,
+        end,
+        duration: float,
+        easing: Easing = linear,
+        start=None,
+        delay: float = 0.0,
+        on_complete: Optional[Callable[[], None]] = None,
+    ):
+        self.component_type = component_type
+        self.attr = attr
+        # None: taken from the component when the tween starts running
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.delay = delay
+        self.elapsed = 0.0
+        self.on_complete = on_complete
+
+
+class TweenComponent(Component):
+    __slots__ = ("tweens",)
+    REFERENCES = ("tweens",)
+
+    def __init__(self):
+        """
+        Running tweens of an entity (advanced by the AnimationSystem)
+        """
+        self.tweens: List[Tween] = []
@@ -0,0 +1,101 @@
+"""Retained, layer-sorted list of draw commands."""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pygame import Rect
+from pygame.surface import Surface
+
+# Default layer of everything that does not ask for one
+LAYER_DEFAULT = 0
+# Modal overlays (dialogs, result panels) and their content
+LAYER_MODAL = 100
+
+
+class DrawList:
+    """
+    Collects draw commands for one frame and submits them in layer order.
+
+    Commands are either ``Surface.blits`` items or callables for primitives
+    that are not blits (``pygame.draw``).  Each layer keeps its commands in
+    submission order; ``flush()`` walks the layers from lowest to highest
+    and hands every run of consecutive blits to the target in a single
+    ``Surface.blits`` call.
+
+    Every submit method returns the (unclipped) screen area the command
+    will cover, so callers can track dirty regions before anything is drawn.
+    """
+
+    def __init__(self):
+        # Layer -> queued blit tuples and callables, in submission order
+        self._layers: Dict[int, List] = {}
+        # Surface.blits calls made by the last flush (for profiling)
+        self.batches = 0
+
+    def layer(self, layer: int = LAYER_DEFAULT) -> List:
+        """
+        Get the command list of ``layer``.
+
+        Hot loops may append ``(source, dest)``/``(source, dest, area)``
+        tuples or ``func(target)`` callables to it directly.
+        """
+        commands = self._layers.get(layer)
+        if commands is None:
+            commands = self._layers[layer] = []
+        return commands
+
+    def blit(
+        self,
+        source: Surface,
+        dest: Tuple[int, int],
+        area: Optional[Rect] = None,
+        layer: int = LAYER_DEFAULT,
+    ) -> Rect:
+        """Queue a blit of ``source`` (or its ``area``) at ``dest``."""
+        if area is None:
+            self.layer(layer).append((source, dest))
+            return Rect(dest[0], dest[1], *source.get_size())
+        self.layer(layer).append((source, dest, area))
+        return Rect(dest[0], dest[1], area.width, area.height)
+
+    def blits(
+        self, sequence: Sequence[tuple], rect: Rect, layer: int = LAYER_DEFAULT
+    ) -> Rect:
+        """Queue ready-made ``Surface.blits`` items covering ``rect``."""
+        self.layer(layer).extend(sequence)
+        return rect
+
+    def call(
+        self, func: Callable[[Surface], object], rect: Rect, layer: int = LAYER_DEFAULT
+    ) -> Rect:
+        """Queue ``func(target)`` drawing inside ``rect`` (e.g. ``pygame.draw``)."""
+        self.layer(layer).append(func)
+        return rect
+
+    def flush(self, target: Surface):
+        """Draw every queued command onto ``target`` and empty the list."""
+        batches = 0
+        for layer in sorted(self._layers):
+            commands = self._layers[layer]
+            start = 0
+            for i, command in enumerate(commands):
+                if type(command) is tuple:
+                    continue
+                if i > start:
+                    target.blits(commands[start:i], doreturn=False)
+                    batches += 1
+                command(target)
+                start = i + 1
+            if start < len(commands):
+                target.blits(
+                    commands[start:] if start else commands, doreturn=False
+                )
+                batches += 1
+        self.batches = batches
+        self._layers.clear()
+
+    def clear(self):
+        """Drop every queued command without drawing."""
+        self._layers.clear()
+
+    def __len__(self) -> int:
+        return sum(len(commands) for commands in self._layers.values())
@@ -0,0 +1,59 @@
+"""Easing curves for tweens: each maps progress t (0..1) to eased progress."""
+
+import math
+from typing import Callable, Dict, Union
+
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    return t * t
+
+
+def ease_out_quad(t: float) -> float:
+    return t * (2.0 - t)
+
+
+def ease_in_out_quad(t: float) -> float:
+    return 2.0 * t * t if t < 0.5 else 1.0 - (-2.0 * t + 2.0) ** 2 / 2.0
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1.0 - (1.0 - t) ** 3
+
+
+def ease_in_out_sine(t: float) -> float:
+    return -(math.cos(math.pi * t) - 1.0) / 2.0
+
+
+def ease_out_back(t: float) -> float:
+    # Overshoots slightly before settling (e.g. popping in a panel)
+    c1 = 1.70158
+    return 1.0 + (c1 + 1.0) * (t - 1.0) ** 3 + c1 * (t - 1.0) ** 2
+
+
+EASINGS: Dict[str, Easing] = {
+    "linear": linear,
+    "ease_in_quad": ease_in_quad,
+    "ease_out_quad": ease_out_quad,
+    "ease_in_out_quad": ease_in_out_quad,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_sine": ease_in_out_sine,
+    "ease_out_back": ease_out_back,
+}
+
+
+def get_easing(easing: Union[str, Easing]) -> Easing:
+    """Resolve an easing name (see ``EASINGS``) or pass a callable through."""
+    if callable(easing):
+        return easing
+    try:
+        return EASINGS[easing]
+    except KeyError:
+        raise ValueError(
+            f"Unknown easing {easing!r}, expected one of {', '.join(EASINGS)}"
+        ) from None
@@ -1,18 +1,116 @@
+from typing import List
+
+from .components.base import Component
+
+# Entity handles pack a slot index and a generation counter into one int:
+# the low bits are the index, the high bits the generation.  When an entity
+# dies its index is reused with a bumped generation, so stale handles can be
+# detected instead of silently pointing at a new entity.
+INDEX_BITS = 32
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+def entity_index(handle: int) -> int:
+    """Get the slot index part of an entity handle."""
+    return handle & INDEX_MASK
+
+
+def entity_generation(handle: int) -> int:
+    """Get the generation part of an entity handle."""
+    return handle >> INDEX_BITS
+
+
+class EntityAllocator:
+    """Hands out generational integer handles and recycles freed indices."""
+
+    def __init__(self):
+        self._generations: List[int] = []
+        self._free: List[int] = []
+
+    def allocate(self) -> int:
+        """Get a new live handle."""
+        try:
+            index = self._free.pop()
+        except IndexError:
+            index = len(self._generations)
+            self._generations.append(0)
+        return (self._generations[index] << INDEX_BITS) | index
+
+    def release(self, handle: int):
+        """Mark a handle dead so its index can be reused."""
+        index = handle & INDEX_MASK
+        if self.is_alive(handle):
+            self._generations[index] += 1
+            self._free.append(index)
+
+    def is_alive(self, handle: int) -> bool:
+        """Check whether a handle still refers to a live entity."""
+        index = handle & INDEX_MASK
+        return (
+            index < len(self._generations)
+            and self._generations[index] == handle >> INDEX_BITS
+        )
+
+    @property
+    def live_count(self) -> int:
+        return len(self._generations) - len(self._free)
+
+
+_allocator = EntityAllocator()
+
+
+def get_entity_allocator() -> EntityAllocator:
+    """Get the allocator used for all GameObject handles."""
+    return _allocator
+
+
 class GameObject:
     """
     A GameObject represents an object in the game world.
     It's a container that holds different components like position,
     graphics, physics, etc. following the Entity-Component-System pattern.
+
+    Every GameObject has a compact generational integer handle in ``id``.
+    The handle is released when the object is garbage collected, after which
+    ``get_entity_allocator().is_alive(handle)`` returns False.
     """
 
+    __slots__ = ("id", "components", "_world")
+
     def __init__(self):
+        self.id: int = _allocator.allocate()
         self.components: dict = {}
+        # World (scene entity collection) this object belongs to, if any
+        self._world = None
+
+    def __del__(self):
+        # The allocator may already be gone during interpreter shutdown
+        if _allocator is not None:
+            _allocator.release(self.id)
+
+    def __repr__(self):
+        return (
+            f"GameObject(index={entity_index(self.id)}, "
+            f"generation={entity_generation(self.id)})"
+        )
 
     def add(self, component):
         """Add a component to this game object."""
         self.components[type(component)] = component
+        if isinstance(component, Component):
+            # Adding counts as a change for query_changed()
+            component.touch()
+        if self._world is not None:
+            self._world._on_components_changed(self)
         return self
 
+    def remove(self, component_type):
+        """Remove and return the component of the specified type (None if missing)."""
+        component = self.components.pop(component_type, None)
+        if component is not None and self._world is not None:
+            self._world._on_components_changed(self)
+        return component
+
     def get(self, component_type):
         """Get a component of the specified type from this game object."""
         return self.components.get(component_type)
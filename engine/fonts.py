@@ -0,0 +1,96 @@
+"""Shared font registry."""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+from pygame.font import Font
+
+from config import GameConfig
+from logger import get_logger
+from utils import load_font_with_fallback
+
+log = get_logger("engine/fonts")
+
+REGULAR = "regular"
+BOLD = "bold"
+ITALIC = "italic"
+
+# (path or "sys:<name>", size, style)
+FontKey = Tuple[str, int, str]
+
+
+class FontRegistry:
+    """
+    Loads every font exactly once and hands out the shared instance.
+
+    Fonts are keyed by (path, size, style).  Without an explicit path the
+    style picks the bundled font file (regular/bold/italic); with a path the
+    style is applied with ``set_bold``/``set_italic``.  Files that fail to
+    load fall back to the system font (see ``load_font_with_fallback``).
+
+    ``GameApp`` provides one registry as the ``"font_registry"`` service;
+    ``FontTask`` preloads fonts through the ``AssetLoader``.
+    """
+
+    def __init__(self):
+        self._fonts: Dict[FontKey, Font] = {}
+        # Fonts actually loaded from disk/system (cache misses)
+        self.loads = 0
+
+    def get(self, size: int, path: Optional[str] = None, style: str = REGULAR) -> Font:
+        """Get the font file at ``path`` (default: the bundled font for ``style``)."""
+        if path is None:
+            path = self._bundled_path(style)
+            apply_style = False
+        else:
+            apply_style = True
+        key = (path, size, style)
+        font = self._fonts.get(key)
+        if font is None:
+            font = load_font_with_fallback(size, path)
+            if apply_style:
+                self._apply_style(font, style)
+            self._store(key, font)
+        return font
+
+    def system(self, name: str, size: int, style: str = REGULAR) -> Font:
+        """Get a system font by name (``pygame.font.SysFont``)."""
+        key = (f"sys:{name}", size, style)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.SysFont(
+                name, size, bold=style == BOLD, italic=style == ITALIC
+            )
+            self._store(key, font)
+        return font
+
+    def preload(self, specs: Iterable[tuple]):
+        """Load fonts ahead of time; each spec is a ``get()`` argument tuple."""
+        for spec in specs:
+            self.get(*spec)
+
+    def _store(self, key: FontKey, font: Font):
+        self._fonts[key] = font
+        self.loads += 1
+        log.debug(f"Font registered: {key}")
+
+    @staticmethod
+    def _bundled_path(style: str) -> str:
+        if style == BOLD:
+            return GameConfig.BOLD_FONT_PATH
+        if style == ITALIC:
+            return GameConfig.ITALIC_FONT_PATH
+        return GameConfig.DEFAULT_FONT_PATH
+
+    @staticmethod
+    def _apply_style(font: Font, style: str):
+        if style == BOLD:
+            font.set_bold(True)
+        elif style == ITALIC:
+            font.set_italic(True)
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def __contains__(self, key: FontKey) -> bool:
+        return key in self._fonts
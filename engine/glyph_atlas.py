@@ -0,0 +1,134 @@
+"""Glyph atlas text rendering for frequently changing strings."""
+
+import string
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+from pygame import Rect
+from pygame.font import Font
+from pygame.surface import Surface
+
+from logger import get_logger
+
+log = get_logger("engine/glyph_atlas")
+
+# Glyphs rasterized up front; anything else is added on first use
+DEFAULT_CHARSET = string.printable.strip() + " "
+# Width of one shelf (row) of glyphs in the atlas surface
+ATLAS_WIDTH = 512
+
+
+class GlyphAtlas:
+    """
+    One font/color's glyphs packed into a single surface.
+
+    Each glyph is rendered once with FreeType; strings are then composed by
+    blitting glyph areas of the atlas with ``Surface.blits``, so drawing a
+    string costs one blit per character instead of a full text render.
+    Kerning between glyphs is not applied.
+
+    The atlas surface is never changed in place: a glyph missing from the
+    atlas rebuilds it into a new surface, so caches keyed on the surface
+    (e.g. ``AlphaVariantCache``) stay valid.
+    """
+
+    def __init__(
+        self, font: Font, color, antialias: bool = True, charset: str = DEFAULT_CHARSET
+    ):
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.surface: Surface = pygame.Surface((1, 1), pygame.SRCALPHA)
+        # Character -> (area in the atlas, horizontal advance)
+        self._glyphs: Dict[str, Tuple[Rect, int]] = {}
+        # Character -> (rendered glyph, horizontal advance), kept for rebuilds
+        self._rendered: Dict[str, Tuple[Surface, int]] = {}
+        self.builds = 0
+        self._build(charset)
+
+    def _build(self, chars: str):
+        """Rasterize ``chars`` and pack every known glyph into a new atlas surface."""
+        glyphs = self._rendered
+        for ch in chars:
+            if ch not in glyphs:
+                surf = self.font.render(ch, self.antialias, self.color)
+                metrics = self.font.metrics(ch)
+                advance = metrics[0][4] if metrics and metrics[0] else surf.get_width()
+                glyphs[ch] = (surf, advance)
+
+        # Shelf packing: fill rows of ATLAS_WIDTH, one glyph height each
+        placed: Dict[str, Tuple[Rect, int]] = {}
+        x = y = 0
+        for ch, (surf, advance) in glyphs.items():
+            w = surf.get_width()
+            if x + w > ATLAS_WIDTH and x > 0:
+                x, y = 0, y + self.height
+            placed[ch] = (Rect(x, y, w, surf.get_height()), advance)
+            x += w
+
+        atlas = pygame.Surface((ATLAS_WIDTH, y + self.height), pygame.SRCALPHA)
+        atlas.blits(
+            [(surf, placed[ch][0]) for ch, (surf, _) in glyphs.items()],
+            doreturn=False,
+        )
+        self.surface = atlas
+        self._glyphs = placed
+        self.builds += 1
+        log.debug(f"Glyph atlas built: {len(placed)} glyphs, {atlas.get_size()}")
+
+    def _layout(self, text: str) -> List[Tuple[Rect, int]]:
+        """Get the (atlas area, advance) of every character in ``text``."""
+        glyphs = self._glyphs
+        try:
+            return [glyphs[ch] for ch in text]
+        except KeyError:
+            self._build("".join(ch for ch in set(text) if ch not in glyphs))
+            return [self._glyphs[ch] for ch in text]
+
+    @staticmethod
+    def _width(layout: List[Tuple[Rect, int]]) -> int:
+        if not layout:
+            return 0
+        # Advances run up to the last glyph; its own width may overhang them
+        area, _ = layout[-1]
+        return sum(advance for _, advance in layout[:-1]) + area.width
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """Get the (width, height) ``text`` covers when drawn."""
+        return self._width(self._layout(text)), self.height
+
+    def compose(
+        self, text: str, center: Tuple[int, int], atlas: Optional[Surface] = None
+    ) -> Tuple[Rect, List[tuple]]:
+        """
+        Lay out ``text`` centered at ``center`` as ``Surface.blits`` items.
+
+        Returns the area the text covers and the blit sequence.  ``atlas`` may
+        be a modulated copy of ``self.surface`` (same layout), e.g. a
+        translucent variant from ``AlphaVariantCache``.
+        """
+        layout = self._layout(text)
+        rect = Rect(0, 0, self._width(layout), self.height)
+        rect.center = center
+        source = self.surface if atlas is None else atlas
+
+        x, y = rect.x, rect.y
+        sequence: List[tuple] = []
+        append = sequence.append
+        for area, advance in layout:
+            append((source, (x, y), area))
+            x += advance
+        return rect, sequence
+
+    def draw(
+        self,
+        target: Surface,
+        text: str,
+        center: Tuple[int, int],
+        atlas: Optional[Surface] = None,
+    ) -> Rect:
+        """Draw ``text`` centered at ``center`` and return the area it covers."""
+        rect, sequence = self.compose(text, center, atlas)
+        target.blits(sequence, doreturn=False)
+        return rect.clip(target.get_clip())
@@ -0,0 +1,60 @@
+"""Parent/child relationships between positioned entities."""
+
+from .components import HierarchyComponent, Position
+from .ecs import GameObject
+
+
+def _node(e: GameObject) -> HierarchyComponent:
+    node = e.get(HierarchyComponent)
+    if node is None:
+        node = HierarchyComponent()
+        e.add(node)
+    return node
+
+
+def attach(child: GameObject, parent: GameObject) -> GameObject:
+    """
+    Make ``child`` a child of ``parent``.
+
+    The child's current Position is taken as its offset from the parent, so
+    UI can be built in container-local coordinates and attached afterwards.
+    The child's Position then holds its world position, kept up to date by
+    the TransformSystem whenever an ancestor moves.
+    """
+    node = _node(child)
+    if node.parent is not None:
+        detach(child)
+    pos = child.get(Position)
+    node.local_x, node.local_y = (pos.x, pos.y) if pos else (0, 0)
+    node.parent = parent
+    node.touch()
+    _node(parent).children.append(child)
+    propagate(child)
+    return child
+
+
+def detach(child: GameObject) -> GameObject:
+    """Make ``child`` a root again; it keeps its current world position."""
+    node = child.get(HierarchyComponent)
+    if node is None or node.parent is None:
+        return child
+    siblings = node.parent.get(HierarchyComponent).children
+    if child in siblings:
+        siblings.remove(child)
+    node.parent = None
+    node.touch()
+    return child
+
+
+def propagate(e: GameObject):
+    """Recompute the world Position of ``e`` (if it has a parent) and its subtree."""
+    node = e.get(HierarchyComponent)
+    if node is None:
+        return
+    pos = e.get(Position)
+    if node.parent is not None and pos is not None:
+        parent_pos = node.parent.get(Position)
+        if parent_pos is not None:
+            pos.set(x=parent_pos.x + node.local_x, y=parent_pos.y + node.local_y)
+    for child in node.children:
+        propagate(child)
@@ -0,0 +1,118 @@
+"""Scripted input events for headless runs."""
+
+import json
+from typing import Dict, List, Tuple
+
+import pygame
+
+from logger import get_logger
+
+log = get_logger("engine/input_script")
+
+
+def _key_code(name: str) -> int:
+    """Resolve a key name ("return", "escape", "a", "5") to its pygame key."""
+    for attr in (f"K_{name}", f"K_{name.upper()}"):
+        if hasattr(pygame, attr):
+            return getattr(pygame, attr)
+    raise ValueError(f"Unknown key name: {name!r}")
+
+
+class InputScript:
+    """
+    Events to inject into the game loop at given frame numbers.
+
+    ``GameApp`` appends the events of each frame to what ``pygame.event.get``
+    returned, so scripted input goes through the normal event dispatch::
+
+        script = InputScript().key(40, pygame.K_RETURN, "\\r").quit(300)
+        GameApp(input_script=script).run()
+
+    With ``repeat`` the script starts over after its last frame, e.g. to
+    click through the same scene transitions again and again.
+    """
+
+    def __init__(self, repeat: bool = False):
+        self._events: Dict[int, List[pygame.event.Event]] = {}
+        self.repeat = repeat
+
+    def at(self, frame: int, *events: pygame.event.Event) -> "InputScript":
+        """Inject ``events`` at ``frame`` (1 = the first frame)."""
+        if frame < 1:
+            raise ValueError(f"Frames are counted from 1, got {frame}")
+        self._events.setdefault(frame, []).extend(events)
+        return self
+
+    def key(
+        self, frame: int, key: int, unicode: str = "", mod: int = 0
+    ) -> "InputScript":
+        """Press and release ``key`` at ``frame``."""
+        return self.at(
+            frame,
+            pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod, unicode=unicode),
+            pygame.event.Event(pygame.KEYUP, key=key, mod=mod, unicode=unicode),
+        )
+
+    def text(self, frame: int, text: str) -> "InputScript":
+        """Type ``text``, one character per frame starting at ``frame``."""
+        for i, ch in enumerate(text):
+            # SDL keycodes of printable ASCII keys are their lowercase characters
+            self.key(frame + i, ord(ch.lower()), ch)
+        return self
+
+    def click(
+        self, frame: int, pos: Tuple[int, int], button: int = 1
+    ) -> "InputScript":
+        """Move the mouse to ``pos`` and click at ``frame`` (window coordinates)."""
+        return self.at(
+            frame,
+            pygame.event.Event(
+                pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)
+            ),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button),
+        )
+
+    def quit(self, frame: int) -> "InputScript":
+        """Close the game at ``frame``."""
+        return self.at(frame, pygame.event.Event(pygame.QUIT))
+
+    @property
+    def length(self) -> int:
+        """Last frame with events (0 for an empty script)."""
+        return max(self._events, default=0)
+
+    def events(self, frame: int) -> List[pygame.event.Event]:
+        """Get the events to inject at ``frame``."""
+        if self.repeat and self.length:
+            frame = (frame - 1) % self.length + 1
+        return self._events.get(frame, [])
+
+    @classmethod
+    def load(cls, path: str) -> "InputScript":
+        """
+        Load a script from a JSON file.
+
+        The file holds ``{"repeat": false, "events": [...]}`` or just the
+        event list.  Each event is ``{"frame": 40, "type": "KEYDOWN", ...}``
+        with the pygame event type name and its attributes; ``"key"`` may be
+        a key name such as ``"return"`` and ``"pos"`` a list.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            data = {"events": data}
+
+        script = cls(repeat=data.get("repeat", False))
+        for entry in data["events"]:
+            attrs = dict(entry)
+            frame = attrs.pop("frame")
+            event_type = getattr(pygame, attrs.pop("type").upper())
+            if isinstance(attrs.get("key"), str):
+                attrs["key"] = _key_code(attrs["key"])
+            for name in ("pos", "rel", "buttons"):
+                if name in attrs:
+                    attrs[name] = tuple(attrs[name])
+            script.at(frame, pygame.event.Event(event_type, **attrs))
+        log.info(f"Input script loaded: {path} ({script.length} frames)")
+        return script
@@ -0,0 +1,93 @@
+"""Reuse of GameObjects and components across scene changes."""
+
+from typing import Dict, Iterable, List, Optional
+
+from logger import get_logger
+
+from .components.base import Component
+from .ecs import GameObject, get_entity_allocator
+
+log = get_logger("engine/pool")
+
+
+class EntityPool:
+    """
+    Free lists of GameObjects and components.
+
+    Scenes release their entities on ``exit()`` and ``Prefab.instantiate``
+    draws from the pool on ``enter()``, so restarting a scene reuses the
+    objects of the previous one instead of allocating new ones.
+
+    A released GameObject loses its components and its handle (``id``);
+    it gets a fresh handle when acquired again.  Only component types that
+    ``acquire_component`` was asked for (the types prefabs are built from)
+    are kept, with their ``REFERENCES`` fields cleared so free components
+    do not keep callbacks or old entities alive.  Hit/miss counters are
+    available through ``stats()``.
+    """
+
+    def __init__(self, max_size: int = 256):
+        # Upper bound for free entities and for free components of each type
+        self.max_size = max_size
+        self._entities: List[GameObject] = []
+        # Free lists of the component types that have been acquired so far
+        self._components: Dict[type, List[Component]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.component_hits = 0
+        self.component_misses = 0
+
+    def acquire(self) -> GameObject:
+        """Get an empty GameObject, reusing a released one when possible."""
+        if self._entities:
+            e = self._entities.pop()
+            e.id = get_entity_allocator().allocate()
+            self.hits += 1
+            return e
+        self.misses += 1
+        return GameObject()
+
+    def acquire_component(self, component_type: type) -> Optional[Component]:
+        """Get a released component of exactly ``component_type`` (None on a miss)."""
+        free = self._components.get(component_type)
+        if free:
+            self.component_hits += 1
+            return free.pop()
+        self.component_misses += 1
+        if free is None:
+            # From now on released components of this type are kept
+            self._components[component_type] = []
+        return None
+
+    def release(self, e: GameObject):
+        """Take back an entity that is no longer part of any World."""
+        if e._world is not None:
+            raise ValueError("Cannot pool an entity that is still in a World")
+        for component in e.components.values():
+            free = self._components.get(type(component))
+            if free is not None and len(free) < self.max_size:
+                for name in component.REFERENCES:
+                    setattr(component, name, None)
+                free.append(component)
+        e.components.clear()
+        if len(self._entities) < self.max_size:
+            # The old handle goes stale now; acquire() hands out a new one
+            get_entity_allocator().release(e.id)
+            self._entities.append(e)
+
+    def release_all(self, entities: Iterable[GameObject]):
+        """Release several entities."""
+        for e in entities:
+            self.release(e)
+        log.debug("Entity pool: %s", self.stats())
+
+    def stats(self) -> dict:
+        """Get the hit/miss counters and free list sizes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "component_hits": self.component_hits,
+            "component_misses": self.component_misses,
+            "free_entities": len(self._entities),
+            "free_components": sum(len(free) for free in self._components.values()),
+        }
@@ -0,0 +1,66 @@
+"""Entity templates that are cloned instead of built component by component."""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .ecs import GameObject
+
+if TYPE_CHECKING:
+    from .pool import EntityPool
+
+
+class Prefab:
+    """
+    A template entity: a set of fully initialized components.
+
+    ``instantiate`` clones every template component (no ``__init__``, no
+    config lookups) and then writes the given per-component field
+    overrides, so building an entity is a few cheap copies.  Field values
+    are shared between clones - assets such as a pre-loaded
+    ``ImageComponent.pygame_image`` are resolved once per prefab.
+
+    With a ``pool`` the entity and its components are taken from the
+    EntityPool when available and overwritten with the template values.
+    """
+
+    __slots__ = ("components",)
+
+    def __init__(self, *components):
+        self.components = components
+
+    def instantiate(
+        self,
+        overrides: Optional[Dict[type, Dict[str, Any]]] = None,
+        pool: Optional["EntityPool"] = None,
+    ) -> GameObject:
+        """
+        Create a new entity from the template.
+
+        :param overrides: component type -> {field: value} applied to the clones
+        :param pool: optional EntityPool to reuse entities/components from
+        """
+        if pool is None:
+            e = GameObject()
+            comps = e.components
+            for template in self.components:
+                comps[type(template)] = template.clone()
+        else:
+            e = pool.acquire()
+            comps = e.components
+            for template in self.components:
+                component_type = type(template)
+                reused = pool.acquire_component(component_type)
+                comps[component_type] = (
+                    template.clone() if reused is None else template.copy_to(reused)
+                )
+        if overrides:
+            for component_type, fields in overrides.items():
+                component = comps[component_type]
+                for name, value in fields.items():
+                    setattr(component, name, value)
+        return e
+
+    def instantiate_many(
+        self, count: int, pool: Optional["EntityPool"] = None
+    ) -> List[GameObject]:
+        """Create ``count`` entities with the template's default values."""
+        return [self.instantiate(pool=pool) for _ in range(count)]
@@ -0,0 +1,288 @@
+"""Frame profiler: per-phase timings, rolling statistics and trace export."""
+
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+from pygame.font import Font
+from pygame.surface import Surface
+
+from .glyph_atlas import GlyphAtlas
+from logger import get_logger
+
+log = get_logger("engine/profiler")
+
+# Upper bounds (ms) of the frame time histogram buckets; the last is open
+HISTOGRAM_BOUNDS_MS = (4.0, 8.0, 16.7, 33.3, 50.0)
+FRAME = "frame"
+
+# (phase, start ns, duration ns, thread id)
+Span = Tuple[str, int, int, int]
+
+
+class _Section:
+    """Context manager timing one phase (see ``FrameProfiler.section``)."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.record(self._name, self._start, time.perf_counter_ns())
+        return False
+
+
+class _NullSection:
+    """Shared do-nothing section handed out while the profiler is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """
+    Measures where frame time goes, phase by phase.
+
+    Phases are timed with ``perf_counter_ns`` - by the ``Scheduler`` for
+    every system it runs, and by ``with profiler.section(name):`` for
+    anything else (event polling, scaling, flipping).  For each phase the
+    time of the last ``history`` frames is kept for statistics
+    (``stats()``, ``histogram()``), and the individual spans for
+    ``export_chrome_trace()``.
+
+    While ``enabled`` is False nothing is recorded; ``section()`` returns a
+    shared no-op context manager, so instrumented code costs next to
+    nothing.
+    """
+
+    def __init__(self, history: int = 240, enabled: bool = False):
+        self.enabled = enabled
+        self.history = history
+        # Phase -> time spent in it per frame (ns), last `history` frames
+        self._samples: Dict[str, Deque[int]] = {}
+        # Spans of the last `history` frames (roughly), for trace export
+        self._spans: Deque[Span] = deque(maxlen=history * 32)
+        # Phase -> time spent in it so far this frame (ns)
+        self._frame: Dict[str, int] = {}
+        self._frame_start: Optional[int] = None
+        # Time between consecutive frame starts (ns), for the real frame rate
+        self._intervals: Deque[int] = deque(maxlen=history)
+        self._thread_names: Dict[int, str] = {}
+        self.frames = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def section(self, name: str):
+        """Time the ``with`` block as phase ``name``."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name: str, start_ns: int, end_ns: int):
+        """Record that phase ``name`` ran from ``start_ns`` to ``end_ns``."""
+        if not self.enabled:
+            return
+        duration = end_ns - start_ns
+        self._frame[name] = self._frame.get(name, 0) + duration
+        thread = threading.current_thread()
+        self._thread_names.setdefault(thread.ident, thread.name)
+        self._spans.append((name, start_ns, duration, thread.ident))
+
+    def begin_frame(self):
+        """Call at the start of every frame."""
+        if not self.enabled:
+            self._frame_start = None
+            return
+        now = time.perf_counter_ns()
+        if self._frame_start is not None:
+            self._intervals.append(now - self._frame_start)
+        self._frame_start = now
+        self._frame.clear()
+
+    def end_frame(self):
+        """Call at the end of every frame: the frame's phase times become samples."""
+        if self._frame_start is None or not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self.record(FRAME, self._frame_start, now)
+        for name, duration in self._frame.items():
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.history)
+            samples.append(duration)
+        self.frames += 1
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        self._samples.clear()
+        self._spans.clear()
+        self._frame.clear()
+        self._intervals.clear()
+        self.frames = 0
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    @property
+    def phases(self) -> List[str]:
+        """Recorded phases in the order they first appeared (frame excluded)."""
+        return [name for name in self._samples if name != FRAME]
+
+    @property
+    def fps(self) -> float:
+        """Frames per second over the recent frames (including capping/waits)."""
+        if not self._intervals:
+            return 0.0
+        return 1e9 * len(self._intervals) / sum(self._intervals)
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """Get avg/p50/p95/max of phase ``name`` over the recent frames (ms)."""
+        samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        n = len(samples)
+        return {
+            "avg": sum(samples) / n / 1e6,
+            "p50": samples[n // 2] / 1e6,
+            "p95": samples[min(n - 1, int(n * 0.95))] / 1e6,
+            "max": samples[-1] / 1e6,
+        }
+
+    def histogram(
+        self, name: str = FRAME, bounds_ms: Sequence[float] = HISTOGRAM_BOUNDS_MS
+    ) -> List[int]:
+        """
+        Count the recent frames of phase ``name`` per time bucket.
+
+        Bucket ``i`` holds samples up to ``bounds_ms[i]``; the extra last
+        bucket holds everything slower.
+        """
+        counts = [0] * (len(bounds_ms) + 1)
+        for sample in self._samples.get(name, ()):
+            ms = sample / 1e6
+            for i, bound in enumerate(bounds_ms):
+                if ms <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+        return counts
+
+    # ------------------------------------------------------------------
+    # Trace export
+    # ------------------------------------------------------------------
+    def export_chrome_trace(self, path) -> Path:
+        """
+        Write the recorded spans as Chrome trace JSON.
+
+        The file opens in ``chrome://tracing`` and https://ui.perfetto.dev;
+        each thread (main thread, scheduler workers) is one track.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Frames are recorded after their phases, so the first span is not the oldest
+        origin = min((span[1] for span in self._spans), default=0)
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in self._thread_names.items()
+        ]
+        events.extend(
+            {
+                "name": name,
+                "cat": "frame" if name == FRAME else "phase",
+                "ph": "X",
+                "ts": (start - origin) / 1000.0,
+                "dur": duration / 1000.0,
+                "pid": 1,
+                "tid": tid,
+            }
+            for name, start, duration, tid in self._spans
+        )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        log.info(f"Chrome trace written: {path} ({len(self._spans)} spans)")
+        return path
+
+
+class ProfilerOverlay:
+    """
+    Draws a profiler's recent statistics in a translucent panel.
+
+    Numbers change every frame, so text is composed from a glyph atlas
+    instead of being rendered per frame.
+    """
+
+    PADDING = 6
+    COLUMN_WIDTH = 56
+    NAME_WIDTH = 90
+
+    def __init__(self, profiler: FrameProfiler, font: Font, color=(230, 230, 230)):
+        self.profiler = profiler
+        self.atlas = GlyphAtlas(font, color)
+        self.line_height = font.get_linesize()
+        self._panel: Optional[Surface] = None
+
+    def _lines(self) -> List[Tuple[str, ...]]:
+        profiler = self.profiler
+        frame = profiler.stats(FRAME)
+        lines = [
+            (f"{profiler.fps:.0f} FPS", "avg", "p95", "max"),
+            (FRAME,) + self._columns(frame),
+        ]
+        lines.extend(
+            (name,) + self._columns(profiler.stats(name)) for name in profiler.phases
+        )
+        bounds = ("<4", "<8", "<17", "<33", "<50", "50+")
+        counts = profiler.histogram()
+        lines.append(("ms",) + tuple(f"{b}:{c}" for b, c in zip(bounds, counts)))
+        return lines
+
+    @staticmethod
+    def _columns(stats: Dict[str, float]) -> Tuple[str, ...]:
+        return tuple(f"{stats[key]:.2f}" for key in ("avg", "p95", "max"))
+
+    def draw(self, target: Surface, topleft: Tuple[int, int] = (4, 4)) -> pygame.Rect:
+        """Draw the overlay onto ``target``; returns the covered area."""
+        lines = self._lines()
+        columns = max(len(line) for line in lines)
+        width = self.NAME_WIDTH + self.COLUMN_WIDTH * (columns - 1) + 2 * self.PADDING
+        height = self.line_height * len(lines) + 2 * self.PADDING
+        if self._panel is None or self._panel.get_size() != (width, height):
+            self._panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            self._panel.fill((0, 0, 0, 200))
+        rect = target.blit(self._panel, topleft)
+
+        y = topleft[1] + self.PADDING
+        for line in lines:
+            x = topleft[0] + self.PADDING
+            for i, text in enumerate(line):
+                w, h = self.atlas.size(text)
+                self.atlas.draw(target, text, (x + w // 2, y + h // 2))
+                x += self.NAME_WIDTH if i == 0 else self.COLUMN_WIDTH
+            y += self.line_height
+        return rect
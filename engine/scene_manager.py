@@ -1,15 +1,40 @@
+from typing import Callable, List, Optional
+
 from .base_scene import BaseScene
 from logger import get_logger
 
 log = get_logger("engine/scene_manager")
 
+# Called with (old scene or None, new scene)
+SceneHook = Callable[[Optional[BaseScene], BaseScene], None]
+
 
 class SceneManager:
     def __init__(self, app):
         self.app = app
         self.current: BaseScene | None = None
+        self._before_change: List[SceneHook] = []
+        self._after_change: List[SceneHook] = []
+
+    def add_hooks(
+        self, before: Optional[SceneHook] = None, after: Optional[SceneHook] = None
+    ):
+        """Call ``before``/``after`` around every scene change (exit + enter)."""
+        if before is not None:
+            self._before_change.append(before)
+        if after is not None:
+            self._after_change.append(after)
+
+    def _run_hooks(self, hooks: List[SceneHook], old, new):
+        for hook in hooks:
+            try:
+                hook(old, new)
+            except Exception as e:
+                log.exception("Error in scene change hook: %s", e)
 
     def change(self, new_scene: BaseScene):
+        old_scene = self.current
+        self._run_hooks(self._before_change, old_scene, new_scene)
         if self.current:
             try:
                 self.current.exit()
@@ -21,3 +46,4 @@ class SceneManager:
             self.current.enter()
         except Exception as e:
             log.exception("Error on scene enter: %s", e)
+        self._run_hooks(self._after_change, old_scene, new_scene)
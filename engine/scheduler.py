@@ -0,0 +1,152 @@
+"""Frame scheduler: runs systems in dependency-ordered stages."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from logger import get_logger
+
+log = get_logger("engine/scheduler")
+
+
+class SystemEntry:
+    """A registered system and the component types it touches."""
+
+    __slots__ = ("name", "run", "reads", "writes", "exclusive")
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[float], None],
+        reads: FrozenSet[type],
+        writes: FrozenSet[type],
+        exclusive: bool,
+    ):
+        self.name = name
+        self.run = run
+        self.reads = reads
+        self.writes = writes
+        self.exclusive = exclusive
+
+    def conflicts_with(self, other: "SystemEntry") -> bool:
+        """Check whether the two systems may not run at the same time."""
+        if self.exclusive or other.exclusive:
+            return True
+        return bool(
+            self.writes & (other.reads | other.writes)
+            or other.writes & self.reads
+        )
+
+
+class Scheduler:
+    """
+    Runs the systems of a frame.
+
+    Every system is registered with the component types it reads and writes.
+    Systems are grouped into stages: a system goes into the first stage after
+    every earlier-registered system it conflicts with, so conflicting systems
+    keep their registration order, while systems in the same stage touch
+    disjoint data.  ``exclusive`` systems (anything that runs arbitrary scene
+    code, e.g. input callbacks) always get a stage of their own.
+
+    With ``workers > 1`` stages with several systems run them concurrently in
+    a thread pool; otherwise everything runs on the calling thread.
+    The wall time of each system in the last frame is kept in ``timings`` (ms).
+
+    Sync callbacks (``add_sync``) run on the calling thread after every stage,
+    e.g. to apply a World's CommandBuffer.
+
+    With a ``profiler`` (``FrameProfiler``) every system run is also recorded
+    as a span of the frame.
+    """
+
+    def __init__(self, workers: int = 0, profiler=None):
+        self.systems: List[SystemEntry] = []
+        self.stages: List[List[SystemEntry]] = []
+        self.timings: Dict[str, float] = {}
+        self.profiler = profiler
+        self._sync_callbacks: List[Callable[[], None]] = []
+        self._executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="system")
+            if workers > 1
+            else None
+        )
+
+    def add_system(
+        self,
+        name: str,
+        run: Callable[[float], None],
+        reads: Iterable[type] = (),
+        writes: Iterable[type] = (),
+        exclusive: bool = False,
+    ):
+        """Register a system; ``run`` is called with the frame's delta time."""
+        if any(s.name == name for s in self.systems):
+            raise ValueError(f"System already registered: {name}")
+        self.systems.append(
+            SystemEntry(name, run, frozenset(reads), frozenset(writes), exclusive)
+        )
+        self._build_stages()
+        return self
+
+    def add_sync(self, callback: Callable[[], None]):
+        """Register a callback that runs after every stage."""
+        self._sync_callbacks.append(callback)
+        return self
+
+    def _build_stages(self):
+        stages: List[List[SystemEntry]] = []
+        placed: Dict[str, int] = {}
+        for i, system in enumerate(self.systems):
+            stage_index = 0
+            for earlier in self.systems[:i]:
+                if system.conflicts_with(earlier):
+                    stage_index = max(stage_index, placed[earlier.name] + 1)
+            if stage_index == len(stages):
+                stages.append([])
+            stages[stage_index].append(system)
+            placed[system.name] = stage_index
+        self.stages = stages
+        log.debug(
+            "Scheduler stages: %s",
+            [[s.name for s in stage] for stage in stages],
+        )
+
+    def run(self, delta_time: float):
+        """Run every stage in order."""
+        for stage in self.stages:
+            if self._executor is not None and len(stage) > 1:
+                futures = [
+                    self._executor.submit(self._run_system, system, delta_time)
+                    for system in stage
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                for system in stage:
+                    self._run_system(system, delta_time)
+            self._sync()
+
+    def _sync(self):
+        for callback in self._sync_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                log.exception("Sync callback error: %s", e)
+
+    def _run_system(self, system: SystemEntry, delta_time: float):
+        start = time.perf_counter_ns()
+        try:
+            system.run(delta_time)
+        except Exception as e:
+            log.exception("System %s error: %s", system.name, e)
+        end = time.perf_counter_ns()
+        self.timings[system.name] = (end - start) / 1e6
+        if self.profiler is not None:
+            self.profiler.record(system.name, start, end)
+
+    def shutdown(self):
+        """Stop the worker threads (if any)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -1,5 +1,13 @@
-__all__ = ["RenderSystem", "InputSystem", "SoundSystem"]
+__all__ = [
+    "AnimationSystem",
+    "RenderSystem",
+    "InputSystem",
+    "SoundSystem",
+    "TransformSystem",
+]
 
+from .animation import AnimationSystem
 from .input import InputSystem
 from .render import RenderSystem
 from .sound import SoundSystem
+from .transform import TransformSystem
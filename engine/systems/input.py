@@ -3,7 +3,13 @@ from typing import Optional
 from pygame.event import Event
 
 from config import GameConfig
-from engine.components import ButtonComponent, InputFieldComponent, Position
+from engine.components import (
+    ButtonComponent,
+    ImageComponent,
+    InputFieldComponent,
+    Position,
+)
+from engine.world import query
 from logger import get_logger
 from utils import is_point_in_rect
 
@@ -16,15 +22,21 @@ def _get_button_description(btn: ButtonComponent, pos: Position) -> str:
 
 
 class InputSystem:
+    # Component access declared to the Scheduler
+    READS = (Position, ButtonComponent, InputFieldComponent, ImageComponent)
+    WRITES = (ButtonComponent, InputFieldComponent)
+
     def __init__(self):
         self.focused_input: Optional[InputFieldComponent] = None
 
     def set_focus(self, input_component: InputFieldComponent):
         if self.focused_input:
             self.focused_input.focused = False
+            self.focused_input.touch()
         self.focused_input = input_component
         if input_component:
             input_component.focused = True
+            input_component.touch()
 
     def handle_key(self, key_event: Event):
         from pygame import K_BACKSPACE, K_RETURN
@@ -33,6 +45,7 @@ class InputSystem:
             return
         if key_event.key == K_BACKSPACE:
             self.focused_input.text = self.focused_input.text[:-1]
+            self.focused_input.touch()
         elif key_event.key == K_RETURN:
             # handled by scenes / buttons via events
             pass
@@ -42,24 +55,19 @@ class InputSystem:
                 len(self.focused_input.text) < self.focused_input.max_length
             ):
                 self.focused_input.text += ch
+                self.focused_input.touch()
 
     def handle_mouse(self, mx: int, my: int, entities: list) -> None:
         self.handle_mouse_down(mx, my, entities)
 
     def handle_mouse_down(self, mx: int, my: int, entities: list) -> None:
         """Handle mouse button DOWN event."""
-        for e in entities:
-            pos = e.get(Position)
-            btn = e.get(ButtonComponent)
-            inp = e.get(InputFieldComponent)
-            if not pos:
-                continue
-
+        for _, pos, btn, inp, img_component in query(
+            entities,
+            Position,
+            optional=(ButtonComponent, InputFieldComponent, ImageComponent),
+        ):
             if btn:
-                from engine.components import ImageComponent
-
-                img_component = e.get(ImageComponent)
-
                 half_width = btn.width // 2
                 half_height = btn.height // 2
 
@@ -74,6 +82,7 @@ class InputSystem:
                     if btn.active:
                         # Only set pressed state, do NOT trigger click yet
                         btn.pressed = True
+                        btn.touch()
                         button_desc = _get_button_description(btn, pos)
                         log.debug(
                             f"Button '{button_desc}' pressed animation started at ({mx}, {my})"
@@ -89,12 +98,10 @@ class InputSystem:
 
     def handle_mouse_up(self, mx: int, my: int, entities: list) -> None:
         """Handle mouse button UP event."""
-        for e in entities:
-            pos = e.get(Position)
-            btn = e.get(ButtonComponent)
-            if not pos or not btn:
-                continue
-
+        # Click handlers may change the scene or its entities, so they run
+        # only after the loop is done with the query results
+        clicked = []
+        for _, pos, btn in query(entities, Position, ButtonComponent):
             # Only check buttons that were pressed
             if btn.pressed:
                 # If cursor still over the button = valid click
@@ -104,7 +111,7 @@ class InputSystem:
                         log.debug(
                             f"Button '{button_desc}' click executed at ({mx}, {my})"
                         )
-                        btn.on_click()
+                        clicked.append(btn.on_click)
                     else:
                         button_desc = _get_button_description(btn, pos)
                         log.debug(
@@ -118,29 +125,25 @@ class InputSystem:
 
                 # Reset pressed state regardless
                 btn.pressed = False
+                btn.touch()
                 button_desc = _get_button_description(btn, pos)
                 log.debug(f"Button '{button_desc}' pressed animation reset")
 
+        for on_click in clicked:
+            on_click()
+
     def handle_mouse_motion(self, mx: int, my: int, entities: list) -> None:
-        # reset all button hover states first
-        for e in entities:
-            btn = e.get(ButtonComponent)
-            if btn and btn.hover:
-                btn.hover = False
-
-        # check which buttons are being hovered over
-        for e in entities:
-            pos = e.get(Position)
-            btn = e.get(ButtonComponent)
-            if not pos or not btn:
-                continue
+        # Buttons are only written (and marked changed) when hover flips
+        for _, btn, pos in query(entities, ButtonComponent, optional=(Position,)):
             # Use actual button dimensions to detect hover
-            if is_point_in_rect(mx, my, pos.x, pos.y, btn.width, btn.height):
-                if not btn.hover:  # Only log when entering hover state
-                    button_desc = _get_button_description(btn, pos)
-                    log.debug(f"Button '{button_desc}' hover started at ({mx}, {my})")
-                btn.hover = True
-            elif btn.hover:  # Only log when leaving hover state
+            hover = pos is not None and is_point_in_rect(
+                mx, my, pos.x, pos.y, btn.width, btn.height
+            )
+            if hover == btn.hover:
+                continue
+            if pos is not None:
                 button_desc = _get_button_description(btn, pos)
-                log.debug(f"Button '{button_desc}' hover ended at ({mx}, {my})")
-                btn.hover = False
+                state = "started" if hover else "ended"
+                log.debug(f"Button '{button_desc}' hover {state} at ({mx}, {my})")
+            btn.hover = hover
+            btn.touch()
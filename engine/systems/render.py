@@ -1,3 +1,5 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
 import pygame
 from pygame import Rect, draw
 from pygame.font import Font
@@ -6,12 +8,18 @@ from pygame.surface import Surface
 from config import GameConfig
 from utils import (
     apply_alpha,
-    scale_text_to_width,
-    load_font_with_fallback,
     load_image_with_fallback,
 )
 from logger import get_logger
 
+from ..alpha_cache import AlphaVariantCache
+from ..button_skins import ButtonSkinCache
+from ..draw_list import LAYER_DEFAULT, DrawList
+from ..fonts import FontRegistry
+from ..glyph_atlas import GlyphAtlas
+from ..text_cache import TextSurfaceCache
+from ..ecs import GameObject
+from ..world import query, query_changed
 from ..components import (
     AlphaComponent,
     ButtonComponent,
@@ -21,110 +29,236 @@ from ..components import (
     ImageComponent,
     InputFieldComponent,
     LabelComponent,
+    LayerComponent,
+    OverlayComponent,
     Position,
     ProgressBarComponent,
+    change_tick,
 )
 
 log = get_logger("engine/render_system")
 
+# drawer(render_system, component, position, alpha, entity) -> covered area
+Drawer = Callable[["RenderSystem", object, Position, float, GameObject], Optional[Rect]]
+# blend(entity, position, alpha) -> (position, alpha) to draw with
+Blend = Callable[[GameObject, Position, float], Tuple[Position, float]]
+# (row index, drawer) for every drawable component an entity has, in draw order
+DrawPlan = Tuple[Tuple[int, Drawer], ...]
+
+# Row layout: (entity, Position, AlphaComponent, LayerComponent, *drawables)
+_FIRST_DRAWABLE = 4
+
 
 class RenderSystem:
-    def __init__(self, screen: Surface, font: Font):
+    # Drawable component type -> drawer, in draw order (see register_drawer)
+    _drawers: Dict[type, Drawer] = {}
+    # Optional components fetched with Position for every row
+    _row_components: Tuple[type, ...] = (AlphaComponent, LayerComponent)
+
+    # Component access declared to the Scheduler
+    READS = (Position,) + _row_components
+    # Measured button size
+    WRITES = (ButtonComponent,)
+
+    def __init__(
+        self,
+        screen: Surface,
+        font: Font,
+        use_dirty_rects: bool = False,
+        fonts: Optional[FontRegistry] = None,
+    ):
         self.screen = screen
         self.font = font
-        # Load custom fonts from file paths for headers, fallback to system if custom fails
-        self.h1_font = load_font_with_fallback(GameConfig.H1_FONT_SIZE)
-        self.h2_font = load_font_with_fallback(GameConfig.H2_FONT_SIZE)
-        self.h3_font = load_font_with_fallback(GameConfig.H3_FONT_SIZE)
-        self.shortcut_font = load_font_with_fallback(GameConfig.BUTTON_TAG_FONT_SIZE)
+        # Fonts are shared through the app's registry (a private one otherwise)
+        self.fonts = fonts if fonts is not None else FontRegistry()
+        # Custom fonts for headers, fallback to system if custom fails
+        self.h1_font = self.fonts.get(GameConfig.H1_FONT_SIZE)
+        self.h2_font = self.fonts.get(GameConfig.H2_FONT_SIZE)
+        self.h3_font = self.fonts.get(GameConfig.H3_FONT_SIZE)
+        self.shortcut_font = self.fonts.get(GameConfig.BUTTON_TAG_FONT_SIZE)
+        self.input_font = self.fonts.system(
+            GameConfig.DEFAULT_FONT, GameConfig.INPUT_FIELD_FONT_SIZE
+        )
+        # Rendered text is reused until its font/text/color changes
+        self.text_cache = TextSurfaceCache()
+        # Frequently changing text is composed glyph by glyph instead
+        self.glyph_atlases: Dict[tuple, GlyphAtlas] = {}
+        # Every translucent draw goes through here: variants are cached per
+        # quantized alpha step, so fades allocate nothing per frame
+        self.alpha_cache = AlphaVariantCache()
+        self.button_skins = ButtonSkinCache()
+        # Stand-in text surface for buttons without text (only its size is used)
+        self._no_text = pygame.Surface((1, 1), pygame.SRCALPHA)
+        # Pre-rendered modal panels by (size, colors, radius)
+        self._panels: Dict[tuple, Surface] = {}
+
+        # During update() the draw_* methods queue their output on the draw
+        # list (on the layer of the entity being drawn) instead of drawing
+        self.draw_list = DrawList()
+        self._deferred = False
+        # Command list of the layer being drawn (set per entity while deferred)
+        self._commands: List = []
+        # Draws entities between two simulation ticks (fixed-timestep mode)
+        self.blend: Optional[Blend] = None
+
+        # Dirty-rect mode: update() clears and redraws only changed regions
+        # itself and reports them in dirty_rects (None in full-redraw mode,
+        # where the caller clears the screen every frame)
+        self.use_dirty_rects = use_dirty_rects
+        self.dirty_rects: Optional[List[Rect]] = None
+        self._full_redraw = True
+        self._since = 0
+        # Entity -> screen area it covered when last drawn
+        self._drawn: Dict[GameObject, Rect] = {}
+        # Entity collection and its (length, structure version) at the last frame
+        self._last_entities = None
+        self._last_version = None
+
+        # Draw plans by which drawables a row has, and the plans of the last
+        # row list (a World hands out the same list until its structure changes)
+        self._plans: Dict[Tuple[bool, ...], DrawPlan] = {}
+        self._plan_drawers: Optional[Dict[type, Drawer]] = None
+        self._plan_rows: Optional[List[tuple]] = None
+        self._row_plans: List[DrawPlan] = []
+
+    # ------------------------------------------------------------------
+    # Drawer registration
+    # ------------------------------------------------------------------
+    @classmethod
+    def register_drawer(
+        cls, component_type: type, drawer: Drawer, before: Optional[type] = None
+    ):
+        """
+        Draw every entity with a ``component_type`` using ``drawer``.
+
+        ``drawer(render_system, component, position, alpha, entity)`` draws
+        through the ``render_system`` (``draw_*`` methods or its ``_blit``
+        helpers) and returns the screen area it covered.  Drawers run in
+        registration order; ``before`` inserts the new one ahead of another
+        registered type.  Registering a type again replaces its drawer.
+        Register before ``GameApp`` is created so the scheduler sees the
+        component in ``READS``.
+        """
+        drawers = {t: d for t, d in cls._drawers.items() if t is not component_type}
+        if before is not None and before in drawers:
+            ordered: Dict[type, Drawer] = {}
+            for t, d in drawers.items():
+                if t is before:
+                    ordered[component_type] = drawer
+                ordered[t] = d
+            drawers = ordered
+        else:
+            drawers[component_type] = drawer
+        cls._set_drawers(drawers)
+
+    @classmethod
+    def unregister_drawer(cls, component_type: type):
+        """Stop drawing ``component_type``."""
+        cls._set_drawers(
+            {t: d for t, d in cls._drawers.items() if t is not component_type}
+        )
 
-    def draw_label(self, label: LabelComponent, position: Position, alpha: float = 1.0):
-        surf = self.font.render(label.text, True, label.color)
+    @classmethod
+    def _set_drawers(cls, drawers: Dict[type, Drawer]):
+        # A new dict (never mutated) so instances notice the change by identity
+        cls._drawers = drawers
+        cls._row_components = (AlphaComponent, LayerComponent) + tuple(drawers)
+        cls.READS = (Position,) + cls._row_components
+
+    # ------------------------------------------------------------------
+    # Drawing primitives: immediate, or queued on the draw list in update()
+    # ------------------------------------------------------------------
+    def _blit(self, surface: Surface, rect: Rect) -> Rect:
+        """Blit ``surface`` at ``rect`` (a rect of the surface's own size)."""
+        if self._deferred:
+            self._commands.append((surface, rect))
+            return rect
+        return self.screen.blit(surface, rect)
+
+    def _blits(self, sequence: List[tuple], rect: Rect) -> Rect:
+        if self._deferred:
+            self._commands.extend(sequence)
+            return rect
+        self.screen.blits(sequence, doreturn=False)
+        return rect
+
+    def _call(self, func: Callable[[Surface], object], rect: Rect) -> Rect:
+        if self._deferred:
+            self._commands.append(func)
+            return rect
+        drawn = func(self.screen)
+        return drawn if isinstance(drawn, Rect) else rect
+
+    def glyph_atlas(self, font: Font, color) -> GlyphAtlas:
+        """Get the shared glyph atlas for ``font`` in ``color``."""
+        key = (font, tuple(color))
+        atlas = self.glyph_atlases.get(key)
+        if atlas is None:
+            atlas = self.glyph_atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def draw_dynamic_text(
+        self, font: Font, text: str, color, center, alpha: float = 1.0
+    ) -> Rect:
+        """Draw ``text`` from the glyph atlas (no per-string render or cache entry)."""
+        atlas = self.glyph_atlas(font, color)
+        # Lay out first: new characters rebuild the atlas into a new surface
+        atlas.size(text)
+        # The atlas surface is immutable, so its translucent variants are cached
+        source = self.alpha_cache.get(atlas.surface, alpha)
+        rect, sequence = atlas.compose(text, center, source)
+        return self._blits(sequence, rect)
 
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
+    def draw_label(self, label: LabelComponent, position: Position, alpha: float = 1.0):
+        if label.dynamic:
+            return self.draw_dynamic_text(
+                self.font, label.text, label.color, (position.x, position.y), alpha
             )
-            surf = temp_surf
+
+        surf = self.text_cache.render(self.font, label.text, label.color)
+        surf = self.alpha_cache.get(surf, alpha)
 
         rect = surf.get_rect(center=(position.x, position.y))
-        self.screen.blit(surf, rect)
+        return self._blit(surf, rect)
 
     def draw_h1(self, h1: H1Component, position: Position, alpha: float = 1.0):
         from config import GameConfig
 
-        surf = self.h1_font.render(h1.text, True, h1.color)
+        # Text too wide for the screen is scaled down (the cache keeps the result)
+        surf = self.text_cache.render(
+            self.h1_font, h1.text, h1.color, max_width=GameConfig.TEXT_MAX_WIDTH
+        )
 
-        # Check if the text is too wide for the screen and scale if necessary
-        max_width = (
-            GameConfig.TEXT_MAX_WIDTH
-        )  # Maximum width for H1 text (less than full screen width)
-        surf = scale_text_to_width(surf, max_width)
-
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            surf = temp_surf
+        surf = self.alpha_cache.get(surf, alpha)
 
         rect = surf.get_rect(center=(position.x, position.y))
-        self.screen.blit(surf, rect)
+        return self._blit(surf, rect)
 
     def draw_h2(self, h2: H2Component, position: Position, alpha: float = 1.0):
         from config import GameConfig
 
-        surf = self.h2_font.render(h2.text, True, h2.color)
-
-        # Check if the text is too wide for the screen and scale if necessary
-        max_width = GameConfig.TEXT_MAX_WIDTH
-        surf = scale_text_to_width(surf, max_width)
+        # Text too wide for the screen is scaled down (the cache keeps the result)
+        surf = self.text_cache.render(
+            self.h2_font, h2.text, h2.color, max_width=GameConfig.TEXT_MAX_WIDTH
+        )
 
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            surf = temp_surf
+        surf = self.alpha_cache.get(surf, alpha)
 
         rect = surf.get_rect(center=(position.x, position.y))
-        self.screen.blit(surf, rect)
+        return self._blit(surf, rect)
 
     def draw_h3(self, h3: H3Component, position: Position, alpha: float = 1.0):
         from config import GameConfig
 
-        surf = self.h3_font.render(h3.text, True, h3.color)
+        # Text too wide for the screen is scaled down (the cache keeps the result)
+        surf = self.text_cache.render(
+            self.h3_font, h3.text, h3.color, max_width=GameConfig.TEXT_MAX_WIDTH
+        )
 
-        # Check if the text is too wide for the screen and scale if necessary
-        max_width = GameConfig.TEXT_MAX_WIDTH
-        surf = scale_text_to_width(surf, max_width)
-
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            surf = temp_surf
+        surf = self.alpha_cache.get(surf, alpha)
 
         rect = surf.get_rect(center=(position.x, position.y))
-        self.screen.blit(surf, rect)
+        return self._blit(surf, rect)
 
     def draw_input(
         self, inp: InputFieldComponent, position: Position, alpha: float = 1.0
@@ -132,35 +266,26 @@ class RenderSystem:
         text = inp.text if inp.text else inp.placeholder
         text_color = GameConfig.TEXT_COLOR if inp.text else GameConfig.HINT_COLOR[:3]
 
-        large_font = pygame.font.SysFont(
-            GameConfig.DEFAULT_FONT, GameConfig.INPUT_FIELD_FONT_SIZE
+        large_font = self.input_font
+        # Typed text changes with every key, so it is composed from glyphs
+        text_rect = self.draw_dynamic_text(
+            large_font, f"> {text}", text_color, (position.x, position.y), alpha
         )
-        surf = large_font.render(f"> {text}", True, text_color)
-
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            surf = temp_surf
-
-        rect = surf.get_rect(center=(position.x, position.y))
-        self.screen.blit(surf, rect)
 
         underline_y = position.y + int(large_font.get_linesize() / 1.8)
 
         input_width = GameConfig.INPUT_FIELD_WIDTH
-        draw.line(
-            self.screen,
-            GameConfig.INPUT_UNDERLINE_COLOR,
-            (position.x - input_width, underline_y),
-            (position.x + input_width, underline_y),
-            4,
+        start = (position.x - input_width, underline_y)
+        end = (position.x + input_width, underline_y)
+        # Area covered by a horizontal 4px line (what draw.line reports)
+        line_rect = Rect(start[0], underline_y - 1, end[0] - start[0] + 1, 4)
+        line_rect = self._call(
+            lambda target: draw.line(
+                target, GameConfig.INPUT_UNDERLINE_COLOR, start, end, 4
+            ),
+            line_rect,
         )
+        return text_rect.union(line_rect)
 
     def draw_button(
         self, button: ButtonComponent, position: Position, alpha: float = 1.0
@@ -174,18 +299,11 @@ class RenderSystem:
 
         # Handle text rendering
         if button.text:
-            surf = self.font.render(button.text, True, color)
+            surf = self.text_cache.render(self.font, button.text, color)
         else:
-            surf = pygame.Surface((1, 1), pygame.SRCALPHA)
+            surf = self._no_text
 
-        # Apply transparency if alpha is less than 1.0
-        if alpha < 1.0:
-            temp_surf = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(surf, (0, 0))
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            surf = temp_surf
+        surf = self.alpha_cache.get(surf, alpha)
 
         text_rect = surf.get_rect(center=(position.x, position.y))
         pad = GameConfig.BUTTON_PADDING
@@ -215,70 +333,35 @@ class RenderSystem:
                 else GameConfig.BUTTON_BG_COLOR
             )
 
-        shadow_color = tuple(max(c - 40, 0) for c in bg_color)
-
-        if alpha < 1.0:
-            bg_color = apply_alpha(bg_color, alpha)
-            shadow_color = apply_alpha(shadow_color, alpha)
-
-        # Shadow under the button (a bit lower)
-        shadow_offset = 3
-        shadow_rect = box.move(0, shadow_offset)
-        draw.rect(
-            self.screen,
-            shadow_color,
-            shadow_rect,
-            border_radius=GameConfig.BUTTON_RADIUS,
-        )
-
-        # Main button box
-        draw.rect(
-            self.screen,
+        # Shadow, box and highlight gradient come pre-rendered as one skin
+        skin = self.button_skins.get(
+            box.width,
+            box.height,
             bg_color,
-            box,
-            border_radius=GameConfig.BUTTON_RADIUS,
-        )
-
-        # Soft gradient highlight
-        highlight_height = max(4, box.height // 2)  # top half of the button
-        highlight_surf = pygame.Surface(
-            (box.width - 4, highlight_height), pygame.SRCALPHA
-        )
-
-        # Draw a vertical gradient
-        max_alpha = 70
-        for y in range(highlight_height):
-            t = y / highlight_height  # 0..1
-            a = int(max_alpha * (1.0 - t))  # from max_alpha to 0
-            pygame.draw.line(
-                highlight_surf,
-                (255, 255, 255, a),
-                (0, y),
-                (highlight_surf.get_width(), y),
-            )
-
-        self.screen.blit(
-            highlight_surf,
-            (box.left + 2, box.top + 2),
+            GameConfig.BUTTON_RADIUS,
+            self.alpha_cache.quantize(alpha) if alpha < 1.0 else 255,
         )
+        drawn = self._blit(skin, skin.get_rect(topleft=box.topleft))
 
         if button.text:
             text_rect = surf.get_rect(center=box.center)
-            self.screen.blit(surf, text_rect)
+            drawn = drawn.union(self._blit(surf, text_rect))
 
         # Keyboard shortcut tag (как было)
         if button.keyboard_shortcut:
-            shortcut_surf = self.shortcut_font.render(
-                button.keyboard_shortcut, True, GameConfig.SHORTCUT_TAG_COLOR
+            shortcut_surf = self.text_cache.render(
+                self.shortcut_font,
+                button.keyboard_shortcut,
+                GameConfig.SHORTCUT_TAG_COLOR,
             )
             shortcut_rect = shortcut_surf.get_rect()
-            shortcut_x = box.right - shortcut_rect.width - 4
-            shortcut_y = box.top + 2
-            self.screen.blit(shortcut_surf, (shortcut_x, shortcut_y))
+            shortcut_rect.topleft = (box.right - shortcut_rect.width - 4, box.top + 2)
+            drawn = drawn.union(self._blit(shortcut_surf, shortcut_rect))
 
         # Store button dimensions for click detection
         button.width = box.width
         button.height = box.height
+        return drawn
 
     def draw_progress_bar(
         self, progress_bar: ProgressBarComponent, position: Position, alpha: float = 1.0
@@ -291,27 +374,19 @@ class RenderSystem:
             bg_color = progress_bar.color
             fill_color = progress_bar.fill_color
 
-        # Draw the background
+        # Background rect
         bg_rect = Rect(
             progress_bar.x - progress_bar.width // 2,
             progress_bar.y - progress_bar.height // 2,
             progress_bar.width,
             progress_bar.height,
         )
-        draw.rect(self.screen, bg_color, bg_rect)
 
-        # Draw the filled portion
+        # Filled portion
         fill_width = int(progress_bar.width * progress_bar.progress)
-        if fill_width > 0:
-            fill_rect = Rect(
-                progress_bar.x - progress_bar.width // 2,
-                progress_bar.y - progress_bar.height // 2,
-                fill_width,
-                progress_bar.height,
-            )
-            draw.rect(self.screen, fill_color, fill_rect)
+        fill_rect = Rect(bg_rect.x, bg_rect.y, fill_width, progress_bar.height)
 
-        # Draw border (also affected by alpha)
+        # Border (also affected by alpha)
         if alpha < 1.0:
             border_color = tuple(
                 int(c * alpha) for c in GameConfig.PROGRESS_BAR_BORDER_COLOR
@@ -319,15 +394,53 @@ class RenderSystem:
         else:
             border_color = GameConfig.PROGRESS_BAR_BORDER_COLOR
 
-        draw.rect(
-            self.screen,
-            border_color,
-            bg_rect,
-            2,
-            border_radius=GameConfig.PROGRESS_BAR_BORDER_RADIUS,
+        def paint(target: Surface):
+            drawn = draw.rect(target, bg_color, bg_rect)
+            if fill_width > 0:
+                draw.rect(target, fill_color, fill_rect)
+            draw.rect(
+                target,
+                border_color,
+                bg_rect,
+                2,
+                border_radius=GameConfig.PROGRESS_BAR_BORDER_RADIUS,
+            )
+            return drawn
+
+        return self._call(paint, bg_rect)
+
+    def draw_overlay(
+        self, overlay: OverlayComponent, position: Position, alpha: float = 1.0
+    ):
+        key = (
+            overlay.width,
+            overlay.height,
+            tuple(overlay.color),
+            tuple(overlay.border_color),
+            overlay.border_radius,
         )
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = pygame.Surface((overlay.width, overlay.height), pygame.SRCALPHA)
+            box = panel.get_rect()
+            draw.rect(panel, overlay.color, box, border_radius=overlay.border_radius)
+            draw.rect(
+                panel, overlay.border_color, box, 2, border_radius=overlay.border_radius
+            )
+            self._panels[key] = panel
+
+        panel = self.alpha_cache.get(panel, alpha)
+
+        rect = panel.get_rect(center=(position.x, position.y))
+        return self._blit(panel, rect)
 
-    def draw_image(self, image: ImageComponent, position: Position, alpha: float = 1.0):
+    def draw_image(
+        self,
+        image: ImageComponent,
+        position: Position,
+        alpha: float = 1.0,
+        y_offset: int = 0,
+    ):
         # Load the image if not already loaded
         if image.pygame_image is None:
             image.pygame_image = load_image_with_fallback(
@@ -342,99 +455,229 @@ class RenderSystem:
                 image.pygame_image, (255, 0, 255), pygame.Rect(0, 0, 50, 50)
             )  # Magenta for error
 
-        # Create a temporary surface for alpha transparency
-        if alpha < 1.0:
-            # Create a temporary surface with per-pixel alpha
-            temp_surf = pygame.Surface(image.pygame_image.get_size(), pygame.SRCALPHA)
-            temp_surf.blit(image.pygame_image, (0, 0))
-            # Make it transparent
-            temp_surf.fill(
-                (255, 255, 255, int(255 * alpha)), special_flags=pygame.BLEND_RGBA_MULT
-            )
-            img = temp_surf
-        else:
-            img = image.pygame_image
+        img = self.alpha_cache.get(image.pygame_image, alpha)
 
         # Calculate position to center the image
-        rect = img.get_rect(center=(position.x, position.y))
-        self.screen.blit(img, rect)
+        rect = img.get_rect(center=(position.x, position.y + y_offset))
+        return self._blit(img, rect)
 
     def update(self, entities: list):
-        for e in entities:
-            pos: Position = e.get(Position)
-            if not pos:
-                continue
-
-            # Get alpha component if it exists
-            alpha_comp = e.get(AlphaComponent)
-            alpha = alpha_comp.alpha if alpha_comp else 1.0
-
-            # Update alpha component if it exists (for smooth transitions)
-            if alpha_comp:
-                old_alpha = alpha_comp.alpha
-                # Update alpha with smooth animation towards target
-                if alpha_comp.alpha < alpha_comp.target_alpha:
-                    alpha_comp.alpha = min(
-                        alpha_comp.alpha + alpha_comp.animation_speed * 0.016,
-                        alpha_comp.target_alpha,
-                    )
-                elif alpha_comp.alpha > alpha_comp.target_alpha:
-                    alpha_comp.alpha = max(
-                        alpha_comp.alpha - alpha_comp.animation_speed * 0.016,
-                        alpha_comp.target_alpha,
-                    )
-
-                # Log transparency changes if significant
-                if abs(alpha_comp.alpha - old_alpha) > 0.01:
-                    log.debug(
-                        f"Alpha component updated: {old_alpha:.3f} -> {alpha_comp.alpha:.3f}"
-                    )
-
-            h1 = e.get(H1Component)
-            if h1:
-                self.draw_h1(h1, pos, alpha)
-            h2 = e.get(H2Component)
-            if h2:
-                self.draw_h2(h2, pos, alpha)
-            h3 = e.get(H3Component)
-            if h3:
-                self.draw_h3(h3, pos, alpha)
-
-            label = e.get(LabelComponent)
-            if label:
-                self.draw_label(label, pos, alpha)
-            inp = e.get(InputFieldComponent)
-            if inp:
-                self.draw_input(inp, pos, alpha)
-            btn = e.get(ButtonComponent)
-            img = e.get(ImageComponent)
-
-            # If this entity has both button and image components, handle press animation together
-            if btn and img:
-                # Calculate press offset for the image to match button press animation
-                press_offset = 2 if getattr(btn, "pressed", False) and btn.active else 0
-                adjusted_pos = Position(pos.x, pos.y + press_offset)
-                self.draw_button(
-                    btn, pos, alpha
-                )  # Button draws with its own internal offset
-                self.draw_image(
-                    img, adjusted_pos, alpha
-                )  # Image drawn with matching offset
+        # Alpha and progress are animated beforehand by the AnimationSystem
+        rows = query(entities, Position, optional=self._row_components)
+        if self.use_dirty_rects:
+            self._update_dirty(entities, rows)
+            return
+
+        self._submit(rows, self._plans_for(rows))
+        self.draw_list.flush(self.screen)
+
+    def _submit(
+        self, rows: List[tuple], plans: Optional[List[DrawPlan]] = None
+    ) -> List[Optional[Rect]]:
+        """Queue the draw commands of ``rows``; returns the area of each row."""
+        if plans is None:
+            plans = [self._plan(row) for row in rows]
+        self._deferred = True
+        try:
+            return [self._draw_row(row, plan) for row, plan in zip(rows, plans)]
+        finally:
+            self._deferred = False
+            self._commands = []
+
+    def _plans_for(self, rows: List[tuple]) -> List[DrawPlan]:
+        """Get the draw plan of every row, reusing them while ``rows`` is unchanged."""
+        if rows is not self._plan_rows or self._plan_drawers is not self._drawers:
+            self._row_plans = [self._plan(row) for row in rows]
+            self._plan_rows = rows
+        return self._row_plans
+
+    def _plan(self, row: tuple) -> DrawPlan:
+        """Get the drawers for the drawable components present in ``row``."""
+        if self._plan_drawers is not self._drawers:
+            self._plans = {}
+            self._plan_drawers = self._drawers
+        present = tuple(c is not None for c in row[_FIRST_DRAWABLE:])
+        plan = self._plans.get(present)
+        if plan is None:
+            plan = self._plans[present] = tuple(
+                (_FIRST_DRAWABLE + i, drawer)
+                for i, (has, drawer) in enumerate(zip(present, self._drawers.values()))
+                if has
+            )
+        return plan
+
+    def _draw_row(self, row: tuple, plan: DrawPlan) -> Optional[Rect]:
+        """Draw one entity; returns the screen area it covered (if known)."""
+        e, pos, alpha_comp, layer = row[0], row[1], row[2], row[3]
+        # Get alpha component if it exists
+        alpha = alpha_comp.alpha if alpha_comp else 1.0
+        if self.blend is not None:
+            pos, alpha = self.blend(e, pos, alpha)
+        if self._deferred:
+            self._commands = self.draw_list.layer(
+                layer.layer if layer else LAYER_DEFAULT
+            )
+
+        rects = []
+        for index, drawer in plan:
+            rect = drawer(self, row[index], pos, alpha, e)
+            if isinstance(rect, Rect) and rect.width and rect.height:
+                rects.append(rect)
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    # ------------------------------------------------------------------
+    # Skipping unchanged frames / dirty-rect mode
+    # ------------------------------------------------------------------
+    def needs_redraw(self, entities: list) -> bool:
+        """
+        Check whether the next frame would differ from the last one drawn.
+
+        True when a drawn component changed since the previous call (change
+        ticks), an entity was added or removed, or ``invalidate()`` was called.
+        Used by the full-redraw path to skip drawing and presenting idle frames.
+        """
+        since, self._since = self._since, change_tick()
+        structure = (len(entities), getattr(entities, "structure_version", None))
+        if (
+            self._full_redraw
+            or entities is not self._last_entities
+            or structure != self._last_version
+        ):
+            self._full_redraw = False
+            self._last_entities = entities
+            self._last_version = structure
+            return True
+        return bool(
+            query_changed(entities, since, Position, optional=self._row_components)
+        )
+
+    def invalidate(self):
+        """Redraw the whole screen on the next dirty-rect update."""
+        self._full_redraw = True
+
+    def _update_dirty(self, entities: list, rows: List[tuple]):
+        """
+        Redraw only the screen regions whose entities changed.
+
+        An entity is dirty when any of its drawn components changed since the
+        last update (change ticks), or when it left the scene.  Its old and
+        new screen areas are cleared and every entity overlapping them is
+        redrawn, clipped to the area, in the usual draw order.
+        """
+        since, self._since = self._since, change_tick()
+        changed = query_changed(
+            entities, since, Position, optional=self._row_components
+        )
+
+        removed = []
+        structure = (len(entities), getattr(entities, "structure_version", None))
+        if entities is not self._last_entities or structure != self._last_version:
+            present = {row[0] for row in rows}
+            removed = [e for e in self._drawn if e not in present]
+            self._last_entities = entities
+            self._last_version = structure
+
+        if not changed and not removed and not self._full_redraw:
+            self.dirty_rects = []
+            return
+
+        screen_rect = self.screen.get_rect()
+        # Mostly-changed frames (scene fades, scene switches) are cheaper in full
+        if self._full_redraw or len(changed) * 2 > len(rows):
+            self._redraw_all(rows)
+            self.dirty_rects = [screen_rect]
+            return
+
+        dirty = [self._drawn.pop(e) for e in removed if e in self._drawn]
+        for row in changed:
+            old = self._drawn.get(row[0])
+            if old is not None:
+                dirty.append(old)
+            new = self._measure(row)
+            if new is not None:
+                self._drawn[row[0]] = new
+                dirty.append(new)
             else:
-                if btn:
-                    self.draw_button(btn, pos, alpha)
-                if img:
-                    self.draw_image(img, pos, alpha)
-            pb = e.get(ProgressBarComponent)
-            if pb:
-                # Update progress with smooth animation towards target
-                if pb.progress < pb.target_progress:
-                    pb.progress = min(
-                        pb.progress + pb.animation_speed * 0.016, pb.target_progress
-                    )  # 0.016 is roughly 60fps
-                elif pb.progress > pb.target_progress:
-                    pb.progress = max(
-                        pb.progress - pb.animation_speed * 0.016, pb.target_progress
-                    )
-
-                self.draw_progress_bar(pb, pos, alpha)
+                self._drawn.pop(row[0], None)
+
+        dirty = _merge_rects([r.clip(screen_rect) for r in dirty])
+        dirty_area = sum(r.width * r.height for r in dirty)
+        if dirty_area * 2 > screen_rect.width * screen_rect.height:
+            self._redraw_all(rows)
+            self.dirty_rects = [screen_rect]
+            return
+
+        background = GameConfig.BACKGROUND_COLOR
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.fill(background, area)
+            overlapping = []
+            for row in rows:
+                rect = self._drawn.get(row[0])
+                if rect is not None and rect.colliderect(area):
+                    overlapping.append(row)
+            self._submit(overlapping)
+            self.draw_list.flush(self.screen)
+        self.screen.set_clip(None)
+        self.dirty_rects = dirty
+
+    def _redraw_all(self, rows: List[tuple]):
+        self._full_redraw = False
+        self.screen.fill(GameConfig.BACKGROUND_COLOR)
+        self._drawn = {}
+        for row, rect in zip(rows, self._submit(rows, self._plans_for(rows))):
+            if rect is not None:
+                self._drawn[row[0]] = rect
+        self.draw_list.flush(self.screen)
+
+    def _measure(self, row: tuple) -> Optional[Rect]:
+        """Get the area an entity will cover by queuing and dropping its commands."""
+        rect = self._submit([row])[0]
+        self.draw_list.clear()
+        return rect
+
+
+def _merge_rects(rects: List[Rect]) -> List[Rect]:
+    """Union overlapping rects so no area is cleared and redrawn twice."""
+    merged: List[Rect] = []
+    for rect in rects:
+        if not (rect.width and rect.height):
+            continue
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect = rect.union(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+def _draw_image(render: RenderSystem, image, position, alpha, e) -> Optional[Rect]:
+    # An image on a button moves with the button's press animation
+    btn = e.components.get(ButtonComponent)
+    press_offset = 2 if btn and getattr(btn, "pressed", False) and btn.active else 0
+    return render.draw_image(image, position, alpha, press_offset)
+
+
+def _method_drawer(name: str) -> Drawer:
+    """Drawer calling ``render_system.<name>(component, position, alpha)``."""
+
+    def drawer(render: RenderSystem, component, position, alpha, e):
+        return getattr(render, name)(component, position, alpha)
+
+    return drawer
+
+
+# Built-in drawers, in draw order (panels first, images over their buttons)
+for _component_type, _drawer in (
+    (OverlayComponent, _method_drawer("draw_overlay")),
+    (H1Component, _method_drawer("draw_h1")),
+    (H2Component, _method_drawer("draw_h2")),
+    (H3Component, _method_drawer("draw_h3")),
+    (LabelComponent, _method_drawer("draw_label")),
+    (InputFieldComponent, _method_drawer("draw_input")),
+    (ButtonComponent, _method_drawer("draw_button")),
+    (ImageComponent, _draw_image),
+    (ProgressBarComponent, _method_drawer("draw_progress_bar")),
+):
+    RenderSystem.register_drawer(_component_type, _drawer)
+del _component_type, _drawer
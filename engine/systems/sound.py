@@ -4,6 +4,7 @@ import pygame
 from typing import Dict
 
 from engine.components import SoundComponent
+from engine.world import query
 from logger import get_logger
 
 log = get_logger("engine/sound_system")
@@ -12,6 +13,10 @@ log = get_logger("engine/sound_system")
 class SoundSystem:
     """System to handle sound playback."""
 
+    # Component access declared to the Scheduler
+    READS = (SoundComponent,)
+    WRITES = (SoundComponent,)
+
     def __init__(self):
         pygame.mixer.init()
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
@@ -59,9 +64,8 @@ class SoundSystem:
 
     def update(self, entities: list):
         """Process all entities with SoundComponents."""
-        for entity in entities:
-            sound_component = entity.get(SoundComponent)
-            if sound_component and sound_component.play_on_add:
+        for _, sound_component in query(entities, SoundComponent):
+            if sound_component.play_on_add:
                 # Play the sound and then disable play_on_add to avoid repeated playing
                 self.play_sound(sound_component.sound_name, sound_component.volume)
                 sound_component.play_on_add = False
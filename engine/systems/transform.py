@@ -0,0 +1,54 @@
+"""Keeps the world Position of child entities in sync with their parents."""
+
+from typing import Dict
+
+from engine.components import HierarchyComponent, Position, change_tick
+from engine.ecs import GameObject
+from engine.hierarchy import propagate
+from engine.world import query_changed
+from logger import get_logger
+
+log = get_logger("engine/transform_system")
+
+
+class TransformSystem:
+    """
+    Propagates moved containers to their children.
+
+    Only subtrees whose root entity changed since the last update are
+    visited: a moved parent (Position changed), a child with a new local
+    offset (HierarchyComponent changed) or a newly attached entity.  Entities
+    without a HierarchyComponent are never looked at.
+    """
+
+    # Component access declared to the Scheduler
+    READS = (Position, HierarchyComponent)
+    WRITES = (Position,)
+
+    def __init__(self):
+        # Every change up to this tick is already reflected in world positions
+        self._since = 0
+
+    def update(self, entities: list):
+        dirty: Dict[GameObject, None] = dict.fromkeys(
+            e
+            for e, _, _ in query_changed(
+                entities, self._since, Position, HierarchyComponent
+            )
+        )
+        for e in dirty:
+            # The subtree is recomputed from its topmost dirty ancestor anyway
+            if not self._has_dirty_ancestor(e, dirty):
+                propagate(e)
+        # Taken after the pass so our own Position writes are not seen as changes
+        self._since = change_tick()
+
+    @staticmethod
+    def _has_dirty_ancestor(e: GameObject, dirty: Dict[GameObject, None]) -> bool:
+        parent = e.get(HierarchyComponent).parent
+        while parent is not None:
+            if parent in dirty:
+                return True
+            node = parent.get(HierarchyComponent)
+            parent = node.parent if node is not None else None
+        return False
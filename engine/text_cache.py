@@ -0,0 +1,98 @@
+"""LRU cache of pre-rendered text surfaces."""
+
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from pygame.font import Font
+from pygame.surface import Surface
+
+from config import GameConfig
+from logger import get_logger
+from utils import scale_text_to_width
+
+log = get_logger("engine/text_cache")
+
+# (font, text, color, antialias, max_width)
+TextKey = Tuple[Hashable, str, tuple, bool, Optional[int]]
+
+
+def _surface_bytes(surface: Surface) -> int:
+    """Approximate pixel memory of a surface (0 if it can't be measured)."""
+    try:
+        return int(surface.get_pitch() * surface.get_height())
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+class TextSurfaceCache:
+    """
+    Keeps rendered text surfaces so unchanged text is rasterized only once.
+
+    Entries are keyed on (font, text, color, antialias, max_width) - with
+    ``max_width`` set the cached surface is the result of
+    ``scale_text_to_width``.  When the pixel memory of all entries exceeds
+    ``max_bytes`` the least recently used ones are evicted.  Counters are
+    available through ``stats()``.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = (
+            GameConfig.TEXT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self._entries: "OrderedDict[TextKey, Tuple[Surface, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(
+        self,
+        font: Font,
+        text: str,
+        color,
+        antialias: bool = True,
+        max_width: Optional[int] = None,
+    ) -> Surface:
+        """Get ``font.render(text, antialias, color)``, rendering only on a miss."""
+        key = (font, text, tuple(color), antialias, max_width)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        if max_width is not None:
+            surface = scale_text_to_width(surface, max_width)
+        size = _surface_bytes(surface)
+        self._entries[key] = (surface, size)
+        self.bytes += size
+        self._evict()
+        return surface
+
+    def _evict(self):
+        # The newest entry always stays, even if it alone exceeds the budget
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached surface (counters are kept)."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Get the hit/miss/eviction counters and the current memory use."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,126 @@
+"""Fixed-timestep simulation: tick accounting and render interpolation."""
+
+from typing import Dict, Optional, Tuple
+
+from .components import AlphaComponent, Position, change_tick
+from .ecs import GameObject
+from .world import query, query_changed
+from logger import get_logger
+
+log = get_logger("engine/timestep")
+
+# (x, y, alpha) of an entity at the end of a tick
+State = Tuple[float, float, float]
+
+
+class FixedTimestep:
+    """
+    Turns variable frame times into a whole number of fixed simulation steps.
+
+    Frame time is collected in an accumulator; every full ``step`` in it is
+    one simulation tick.  What is left over is kept for the next frame and
+    exposed as ``alpha`` (0..1), how far rendering is between the last two
+    ticks.
+
+    At most ``max_steps`` ticks run per frame.  When a frame took longer
+    than that, the rest of the backlog is dropped instead of being caught up
+    later (the "spiral of death": slow ticks making the next frame slower).
+    """
+
+    def __init__(self, rate: float, max_steps: int = 5):
+        if rate <= 0:
+            raise ValueError(f"Tick rate must be positive, got {rate}")
+        self.step = 1.0 / rate
+        self.max_steps = max(1, max_steps)
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        # Simulation time thrown away by the catch-up cap (seconds)
+        self.dropped = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """Add one frame's time; returns the number of ticks to run now."""
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.step
+            self.dropped += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+            log.debug(f"Simulation behind: dropped {dropped * 1000:.1f} ms")
+        self.accumulator -= steps * self.step
+        self.alpha = min(self.accumulator / self.step, 1.0)
+        return steps
+
+
+class StateInterpolator:
+    """
+    Blends Position and alpha between the last two simulation ticks.
+
+    Only entities whose Position or AlphaComponent changed during the last
+    tick are blended (found through change ticks); everything else is drawn
+    as it is.  ``blend()`` is given to the RenderSystem, which calls it for
+    every drawn entity.
+    """
+
+    def __init__(self):
+        # State of every entity at the end of the last tick
+        self._state: Dict[GameObject, State] = {}
+        # Entities that changed in the last tick -> their state before it
+        self._previous: Dict[GameObject, State] = {}
+        self._since = 0
+        self._entities = None
+        self._version = None
+        # How far rendering is from the previous to the last tick (0..1)
+        self.alpha = 1.0
+
+    @property
+    def active(self) -> bool:
+        """Whether any entity is drawn between two states."""
+        return bool(self._previous)
+
+    def begin_tick(self, entities: list):
+        """Call before every simulation tick."""
+        version = (len(entities), getattr(entities, "structure_version", None))
+        if entities is not self._entities or version != self._version:
+            # New or restructured scene: start over from its current state
+            self._entities = entities
+            self._version = version
+            self._previous = {}
+            self._state = {
+                e: (pos.x, pos.y, alpha.alpha if alpha else 1.0)
+                for e, pos, alpha in query(
+                    entities, Position, optional=(AlphaComponent,)
+                )
+            }
+        self._since = change_tick()
+
+    def end_tick(self, entities: list):
+        """Call after every simulation tick."""
+        previous: Dict[GameObject, State] = {}
+        state = self._state
+        for e, pos, alpha in query_changed(
+            entities, self._since, Position, optional=(AlphaComponent,)
+        ):
+            new = (pos.x, pos.y, alpha.alpha if alpha else 1.0)
+            old = state.get(e)
+            if old is not None and old != new:
+                previous[e] = old
+            state[e] = new
+        self._previous = previous
+
+    def blend(
+        self, e: GameObject, position: Position, alpha: float
+    ) -> Tuple[Position, float]:
+        """Get the (Position, alpha) to draw ``e`` with."""
+        old: Optional[State] = self._previous.get(e)
+        if old is None:
+            return position, alpha
+        t = self.alpha
+        old_x, old_y, old_alpha = old
+        return (
+            Position(
+                round(old_x + (position.x - old_x) * t),
+                round(old_y + (position.y - old_y) * t),
+            ),
+            old_alpha + (alpha - old_alpha) * t,
+        )
@@ -0,0 +1,75 @@
+"""Helpers to start and stop tweens on entities."""
+
+from typing import Callable, Optional, Union
+
+from .components import Tween, TweenComponent
+from .easing import Easing, get_easing
+from .ecs import GameObject
+
+
+def tween(
+    e: GameObject,
+    component_type: type,
+    attr: str,
+    end,
+    duration: float,
+    easing: Union[str, Easing] = "linear",
+    start=None,
+    delay: float = 0.0,
+    on_complete: Optional[Callable[[], None]] = None,
+) -> Tween:
+    """
+    Animate ``component_type.attr`` of ``e`` to ``end`` over ``duration`` seconds.
+
+    Floats, ints (rounded) and tuples such as colors (per element) can be
+    tweened.  Without ``start`` the tween starts from the attribute's value
+    when it begins running (after ``delay``).  A running tween of the same
+    attribute is replaced.  ``on_complete`` is called once the end value
+    is set.
+    """
+    if e.get(component_type) is None:
+        raise ValueError(f"{e!r} has no {component_type.__name__} to tween")
+    if duration < 0:
+        raise ValueError(f"Tween duration must not be negative, got {duration}")
+
+    item = Tween(
+        component_type,
+        attr,
+        end,
+        duration,
+        easing=get_easing(easing),
+        start=start,
+        delay=delay,
+        on_complete=on_complete,
+    )
+    node = e.get(TweenComponent)
+    if node is None:
+        node = TweenComponent()
+        e.add(node)
+    else:
+        cancel_tweens(e, component_type, attr)
+    node.tweens.append(item)
+    return item
+
+
+def cancel_tweens(
+    e: GameObject, component_type: Optional[type] = None, attr: Optional[str] = None
+) -> int:
+    """
+    Stop the tweens of ``e`` (only those of ``component_type``/``attr`` if given).
+
+    Attributes keep their current value and ``on_complete`` is not called.
+    Returns the number of tweens stopped.
+    """
+    node = e.get(TweenComponent)
+    if node is None:
+        return 0
+    kept = [
+        t
+        for t in node.tweens
+        if (component_type is not None and t.component_type is not component_type)
+        or (attr is not None and t.attr != attr)
+    ]
+    stopped = len(node.tweens) - len(kept)
+    node.tweens = kept
+    return stopped
@@ -1,30 +1,91 @@
-from typing import Optional
+from typing import Callable, Dict, Hashable, Optional
+
+import pygame
 
 from config import GameConfig
+from utils import load_image_with_fallback
 
 from .components import (
     ButtonComponent,
     H1Component,
     H2Component,
     H3Component,
+    ImageComponent,
     InputFieldComponent,
     LabelComponent,
+    LayerComponent,
+    OverlayComponent,
     Position,
     ProgressBarComponent,
 )
+from .draw_list import LAYER_MODAL
 from .ecs import GameObject
+from .prefab import Prefab
+from .service_locator import ServiceLocator
 
 
 class UIBuilder:
+    # Prefabs shared by all builders: entities are cloned from these templates
+    # instead of being built component by component on every scene enter
+    _prefabs: Dict[Hashable, Prefab] = {}
+    # (path, width, height) -> loaded surface, shared by every image entity
+    _images: Dict[tuple, pygame.Surface] = {}
+
     def __init__(self, font):
         self.font = font
+        # Entities are drawn from the shared pool when the app provides one
+        self.pool = ServiceLocator.get("entity_pool")
+
+    @classmethod
+    def prefab(cls, key: Hashable, build: Callable[[], Prefab]) -> Prefab:
+        """Get the cached prefab for ``key``, building it on first use."""
+        prefab = cls._prefabs.get(key)
+        if prefab is None:
+            prefab = cls._prefabs[key] = build()
+        return prefab
+
+    @classmethod
+    def clear_prefabs(cls):
+        """Drop all cached prefabs and images (e.g. after the display mode changed)."""
+        cls._prefabs.clear()
+        cls._images.clear()
+
+    @classmethod
+    def image(
+        cls, image_path: str, width: Optional[int], height: Optional[int]
+    ) -> Optional[pygame.Surface]:
+        """
+        Get a loaded image, loading it only once per path and size.
+
+        Returns None while there is no display (``convert_alpha`` needs one);
+        the RenderSystem then loads the image lazily at first draw.
+        """
+        key = (image_path, width, height)
+        surface = cls._images.get(key)
+        if surface is None and pygame.display.get_surface() is not None:
+            surface = cls._images[key] = load_image_with_fallback(
+                image_path, width or 40, height or 40
+            )
+        return surface
 
     def label_entity(
-        self, text: str, x: int, y: int, color=GameConfig.LABEL_DEFAULT_COLOR
+        self,
+        text: str,
+        x: int,
+        y: int,
+        color=GameConfig.LABEL_DEFAULT_COLOR,
+        dynamic: bool = False,
     ):
-        e = GameObject()
-        e.add(Position(x, y)).add(LabelComponent(text, color))
-        return e
+        prefab = self.prefab(
+            "label", lambda: Prefab(Position(0, 0), LabelComponent(""))
+        )
+        return prefab.instantiate(
+            {
+                Position: {"x": x, "y": y},
+                LabelComponent: {"text": text, "color": color, "dynamic": dynamic},
+            },
+            pool=self.pool,
+        )
 
     def input_entity(
         self,
@@ -33,11 +94,16 @@ class UIBuilder:
         y: int,
         max_len: int = GameConfig.INPUT_FIELD_DEFAULT_MAX_LENGTH,
     ):
-        e = GameObject()
-        inp = InputFieldComponent(max_len)
-        inp.placeholder = placeholder
-        e.add(Position(x, y)).add(inp)
-        return e
+        prefab = self.prefab(
+            "input", lambda: Prefab(Position(0, 0), InputFieldComponent())
+        )
+        return prefab.instantiate(
+            {
+                Position: {"x": x, "y": y},
+                InputFieldComponent: {"placeholder": placeholder, "max_length": max_len},
+            },
+            pool=self.pool,
+        )
 
     def button_entity(
         self,
@@ -47,11 +113,9 @@ class UIBuilder:
         onclick,
         keyboard_shortcut: Optional[str] = None,
     ):
-        e = GameObject()
-        btn = ButtonComponent(text, keyboard_shortcut)
-        btn.on_click = onclick
-        e.add(Position(x, y)).add(btn)
-        return e
+        return self.button_entity_with_min_width(
+            text, x, y, onclick, 0, keyboard_shortcut
+        )
 
     def button_entity_with_min_width(
         self,
@@ -62,27 +126,39 @@ class UIBuilder:
         min_width: int,
         keyboard_shortcut: Optional[str] = None,
     ):
-        e = GameObject()
-        btn = ButtonComponent(text, keyboard_shortcut)
-        btn.on_click = onclick
-        btn.min_width = min_width
-        e.add(Position(x, y)).add(btn)
-        return e
+        prefab = self.prefab(
+            "button", lambda: Prefab(Position(0, 0), ButtonComponent(""))
+        )
+        return prefab.instantiate(
+            {
+                Position: {"x": x, "y": y},
+                ButtonComponent: {
+                    "text": text,
+                    "on_click": onclick,
+                    "min_width": min_width,
+                    "keyboard_shortcut": keyboard_shortcut,
+                },
+            },
+            pool=self.pool,
+        )
 
     def h1_entity(self, text: str, x: int, y: int, color=GameConfig.H1_DEFAULT_COLOR):
-        e = GameObject()
-        e.add(Position(x, y)).add(H1Component(text, color))
-        return e
+        return self._header_entity(H1Component, text, x, y, color)
 
     def h2_entity(self, text: str, x: int, y: int, color=GameConfig.H2_DEFAULT_COLOR):
-        e = GameObject()
-        e.add(Position(x, y)).add(H2Component(text, color))
-        return e
+        return self._header_entity(H2Component, text, x, y, color)
 
     def h3_entity(self, text: str, x: int, y: int, color=GameConfig.H3_DEFAULT_COLOR):
-        e = GameObject()
-        e.add(Position(x, y)).add(H3Component(text, color))
-        return e
+        return self._header_entity(H3Component, text, x, y, color)
+
+    def _header_entity(self, header_type: type, text: str, x: int, y: int, color):
+        prefab = self.prefab(
+            header_type, lambda: Prefab(Position(0, 0), header_type(""))
+        )
+        return prefab.instantiate(
+            {Position: {"x": x, "y": y}, header_type: {"text": text, "color": color}},
+            pool=self.pool,
+        )
 
     def progress_bar_entity(
         self,
@@ -93,12 +169,22 @@ class UIBuilder:
         color=GameConfig.PROGRESS_BAR_BG_COLOR,
         fill_color=GameConfig.PROGRESS_BAR_FILL_COLOR,
     ):
-        e = GameObject()
+        e = self.pool.acquire() if self.pool is not None else GameObject()
         e.add(Position(x, y)).add(
             ProgressBarComponent(x, y, width, height, color, fill_color)
         )
         return e
 
+    def overlay_entity(
+        self, x: int, y: int, width: int, height: int, layer: int = LAYER_MODAL
+    ):
+        """Create a modal panel; put the modal's content on the same ``layer``."""
+        e = self.pool.acquire() if self.pool is not None else GameObject()
+        e.add(Position(x, y)).add(OverlayComponent(width, height)).add(
+            LayerComponent(layer)
+        )
+        return e
+
     def image_button_entity(
         self,
         image_path: str,
@@ -109,16 +195,26 @@ class UIBuilder:
         height: int = 32,
         keyboard_shortcut: Optional[str] = None,
     ):
-        e = GameObject()
-        # Empty text for image button
-        btn = ButtonComponent("", keyboard_shortcut)
-        btn.on_click = onclick
-        # Set minimum width and height with padding around the image
-        btn.min_width = width + 16  # Add 16px padding: 8px on each side
-        btn.min_height = height + 16  # Add 16px padding: 8px on top and bottom
-        # Add image component to the button
-        from .components import ImageComponent
-
-        img = ImageComponent(image_path, width, height)
-        e.add(Position(x, y)).add(btn).add(img)
-        return e
+        def build() -> Prefab:
+            # Empty text for image button
+            btn = ButtonComponent("")
+            # Set minimum width and height with padding around the image
+            btn.min_width = width + 16  # Add 16px padding: 8px on each side
+            btn.min_height = height + 16  # Add 16px padding: 8px on top and bottom
+            return Prefab(Position(0, 0), btn, ImageComponent(image_path, width, height))
+
+        prefab = self.prefab(("image_button", image_path, width, height), build)
+        image = prefab.components[2]
+        if image.pygame_image is None:
+            # Resolve once so clones don't load the file at first draw
+            image.pygame_image = self.image(image_path, width, height)
+        return prefab.instantiate(
+            {
+                Position: {"x": x, "y": y},
+                ButtonComponent: {
+                    "on_click": onclick,
+                    "keyboard_shortcut": keyboard_shortcut,
+                },
+            },
+            pool=self.pool,
+        )
@@ -0,0 +1,299 @@
+"""Entity storage with archetype grouping and cached component queries."""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from .columns import ColumnStore
+from .commands import CommandBuffer
+from .ecs import GameObject
+
+Signature = FrozenSet[type]
+QueryKey = Tuple[Tuple[type, ...], Tuple[type, ...]]
+
+
+class World(list):
+    """
+    Ordered collection of a scene's GameObjects.
+
+    A World still behaves like the plain entity list scenes used to build
+    (iteration order is spawn order, so draw order does not change), but it
+    also groups entities by their component signature (archetype) and answers
+    ``query(Position, ButtonComponent)`` from a cache.  The cache is only
+    rebuilt when an entity is added/removed or its set of components changes,
+    so systems no longer pay for failed ``get()`` lookups every frame.
+
+    With ``columnar=True`` Position/AlphaComponent data is kept in a
+    ColumnStore (NumPy arrays) and available as ``world.columns``.
+    """
+
+    def __init__(self, entities: Iterable[GameObject] = (), columnar: bool = False):
+        super().__init__()
+        self.columns: Optional[ColumnStore] = ColumnStore() if columnar else None
+        # Archetype tables: component signature -> entities with exactly that
+        # signature (dicts used as insertion-ordered sets for O(1) removal)
+        self._archetypes: Dict[Signature, Dict[GameObject, None]] = {}
+        self._signatures: Dict[GameObject, Signature] = {}
+        # How many times an entity appears in the list (normally 1)
+        self._members: Dict[GameObject, int] = {}
+        # Entity handle (GameObject.id) -> entity
+        self._by_id: Dict[int, GameObject] = {}
+        self._queries: Dict[QueryKey, List[tuple]] = {}
+        # Bumped on every structural change, useful for external caches
+        self.structure_version = 0
+        # Structural changes recorded during system execution, see apply_commands()
+        self.commands = CommandBuffer()
+        self.extend(entities)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(
+        self, *component_types: type, optional: Sequence[type] = ()
+    ) -> List[tuple]:
+        """
+        Get all entities that have every one of ``component_types``.
+
+        Each result is a tuple ``(entity, *required_components, *optional_components)``
+        where missing optional components are ``None``.  Results keep spawn order.
+        The returned list is cached and shared - do not modify it.
+        """
+        key = (component_types, tuple(optional))
+        result = self._queries.get(key)
+        if result is None:
+            result = self._build_query(component_types, key[1])
+            self._queries[key] = result
+        return result
+
+    def query_changed(
+        self, since: int, *component_types: type, optional: Sequence[type] = ()
+    ) -> List[tuple]:
+        """
+        Like ``query`` but only rows where a required or present optional
+        component changed after tick ``since`` (see ``change_tick()``).
+        """
+        return _filter_changed(
+            self.query(*component_types, optional=optional), since
+        )
+
+    def entity(self, handle: int) -> Optional[GameObject]:
+        """
+        Resolve an entity handle (``GameObject.id``) to the entity in this World.
+
+        Returns None when the entity is not part of the World or the handle is
+        stale (the entity died and its index was reused).
+        """
+        return self._by_id.get(handle)
+
+    def archetypes(self) -> Dict[Signature, Dict[GameObject, None]]:
+        """Get the archetype tables (signature -> ordered set of entities)."""
+        return self._archetypes
+
+    def _build_query(
+        self, component_types: Tuple[type, ...], optional: Tuple[type, ...]
+    ) -> List[tuple]:
+        required = frozenset(component_types)
+        matching = {sig for sig in self._archetypes if required <= sig}
+        if not matching:
+            return []
+
+        signatures = self._signatures
+        result = []
+        for e in self:
+            if signatures[e] not in matching:
+                continue
+            comps = e.components
+            result.append(
+                (e,)
+                + tuple(comps[t] for t in component_types)
+                + tuple(comps.get(t) for t in optional)
+            )
+        return result
+
+    # ------------------------------------------------------------------
+    # Archetype bookkeeping
+    # ------------------------------------------------------------------
+    def _attach(self, e: GameObject):
+        count = self._members.get(e, 0)
+        self._members[e] = count + 1
+        if count == 0:
+            e._world = self
+            self._by_id[e.id] = e
+            if self.columns is not None:
+                self.columns.adopt(e)
+            signature = frozenset(e.components)
+            self._signatures[e] = signature
+            self._archetypes.setdefault(signature, {})[e] = None
+
+    def _detach(self, e: GameObject):
+        count = self._members.get(e, 0)
+        if count > 1:
+            self._members[e] = count - 1
+            return
+        if count == 0:
+            return
+        del self._members[e]
+        self._by_id.pop(e.id, None)
+        signature = self._signatures.pop(e)
+        self._remove_from_archetype(e, signature)
+        if self.columns is not None:
+            self.columns.release(e)
+        if e._world is self:
+            e._world = None
+
+    def _remove_from_archetype(self, e: GameObject, signature: Signature):
+        table = self._archetypes[signature]
+        del table[e]
+        if not table:
+            del self._archetypes[signature]
+
+    def _on_components_changed(self, e: GameObject):
+        """Called by GameObject when one of its components is added or replaced."""
+        old_signature = self._signatures.get(e)
+        if old_signature is None:
+            return
+        if self.columns is not None:
+            self.columns.adopt(e)
+        signature = frozenset(e.components)
+        if signature != old_signature:
+            self._remove_from_archetype(e, old_signature)
+            self._archetypes.setdefault(signature, {})[e] = None
+            self._signatures[e] = signature
+        # Cached tuples hold component instances, so any change invalidates them
+        self._invalidate()
+
+    def apply_commands(self):
+        """Apply the structural changes recorded in ``commands`` (a sync point)."""
+        if self.commands:
+            self.commands.apply(self)
+
+    def _invalidate(self):
+        self._queries = {}
+        self.structure_version += 1
+
+    # ------------------------------------------------------------------
+    # list API - every mutation keeps the archetype tables in sync
+    # ------------------------------------------------------------------
+    def append(self, e: GameObject):
+        super().append(e)
+        self._attach(e)
+        self._invalidate()
+
+    def extend(self, entities: Iterable[GameObject]):
+        entities = list(entities)
+        super().extend(entities)
+        for e in entities:
+            self._attach(e)
+        self._invalidate()
+
+    def __iadd__(self, entities: Iterable[GameObject]):
+        self.extend(entities)
+        return self
+
+    def insert(self, index, e: GameObject):
+        super().insert(index, e)
+        self._attach(e)
+        self._invalidate()
+
+    def remove(self, e: GameObject):
+        super().remove(e)
+        self._detach(e)
+        self._invalidate()
+
+    def remove_many(self, entities: Iterable[GameObject]):
+        """Remove every occurrence of the given entities in a single pass."""
+        doomed = set(entities)
+        if not doomed:
+            return
+        kept, removed = [], []
+        for e in self:
+            (removed if e in doomed else kept).append(e)
+        super().__setitem__(slice(None), kept)
+        for e in removed:
+            self._detach(e)
+        self._invalidate()
+
+    def pop(self, index=-1) -> GameObject:
+        e = super().pop(index)
+        self._detach(e)
+        self._invalidate()
+        return e
+
+    def clear(self):
+        for e in self:
+            self._detach(e)
+        super().clear()
+        self._invalidate()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            old, new = self[index], list(value)
+        else:
+            old, new = [self[index]], [value]
+        super().__setitem__(index, new if isinstance(index, slice) else value)
+        for e in old:
+            self._detach(e)
+        for e in new:
+            self._attach(e)
+        self._invalidate()
+
+    def __delitem__(self, index):
+        old = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for e in old:
+            self._detach(e)
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate()
+
+
+def query(
+    entities: Iterable[GameObject],
+    *component_types: type,
+    optional: Sequence[type] = (),
+) -> List[tuple]:
+    """
+    Query any entity collection.
+
+    Uses the World's cached query when ``entities`` is a World, otherwise
+    falls back to scanning the iterable (e.g. a plain list in tests).
+    """
+    if isinstance(entities, World):
+        return entities.query(*component_types, optional=optional)
+
+    result = []
+    for e in entities:
+        comps = e.components
+        if all(t in comps for t in component_types):
+            result.append(
+                (e,)
+                + tuple(comps[t] for t in component_types)
+                + tuple(comps.get(t) for t in optional)
+            )
+    return result
+
+
+def query_changed(
+    entities: Iterable[GameObject],
+    since: int,
+    *component_types: type,
+    optional: Sequence[type] = (),
+) -> List[tuple]:
+    """Query any entity collection for rows changed after tick ``since``."""
+    return _filter_changed(
+        query(entities, *component_types, optional=optional), since
+    )
+
+
+def _filter_changed(rows: List[tuple], since: int) -> List[tuple]:
+    return [
+        row
+        for row in rows
+        if any(
+            c is not None and getattr(c, "changed_tick", 0) > since for c in row[1:]
+        )
+    ]
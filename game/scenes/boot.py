@@ -1,7 +1,9 @@
+from config import GameConfig
 from engine import (
     AssetLoader,
     BaseScene,
     EventBus,
+    FontTask,
     LabelComponent,
     ProgressBarComponent,
     ServiceLocator,
@@ -42,9 +44,13 @@ class BootScene(BaseScene):
         self.asset_loader.add_simple_task(
             "Loading image assets", self.load_image_assets
         )
-        self.asset_loader.add_simple_task(
-            "Loading font assets", self.load_font_assets
-        )
+        fonts = ServiceLocator.get("font_registry")
+        if fonts is not None:
+            self.asset_loader.add_task(
+                FontTask("Loading font assets", fonts, self.font_specs())
+            )
+        else:
+            log.warning("Font registry not found in ServiceLocator")
 
     def initialize_services(self):
         """Initialize services for the game"""
@@ -109,29 +115,24 @@ class BootScene(BaseScene):
         except Exception as e:
             log.warning(f"Error preloading image assets: {e}")
 
-    def load_font_assets(self):
-        """Preload font assets to cache them for later use"""
-        try:
-            import pygame
-            from config import GameConfig
-
-            pygame.font.Font(get_resource_path(
-                GameConfig.DEFAULT_FONT_PATH), 16
-            )
-            pygame.font.Font(get_resource_path(
-                GameConfig.ITALIC_FONT_PATH), 16
-            )
-            pygame.font.Font(get_resource_path(GameConfig.BOLD_FONT_PATH), 16)
-            log.info("Font assets preloaded successfully")
-        except Exception as e:
-            log.warning(f"Error preloading font assets: {e}")
+    def font_specs(self) -> list:
+        """Fonts (FontRegistry.get arguments) the scenes use, loaded during boot"""
+        return [
+            (GameConfig.DEFAULT_FONT_SIZE,),
+            (GameConfig.H1_FONT_SIZE,),
+            (GameConfig.H2_FONT_SIZE,),
+            (GameConfig.H3_FONT_SIZE,),
+            (GameConfig.BUTTON_TAG_FONT_SIZE,),
+        ]
 
     def enter(self):
         log.info("BootScene enter")
 
         ui = UIBuilder(self.app.font)
         self.title = ui.h1_entity("Guess The Number", 320, 150)
-        self.loading_text = ui.label_entity("Initializing...", 320, 250)
+        self.loading_text = ui.label_entity(
+            "Initializing...", 320, 250, dynamic=True
+        )
         self.progress_bar = ui.progress_bar_entity(320, 300, 400, 20)
 
         from engine import AlphaComponent
@@ -143,6 +144,10 @@ class BootScene(BaseScene):
         self.entities = [self.title, self.loading_text, self.progress_bar]
         self.asset_loader.reset()
 
+    def is_busy(self) -> bool:
+        # Assets are loaded a few per frame until the menu is started
+        return not self.loading_complete
+
     def update(self, delta_time: float):
         if not self.asset_loader.completed:
             self.asset_loader.execute_next_task(delta_time)
@@ -156,8 +161,8 @@ class BootScene(BaseScene):
             loading_component = self.loading_text.get(LabelComponent)
             if loading_component:
                 actual_percentage = int(self.asset_loader.progress * 100)
-                loading_component.text = (
-                    f"{self.asset_loader.description} - {actual_percentage}%"
+                loading_component.set(
+                    text=f"{self.asset_loader.description} - {actual_percentage}%"
                 )
 
         # Check if loading is complete
@@ -1,5 +1,13 @@
 from config import GameConfig
-from engine import AlphaComponent, BaseScene, ButtonComponent, UIBuilder
+from engine import (
+    LAYER_MODAL,
+    AlphaComponent,
+    BaseScene,
+    ButtonComponent,
+    LayerComponent,
+    UIBuilder,
+    attach,
+)
 from logger import get_logger
 
 log = get_logger("game/scenes")
@@ -29,19 +37,18 @@ class DialogScene(BaseScene):
         log.info("DialogScene enter")
         ui = UIBuilder(self.app.font)
 
-        # Create a semi-transparent background overlay
-        overlay_entity = ui.label_entity("", 320, 240)
-        # Semi-transparent overlay - let's to close the dialog faster
-        overlay_entity.add(AlphaComponent(0.5))
+        # Modal panel behind the dialog, drawn on the modal layer
+        overlay_entity = ui.overlay_entity(320, 210, 440, 200)
+
+        # The rest of the dialog is laid out relative to the overlay (its
+        # center), so moving the overlay moves the whole dialog
 
         # Dialog title
-        self.title = ui.h2_entity(
-            self.title_text, 320, 140, GameConfig.TEXT_COLOR
-        )
+        self.title = ui.h2_entity(self.title_text, 0, -70, GameConfig.TEXT_COLOR)
 
         # Dialog message
         self.message_label = ui.label_entity(
-            self.message, 320, 180, GameConfig.TEXT_COLOR
+            self.message, 0, -30, GameConfig.TEXT_COLOR
         )
 
         # Confirmation button
@@ -54,10 +61,17 @@ class DialogScene(BaseScene):
 
         # Position buttons with appropriate spacing
         self.btn_confirm = ui.button_entity(
-            self.confirm_text, 250, 270, confirm, "[ENTER]"
+            self.confirm_text, -70, 60, confirm, "[ENTER]"
         )
-        self.btn_cancel = ui.button_entity(
-            self.cancel_text, 400, 270, cancel, "[ESC]")
+        self.btn_cancel = ui.button_entity(self.cancel_text, 80, 60, cancel, "[ESC]")
+
+        for child in [
+            self.title,
+            self.message_label,
+            self.btn_confirm,
+            self.btn_cancel,
+        ]:
+            attach(child, overlay_entity)
 
         # Set minimum width to match
         confirm_component = self.btn_confirm.get(ButtonComponent)
@@ -67,7 +81,8 @@ class DialogScene(BaseScene):
         if cancel_component:
             cancel_component.min_width = 100
 
-        # Add alpha components for fade transition
+        # Add alpha components for fade transition; the content shares the
+        # overlay's layer so it is drawn on top of the panel
         for entity in [
             self.title,
             self.message_label,
@@ -75,7 +90,7 @@ class DialogScene(BaseScene):
             self.btn_cancel,
             overlay_entity,
         ]:
-            entity.add(AlphaComponent(1.0))
+            entity.add(AlphaComponent(1.0)).add(LayerComponent(LAYER_MODAL))
 
         self.entities = [
             overlay_entity,
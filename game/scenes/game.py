@@ -10,6 +10,7 @@ from engine import (
     ServiceLocator,
     UIBuilder,
 )
+from engine.components import change_tick, changed_since
 from engine.event_bus import EventBus
 from game.logic import GameLogic, GuessStatus
 from logger import get_logger
@@ -67,11 +68,8 @@ class GameScene(BaseScene):
             self._from_dialog_cancel = False
             # Preserve existing values for history and other state
             preserved_history_list = getattr(self, "history_list", [])
-            preserved_input_value = ""
-            if hasattr(self, "input_ent"):
-                input_comp = self.input_ent.get(InputFieldComponent)
-                if input_comp:
-                    preserved_input_value = input_comp.text
+            # Stashed by exit() - the entities themselves went back to the pool
+            preserved_input_value = getattr(self, "_preserved_input", "")
         else:
             # Apply the selected difficulty by creating new game logic if parameters were provided
             if self.difficulty_params:
@@ -124,14 +122,18 @@ class GameScene(BaseScene):
                 input_comp.text = preserved_input_value
 
         self.history_label = ui.label_entity(
-            "", 320, 260, GameConfig.HINT_COLOR
+            "", 320, 260, GameConfig.HINT_COLOR, dynamic=True
         )
         self.attempts_label = ui.label_entity(
             f"Attempts: {
-                self.game_logic.attempts}", 320, 300, GameConfig.HINT_COLOR
+                self.game_logic.attempts}", 320, 300, GameConfig.HINT_COLOR,
+            dynamic=True,
         )
 
         self._restart_requested = False
+        # Change tick and range of the last input validation (None = never validated)
+        self._validated_tick: Optional[int] = None
+        self._validated_range: Optional[tuple] = None
 
         def restart_click():
             self.restart_click()
@@ -253,8 +255,8 @@ class GameScene(BaseScene):
         if status in [GuessStatus.TOO_LOW, GuessStatus.TOO_HIGH, GuessStatus.CORRECT]:
             attempts_label_comp = self.attempts_label.get(LabelComponent)
             if attempts_label_comp is not None:
-                attempts_label_comp.text = f"Attempts: {
-                    self.game_logic.attempts}"
+                attempts_label_comp.set(text=f"Attempts: {
+                    self.game_logic.attempts}")
 
         self.update_history_label()
 
@@ -262,15 +264,14 @@ class GameScene(BaseScene):
         """Show an error message"""
         error_label_comp = self.error_label.get(LabelComponent)
         if error_label_comp is not None:
-            error_label_comp.text = message
-            error_label_comp.color = GameConfig.ERROR_COLOR
+            error_label_comp.set(text=message, color=GameConfig.ERROR_COLOR)
 
     def clear_error_label(self):
         """Clear the error message"""
         error_label_comp = self.error_label.get(LabelComponent)
         if error_label_comp is not None:
-            error_label_comp.text = ""
-            error_label_comp.color = GameConfig.TEXT_COLOR  # Reset to default color
+            # Reset to default color
+            error_label_comp.set(text="", color=GameConfig.TEXT_COLOR)
 
     def update_history_label(self):
         # Use configuration value for max history entries
@@ -282,7 +283,7 @@ class GameScene(BaseScene):
         )
         label_comp = self.history_label.get(LabelComponent)
         if label_comp is not None:
-            label_comp.text = compact
+            label_comp.set(text=compact)
 
     def handle_event(self, event: pygame.event.Event):
         # keyboard: Enter triggers submit, ESC -> menu with confirmation, Ctrl+R -> restart
@@ -314,32 +315,46 @@ class GameScene(BaseScene):
         error_label = self.error_label.get(LabelComponent)
 
         if input_field and submit_btn:
+            # Nothing the validation depends on changed - keep the previous result
+            valid_range = (self.game_logic.min_number, self.game_logic.max_number)
+            if (
+                self._validated_tick is not None
+                and self._validated_range == valid_range
+                and not changed_since(
+                    self._validated_tick, input_field, submit_btn, error_label
+                )
+            ):
+                return
+
             text = input_field.text.strip()
 
             # Check for various validation errors
             if text == "":
                 # No error when empty, just inactive button
-                submit_btn.active = False
+                submit_btn.set(active=False)
                 if error_label:
-                    error_label.text = ""
+                    error_label.set(text="")
             elif text == "-":
                 # Special case: user is typing a negative number
-                submit_btn.active = False
+                submit_btn.set(active=False)
                 if error_label:
                     # Check if the current game allows negative numbers
                     if self.game_logic.min_number < 0:
                         # Game allows negative numbers, don't show error yet
-                        error_label.text = ""
+                        error_label.set(text="")
                     else:
                         # Game doesn't allow negative numbers
-                        error_label.text = "Number should be positive"
-                        error_label.color = GameConfig.ERROR_COLOR
+                        error_label.set(
+                            text="Number should be positive",
+                            color=GameConfig.ERROR_COLOR,
+                        )
             elif not is_signed_integer(text):
                 # Not a number
-                submit_btn.active = False
+                submit_btn.set(active=False)
                 if error_label:
-                    error_label.text = "Invalid: Enter a number"
-                    error_label.color = GameConfig.ERROR_COLOR
+                    error_label.set(
+                        text="Invalid: Enter a number", color=GameConfig.ERROR_COLOR
+                    )
             else:
                 from utils import is_in_range
 
@@ -348,18 +363,23 @@ class GameScene(BaseScene):
                 if not is_in_range(
                     num, self.game_logic.min_number, self.game_logic.max_number
                 ):
-                    submit_btn.active = False
+                    submit_btn.set(active=False)
                     if error_label:
                         invalid_msg = "Invalid: Number out of range"
                         range_vals = f"({
                             self.game_logic.min_number}-{self.game_logic.max_number})"
-                        error_label.text = f"{invalid_msg} {range_vals}"
-                        error_label.color = GameConfig.ERROR_COLOR
+                        error_label.set(
+                            text=f"{invalid_msg} {range_vals}",
+                            color=GameConfig.ERROR_COLOR,
+                        )
                 else:
                     # Valid input
-                    submit_btn.active = True
+                    submit_btn.set(active=True)
                     if error_label:
-                        error_label.text = ""
+                        error_label.set(text="")
+
+            self._validated_tick = change_tick()
+            self._validated_range = valid_range
 
     def restart_click(self):
         log.info("Restart clicked")
@@ -434,6 +454,13 @@ class GameScene(BaseScene):
         )
         self.app.scene_manager.change(dialog_scene)
 
+    def exit(self):
+        # Keep the typed text for a dialog-cancel re-entry before the
+        # entities are released to the pool
+        input_comp = self.input_ent.get(InputFieldComponent)
+        self._preserved_input = input_comp.text if input_comp else ""
+        super().exit()
+
     def update(self, delta_time: float):
         # Update button states
         self.update_submit_button_state()
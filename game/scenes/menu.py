@@ -156,7 +156,7 @@ class MenuScene(BaseScene):
         # Update difficulty text
         difficulty_text_comp = self.current_difficulty_text.get(LabelComponent)
         if difficulty_text_comp:
-            difficulty_text_comp.text = self.get_current_difficulty_text()
+            difficulty_text_comp.set(text=self.get_current_difficulty_text())
 
     def handle_event(self, event):
         import pygame
@@ -285,14 +285,20 @@ class MenuScene(BaseScene):
         img_component = self.btn_sound.get(ImageComponent)
         if img_component:
             if sounds_enabled:
-                img_component.image_path = (
+                image_path = (
                     "assets/images/volume.png"  # Unmuted icon when sounds are enabled
                 )
             else:
-                img_component.image_path = (
+                image_path = (
                     "assets/images/mute.png"  # Muted icon when sounds are disabled
                 )
-            img_component.pygame_image = None  # Reset to force reload
+            # Shared, already loaded surface (None = loaded lazily at first draw)
+            img_component.set(
+                image_path=image_path,
+                pygame_image=UIBuilder.image(
+                    image_path, img_component.width, img_component.height
+                ),
+            )
 
     def update(self, delta_time: float):
         # Call parent update to handle fade-out if in progress
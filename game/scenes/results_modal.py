@@ -3,7 +3,15 @@
 from typing import Optional
 
 from config import GameConfig
-from engine import AlphaComponent, BaseScene, ButtonComponent, UIBuilder
+from engine import (
+    LAYER_MODAL,
+    AlphaComponent,
+    BaseScene,
+    ButtonComponent,
+    LayerComponent,
+    UIBuilder,
+    attach,
+)
 from logger import get_logger
 from stats import get_difficulty_stats
 from utils import format_timestamp
@@ -39,13 +47,15 @@ class ResultsModalScene(BaseScene):
         )
         ui = UIBuilder(self.app.font)
 
-        # Create a semi-transparent background overlay
-        overlay_entity = ui.label_entity("", 320, 240)
-        overlay_entity.add(AlphaComponent(0.6))
+        # Modal panel behind the results, drawn on the modal layer
+        overlay_entity = ui.overlay_entity(320, 205, 600, 280)
+
+        # Everything else is laid out relative to the overlay (the modal's
+        # center) and attached to it below
 
         # Modal title
         self.title = ui.h2_entity(
-            f"{self.difficulty_name} Stats", 320, 100, GameConfig.TEXT_COLOR
+            f"{self.difficulty_name} Stats", 0, -105, GameConfig.TEXT_COLOR
         )
 
         # Get stats for current difficulty
@@ -56,21 +66,21 @@ class ResultsModalScene(BaseScene):
         # Display games played
         self.games_played_label = ui.label_entity(
             f"Games played: {difficulty_stats['games_played']}",
-            320,
-            140,
+            0,
+            -65,
             GameConfig.HINT_COLOR,
         )
 
         # Top scores header
         self.top_scores_header = ui.h3_entity(
-            "Top Scores:", 320, 180, GameConfig.TEXT_COLOR
+            "Top Scores:", 0, -25, GameConfig.TEXT_COLOR
         )
 
         # Display top attempts (or fewer if available)
         top_attempts = difficulty_stats["top_attempts"]
 
         if top_attempts:
-            start_y = 220
+            start_y = 15
             # Show top stats up to the configured max to avoid crowding the UI
             max_display_attempts = min(
                 len(top_attempts), GameConfig.SCENE_MAX_WIN_TOP_SCORES
@@ -96,14 +106,13 @@ class ResultsModalScene(BaseScene):
                     elif self.current_ranking <= 5:
                         attempt_color = GameConfig.TOP_SCORE_4_TO_5_COLOR
 
-                label = ui.label_entity(
-                    attempt_text, 320, y_pos, attempt_color)
+                label = ui.label_entity(attempt_text, 0, y_pos, attempt_color)
                 setattr(
                     self, f"top_score_label_{i}", label
                 )  # Store as instance attribute
         else:
             no_scores = ui.label_entity(
-                "No scores yet", 320, 220, GameConfig.HINT_COLOR
+                "No scores yet", 0, 15, GameConfig.HINT_COLOR
             )
             self.no_scores_label = no_scores
 
@@ -111,8 +120,7 @@ class ResultsModalScene(BaseScene):
             self.close_modal()
 
         # Close button (positioned in the top-right corner of the modal)
-        self.btn_close = ui.button_entity(
-            "Close", 550, 100, close_modal, "[ESC]")
+        self.btn_close = ui.button_entity("Close", 230, -105, close_modal, "[ESC]")
 
         # Set minimum width to match
         close_component = self.btn_close.get(ButtonComponent)
@@ -138,8 +146,12 @@ class ResultsModalScene(BaseScene):
             if hasattr(self, label_attr):
                 entities_list.append(getattr(self, label_attr))
 
+        for entity in entities_list[1:]:
+            attach(entity, overlay_entity)
+
+        # The content shares the overlay's layer so it is drawn on top of the panel
         for entity in entities_list:
-            entity.add(AlphaComponent(1.0))
+            entity.add(AlphaComponent(1.0)).add(LayerComponent(LAYER_MODAL))
 
         self.entities = entities_list
 
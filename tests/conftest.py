@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from config import GameConfig
 from engine.ecs import GameObject
+from engine.systems import RenderSystem
 from game.logic import GameLogic
 
 
@@ -41,6 +42,19 @@ def mock_pygame_font():
         yield mock_font_instance
 
 
+@pytest.fixture
+def make_render_system():
+    """Fixture to build real RenderSystems with the default pygame font."""
+    pygame.font.init()
+
+    def make(screen=None, font_size=18, **kwargs):
+        if screen is None:
+            screen = pygame.Surface((640, 400))
+        return RenderSystem(screen, pygame.font.Font(None, font_size), **kwargs)
+
+    return make
+
+
 @pytest.fixture
 def game_logic():
     """Fixture to provide a GameLogic instance with default parameters."""
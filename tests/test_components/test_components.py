@@ -10,7 +10,10 @@ from engine.components import (
     ProgressBarComponent,
     ImageComponent,
     SoundComponent,
+    change_tick,
+    changed_since,
 )
+from engine.ecs import GameObject
 
 
 class TestPosition:
@@ -230,3 +233,41 @@ class TestSoundComponent:
         assert sound.play_on_add is True
         assert sound.volume == 0.5
         assert sound.loop is True
+
+
+class TestChangeTracking:
+    def test_set_bumps_changed_tick(self):
+        """Test that set() with a different value stamps a newer tick."""
+        label = LabelComponent("Old")
+        since = change_tick()
+        assert label.set(text="New")
+        assert label.text == "New"
+        assert label.changed_tick > since
+        assert changed_since(since, label)
+
+    def test_same_value_is_not_a_change(self):
+        """Test that setting an equal value keeps the component unchanged."""
+        button = ButtonComponent("OK")
+        GameObject().add(button)
+        since = change_tick()
+        assert not button.set(hover=False, text="OK")
+        assert not changed_since(since, button)
+
+    def test_changes_between_checkpoints_share_a_tick(self):
+        """Test that changes are stamped with the shared tick, not a new one each."""
+        first, second = Position(0, 0), Position(1, 1)
+        change_tick()
+        first.touch()
+        second.set(x=5)
+        assert first.changed_tick == second.changed_tick
+
+    def test_touch_marks_component_changed(self):
+        """Test that touch() flags in-place mutations."""
+        pos = Position(0, 0)
+        since = change_tick()
+        pos.touch()
+        assert changed_since(since, pos)
+
+    def test_unattached_component_is_unchanged(self):
+        """Test that a component that was never added or stamped is unchanged."""
+        assert not changed_since(0, Position(1, 2))
@@ -1,6 +1,7 @@
 import pytest
 from pydantic import ValidationError
 from config.base import WindowConfig, ColorConfig, DifficultyModel, DifficultyConfig
+from config.engine import EngineConfig
 
 
 class TestWindowConfig:
@@ -173,6 +174,36 @@ class TestDifficultyConfig:
         assert len(config.modes) == 2
 
 
+class TestEngineConfig:
+    def test_engine_config_defaults(self):
+        """Test that EngineConfig has correct default values."""
+        config = EngineConfig()
+        assert config.columnar_storage is False
+        assert config.scheduler_workers == 0
+        assert config.dirty_rects is False
+        assert config.idle_wait is False
+        assert config.idle_wait_timeout_ms == 250
+        assert config.fixed_tick_rate == 0
+        assert config.max_fixed_steps == 5
+        assert config.headless is False
+        assert config.input_script == ""
+        assert config.profiler is False
+        assert config.cpu_capture is False
+        assert config.cpu_capture_frames == 300
+        assert config.memory_capture is False
+        assert config.capture_top == 20
+
+    def test_engine_config_rejects_negative_idle_timeout(self):
+        """Test that a negative idle wait timeout is rejected."""
+        with pytest.raises(ValidationError):
+            EngineConfig(idle_wait_timeout_ms=-1)
+
+    def test_engine_config_requires_a_catch_up_step(self):
+        """Test that max_fixed_steps must allow at least one tick per frame."""
+        with pytest.raises(ValidationError):
+            EngineConfig(max_fixed_steps=0)
+
+
 class TestGameConfig:
     def test_game_config_defaults(self):
         """Test that GameConfig has correct default values."""
@@ -244,6 +275,7 @@ class TestGameConfig:
         assert GameConfig.INPUT_FIELD_FONT_SIZE > 0
         assert GameConfig.INPUT_MOUSE_DETECTION_WIDTH > 0
         assert GameConfig.INPUT_MOUSE_DETECTION_HEIGHT > 0
+        assert GameConfig.TEXT_CACHE_MAX_BYTES > 0
 
     def test_game_config_header_color_properties(self):
         """Test that GameConfig has header color properties."""
@@ -0,0 +1,83 @@
+import pygame
+import pytest
+
+from engine.alpha_cache import AlphaVariantCache
+
+
+def per_pixel_surface():
+    surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+    surface.fill((255, 0, 0, 255))
+    return surface
+
+
+class TestAlphaVariantCache:
+    def test_opaque_returns_source(self):
+        """Test that alpha 1.0 draws the source surface itself."""
+        cache = AlphaVariantCache()
+        surface = per_pixel_surface()
+
+        assert cache.get(surface, 1.0) is surface
+        assert cache.stats()["variants"] == 0
+
+    def test_per_pixel_variant_is_reused_within_bucket(self):
+        """Test that alphas in the same bucket share one modulated surface."""
+        cache = AlphaVariantCache(buckets=10)
+        surface = per_pixel_surface()
+
+        first = cache.get(surface, 0.5)
+        second = cache.get(surface, 0.51)
+
+        assert first is second
+        assert first is not surface
+        assert first.get_at((0, 0)).a == cache.quantize(0.5)
+        assert surface.get_at((0, 0)).a == 255
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_set_alpha_variants_keep_their_alpha(self):
+        """Test that surfaces without per-pixel alpha get a copy per bucket."""
+        cache = AlphaVariantCache(buckets=10)
+        surface = pygame.Surface((4, 4))
+
+        half = cache.get(surface, 0.5)
+        quarter = cache.get(surface, 0.2)
+
+        assert half is not quarter
+        assert half.get_alpha() == cache.quantize(0.5)
+        assert quarter.get_alpha() == cache.quantize(0.2)
+        assert cache.get(surface, 0.51) is half
+        assert surface.get_alpha() is None
+
+    def test_deferred_draws_keep_their_alpha(self):
+        """Test that two queued draws of one surface keep their own alpha."""
+        cache = AlphaVariantCache(buckets=10)
+        surface = pygame.Surface((4, 4))
+        surface.fill((255, 255, 255))
+        target = pygame.Surface((8, 4))
+        queued = [
+            (cache.get(surface, 0.5), (0, 0)),
+            (cache.get(surface, 0.2), (4, 0)),
+        ]
+
+        target.blits(queued)
+
+        assert target.get_at((0, 0)).r == pytest.approx(cache.quantize(0.5), abs=1)
+        assert target.get_at((4, 0)).r == pytest.approx(cache.quantize(0.2), abs=1)
+
+    def test_variants_are_bounded(self):
+        """Test that the least recently used variants are evicted."""
+        cache = AlphaVariantCache(buckets=10, max_entries=2)
+        surface = per_pixel_surface()
+
+        for alpha in (0.1, 0.2, 0.3):
+            cache.get(surface, alpha)
+
+        assert cache.stats()["variants"] == 2
+        assert cache.evictions == 1
+
+    def test_quantize_clamps(self):
+        """Test that out-of-range alphas are clamped to 0-255."""
+        cache = AlphaVariantCache(buckets=4)
+
+        assert cache.quantize(-1.0) == 0
+        assert cache.quantize(2.0) == 255
+        assert cache.quantize(0.5) == 127
@@ -0,0 +1,42 @@
+from engine.button_skins import SHADOW_OFFSET, ButtonSkinCache
+
+
+class TestButtonSkinCache:
+    def test_skin_is_rasterized_once(self):
+        """Test that the same size/color/radius/alpha reuses the skin."""
+        skins = ButtonSkinCache()
+
+        first = skins.get(100, 40, (220, 220, 220), 10)
+        second = skins.get(100, 40, (220, 220, 220), 10)
+
+        assert first is second
+        assert skins.stats() == {"hits": 1, "misses": 1, "skins": 1}
+
+    def test_skin_includes_shadow(self):
+        """Test that the skin is taller than the box by the shadow offset."""
+        skin = ButtonSkinCache().get(100, 40, (220, 220, 220), 10)
+
+        assert skin.get_size() == (100, 40 + SHADOW_OFFSET)
+        # Center of the box is the background color brightened by the highlight
+        assert skin.get_at((50, 30))[:3] == (220, 220, 220)
+        assert skin.get_at((50, 41))[:3] == (180, 180, 180)
+
+    def test_state_and_alpha_get_separate_skins(self):
+        """Test that color (state) and alpha are part of the key."""
+        skins = ButtonSkinCache()
+
+        normal = skins.get(100, 40, (220, 220, 220), 10)
+        hover = skins.get(100, 40, (200, 200, 255), 10)
+        faded = skins.get(100, 40, (220, 220, 220), 10, alpha=127)
+
+        assert len({id(normal), id(hover), id(faded)}) == 3
+        assert faded.get_at((50, 30))[:3] == (109, 109, 109)
+
+    def test_skins_are_bounded(self):
+        """Test that old skins are evicted past max_entries."""
+        skins = ButtonSkinCache(max_entries=2)
+
+        for width in (50, 60, 70):
+            skins.get(width, 40, (220, 220, 220), 10)
+
+        assert skins.stats()["skins"] == 2
@@ -0,0 +1,83 @@
+import pstats
+import tracemalloc
+from unittest.mock import Mock
+
+from engine.capture import CpuCapture, MemoryCapture
+from engine.scene_manager import SceneManager
+
+
+class TestCpuCapture:
+    def test_capture_covers_requested_frames(self, tmp_path):
+        """Test that a capture starts next frame and writes stats after N frames."""
+        capture = CpuCapture(tmp_path, top=5)
+        assert capture.request(2)
+        assert not capture.request(2)
+
+        paths = []
+        for _ in range(3):
+            capture.begin_frame()
+            sum(range(1000))
+            paths.append(capture.end_frame())
+
+        assert paths[0] is None and paths[2] is None
+        assert paths[1].parent == tmp_path and paths[1].suffix == ".prof"
+        assert pstats.Stats(str(paths[1])).total_calls > 0
+        assert not capture.active
+
+    def test_no_request_no_capture(self, tmp_path):
+        """Test that frames without a request are not profiled."""
+        capture = CpuCapture(tmp_path)
+        capture.begin_frame()
+
+        assert capture.end_frame() is None
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestMemoryCapture:
+    def test_scene_change_diff_written_at_frame_end(self, tmp_path):
+        """Test that an armed capture reports memory across the next scene change."""
+        capture = MemoryCapture(tmp_path, top=5)
+        manager = SceneManager(Mock())
+        manager.add_hooks(capture.before_change, capture.after_change)
+        kept = []
+        new_scene = Mock()
+        new_scene.enter.side_effect = lambda: kept.append(bytearray(256 * 1024))
+        was_tracing = tracemalloc.is_tracing()
+
+        assert capture.arm()
+        manager.change(new_scene)
+        path = capture.end_frame()
+
+        assert path.parent == tmp_path and path.name.startswith("memory-")
+        assert "None -> Mock" in path.read_text().splitlines()[0]
+        assert not capture.armed
+        assert tracemalloc.is_tracing() == was_tracing
+
+    def test_unarmed_capture_ignores_scene_changes(self, tmp_path):
+        """Test that scene changes take no snapshots until the capture is armed."""
+        capture = MemoryCapture(tmp_path)
+        manager = SceneManager(Mock())
+        manager.add_hooks(capture.before_change, capture.after_change)
+
+        manager.change(Mock())
+
+        assert capture.end_frame() is None
+
+
+class TestSceneHooks:
+    def test_hooks_run_around_change(self):
+        """Test that hooks see the old and new scene around exit/enter."""
+        manager = SceneManager(Mock())
+        calls = []
+        old, new = Mock(), Mock()
+        old.exit.side_effect = lambda: calls.append("exit")
+        new.enter.side_effect = lambda: calls.append("enter")
+        manager.current = old
+
+        manager.add_hooks(
+            before=lambda a, b: calls.append(("before", a, b)),
+            after=lambda a, b: calls.append(("after", a, b)),
+        )
+        manager.change(new)
+
+        assert calls == [("before", old, new), "exit", "enter", ("after", old, new)]
@@ -0,0 +1,139 @@
+import pytest
+from unittest.mock import Mock
+
+pytest.importorskip("numpy")
+
+from engine.base_scene import BaseScene
+from engine.columns import AlphaView, PositionView
+from engine.components import AlphaComponent, LabelComponent, Position, change_tick
+from engine.ecs import GameObject
+from engine.world import World
+
+
+class TestColumnStore:
+    def test_components_become_views_into_arrays(self):
+        """Test that joining a columnar World swaps in array-backed views."""
+        e = GameObject().add(Position(10, 20)).add(AlphaComponent(0.5))
+        world = World([e], columnar=True)
+
+        pos = e.get(Position)
+        alpha = e.get(AlphaComponent)
+        assert isinstance(pos, PositionView)
+        assert isinstance(alpha, AlphaView)
+        assert (pos.x, pos.y) == (10, 20)
+        assert alpha.alpha == 0.5
+
+        pos.x = 42
+        alpha.target_alpha = 0.0
+        row = world.columns._rows[e]
+        assert world.columns.x[row] == 42
+        assert world.columns.target_alpha[row] == 0.0
+
+    def test_views_are_still_component_instances(self):
+        """Test that views can be used wherever the component classes are expected."""
+        e = GameObject().add(Position(0, 0)).add(AlphaComponent(1.0))
+        World([e], columnar=True)
+
+        assert isinstance(e.get(Position), Position)
+        assert isinstance(e.get(AlphaComponent), AlphaComponent)
+
+    def test_step_alpha_matches_scalar_animation(self):
+        """Test that the vectorized step moves towards target and snaps to it."""
+        fading = GameObject().add(AlphaComponent(1.0))
+        appearing = GameObject().add(AlphaComponent(0.0))
+        world = World([fading, appearing], columnar=True)
+        fading.get(AlphaComponent).target_alpha = 0.0
+        appearing.get(AlphaComponent).target_alpha = 1.0
+        speed = fading.get(AlphaComponent).animation_speed
+
+        world.columns.step_alpha(0.016)
+
+        assert fading.get(AlphaComponent).alpha == pytest.approx(1.0 - speed * 0.016)
+        assert appearing.get(AlphaComponent).alpha == pytest.approx(speed * 0.016)
+
+        for _ in range(100):
+            world.columns.step_alpha(0.016)
+
+        assert fading.get(AlphaComponent).alpha == 0.0
+        assert appearing.get(AlphaComponent).alpha == 1.0
+
+    def test_step_alpha_stamps_change_ticks(self):
+        """Test that vectorized alpha steps mark only moving rows as changed."""
+        moving = GameObject().add(Position(0, 0)).add(AlphaComponent(0.0))
+        still = GameObject().add(Position(0, 0)).add(AlphaComponent(1.0))
+        moving.get(AlphaComponent).target_alpha = 1.0
+        world = World([moving, still], columnar=True)
+        since = change_tick()
+
+        world.columns.step_alpha(0.016)
+
+        assert [row[0] for row in world.query_changed(since, AlphaComponent)] == [moving]
+
+    def test_animating_until_every_alpha_reaches_its_target(self):
+        """Test that animating() reports alphas that have not reached their target."""
+        label = GameObject().add(Position(0, 0)).add(LabelComponent("x"))
+        fading = GameObject().add(AlphaComponent(1.0))
+        world = World([label, fading], columnar=True)
+        assert not world.columns.animating()
+
+        fading.get(AlphaComponent).target_alpha = 0.0
+        assert world.columns.animating()
+
+        world.columns.step_alpha(10.0)
+        assert not world.columns.animating()
+
+    def test_entities_without_alpha_are_ignored_by_fade_check(self):
+        """Test that all_faded only looks at entities with AlphaComponent."""
+        label = GameObject().add(Position(0, 0)).add(LabelComponent("x"))
+        faded = GameObject().add(AlphaComponent(0.0))
+        world = World([label, faded], columnar=True)
+
+        assert world.columns.all_faded()
+
+        faded.get(AlphaComponent).alpha = 0.5
+        assert not world.columns.all_faded()
+
+    def test_removed_entity_gets_plain_components_back(self):
+        """Test that leaving the World copies the data back out of the arrays."""
+        e = GameObject().add(Position(5, 6)).add(AlphaComponent(0.3))
+        world = World([e], columnar=True)
+
+        world.remove(e)
+
+        pos = e.get(Position)
+        alpha = e.get(AlphaComponent)
+        assert type(pos) is Position
+        assert type(alpha) is AlphaComponent
+        assert (pos.x, pos.y) == (5, 6)
+        assert alpha.alpha == pytest.approx(0.3)
+
+    def test_rows_are_reused_and_arrays_grow(self):
+        """Test that the store grows past its capacity and reuses freed rows."""
+        entities = [GameObject().add(Position(i, i)) for i in range(100)]
+        world = World(entities, columnar=True)
+        assert world.columns.capacity >= 100
+        assert entities[99].get(Position).x == 99
+
+        world.remove(entities[0])
+        newcomer = GameObject().add(Position(-1, -1))
+        world.append(newcomer)
+
+        assert world.columns.size == 100
+        assert newcomer.get(Position).x == -1
+
+    def test_scene_fade_out_uses_columns(self):
+        """Test that BaseScene fade handling works on a columnar World."""
+        scene = BaseScene(Mock())
+        entity = GameObject().add(AlphaComponent(1.0))
+        scene.entities = World([entity], columnar=True)
+
+        callback = Mock()
+        scene.start_fade_out(on_complete_callback=callback)
+        assert entity.get(AlphaComponent).target_alpha == 0.0
+
+        scene._handle_fade_out(0.016)
+        callback.assert_not_called()
+
+        scene.entities.columns.step_alpha(1.0)
+        scene._handle_fade_out(0.016)
+        callback.assert_called_once()
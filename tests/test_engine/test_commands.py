@@ -0,0 +1,84 @@
+from unittest.mock import Mock
+
+from engine.commands import CommandBuffer
+from engine.components import ButtonComponent, LabelComponent, Position
+from engine.ecs import GameObject
+from engine.world import World
+
+
+class TestCommandBuffer:
+    def test_commands_are_deferred_until_apply(self):
+        """Test that recording commands does not touch the World."""
+        world = World()
+        e = GameObject().add(Position(0, 0))
+        world.commands.spawn(e)
+
+        assert len(world) == 0
+        world.apply_commands()
+        assert list(world) == [e]
+        assert len(world.commands) == 0
+
+    def test_despawn_removes_entities_in_bulk(self):
+        """Test that despawned entities leave the World and its queries."""
+        entities = [GameObject().add(Position(i, i)) for i in range(5)]
+        world = World(entities)
+        for e in entities[1:4]:
+            world.commands.despawn(e)
+
+        world.apply_commands()
+
+        assert list(world) == [entities[0], entities[4]]
+        assert [row[0] for row in world.query(Position)] == [entities[0], entities[4]]
+
+    def test_component_changes_update_archetypes(self):
+        """Test that add/remove component commands are visible to queries."""
+        e = GameObject().add(Position(0, 0)).add(LabelComponent("Label"))
+        world = World([e])
+        world.commands.add_component(e, ButtonComponent("OK"))
+        world.commands.remove_component(e, LabelComponent)
+
+        world.apply_commands()
+
+        assert e.get(LabelComponent) is None
+        assert len(world.query(Position, ButtonComponent)) == 1
+        assert world.query(LabelComponent) == []
+
+    def test_commands_apply_in_recorded_order(self):
+        """Test that a spawn followed by a component add works on the new entity."""
+        world = World()
+        e = GameObject()
+        world.commands.spawn(e)
+        world.commands.add_component(e, Position(1, 2))
+        callback = Mock()
+        world.commands.call(callback)
+
+        world.apply_commands()
+
+        assert world.query(Position)[0][0] is e
+        callback.assert_called_once()
+
+    def test_commands_recorded_while_applying_wait_for_next_batch(self):
+        """Test that callbacks can record new commands without re-entering apply."""
+        world = World()
+        late = GameObject()
+        buffer: CommandBuffer = world.commands
+        buffer.call(lambda: buffer.spawn(late))
+
+        world.apply_commands()
+        assert late not in world
+
+        world.apply_commands()
+        assert late in world
+
+
+class TestGameObjectRemove:
+    def test_remove_component_updates_world(self):
+        """Test that GameObject.remove moves the entity to a new archetype."""
+        e = GameObject().add(Position(0, 0)).add(LabelComponent("Label"))
+        world = World([e])
+
+        removed = e.remove(LabelComponent)
+
+        assert isinstance(removed, LabelComponent)
+        assert world.query(LabelComponent) == []
+        assert e.remove(LabelComponent) is None
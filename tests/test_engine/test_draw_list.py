@@ -0,0 +1,87 @@
+from unittest.mock import Mock
+
+import pygame
+
+from engine.draw_list import LAYER_MODAL, DrawList
+
+
+def solid(color, size=(10, 10)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+class TestDrawList:
+    def test_layers_are_drawn_in_order(self):
+        """Test that higher layers end up on top regardless of submission order."""
+        draw_list = DrawList()
+        screen = pygame.Surface((20, 20))
+
+        draw_list.blit(solid((255, 0, 0)), (0, 0), layer=LAYER_MODAL)
+        draw_list.blit(solid((0, 255, 0)), (0, 0))
+        draw_list.flush(screen)
+
+        assert screen.get_at((5, 5))[:3] == (255, 0, 0)
+        assert len(draw_list) == 0
+
+    def test_same_layer_keeps_submission_order(self):
+        """Test that commands on one layer are drawn in the order they were queued."""
+        draw_list = DrawList()
+        screen = pygame.Surface((20, 20))
+
+        draw_list.blit(solid((255, 0, 0)), (0, 0))
+        draw_list.blit(solid((0, 255, 0)), (0, 0))
+        draw_list.flush(screen)
+
+        assert screen.get_at((5, 5))[:3] == (0, 255, 0)
+
+    def test_blits_are_batched(self):
+        """Test that consecutive blits go to the target in one blits call."""
+        draw_list = DrawList()
+        target = Mock()
+
+        for x in range(5):
+            draw_list.blit(solid((255, 255, 255)), (x * 10, 0))
+        draw_list.flush(target)
+
+        target.blits.assert_called_once()
+        assert len(target.blits.call_args.args[0]) == 5
+        assert draw_list.batches == 1
+
+    def test_calls_split_batches(self):
+        """Test that a primitive between blits is drawn in sequence."""
+        draw_list = DrawList()
+        screen = pygame.Surface((20, 20))
+        rect = pygame.Rect(0, 0, 10, 10)
+
+        draw_list.blit(solid((255, 0, 0)), (0, 0))
+        draw_list.call(lambda target: target.fill((0, 0, 255), rect), rect)
+        draw_list.blit(solid((0, 255, 0), (5, 5)), (0, 0))
+        draw_list.flush(screen)
+
+        assert draw_list.batches == 2
+        assert screen.get_at((2, 2))[:3] == (0, 255, 0)
+        assert screen.get_at((7, 7))[:3] == (0, 0, 255)
+
+    def test_submit_returns_covered_area(self):
+        """Test that queued commands report their area before drawing."""
+        draw_list = DrawList()
+
+        whole = draw_list.blit(solid((0, 0, 0), (30, 20)), (5, 6))
+        part = draw_list.blit(
+            solid((0, 0, 0), (30, 20)), (1, 2), pygame.Rect(0, 0, 4, 3)
+        )
+
+        assert whole == pygame.Rect(5, 6, 30, 20)
+        assert part == pygame.Rect(1, 2, 4, 3)
+
+    def test_clear_drops_commands(self):
+        """Test that cleared commands are never drawn."""
+        draw_list = DrawList()
+        target = Mock()
+
+        draw_list.blit(solid((255, 255, 255)), (0, 0))
+        draw_list.clear()
+        draw_list.flush(target)
+
+        target.blits.assert_not_called()
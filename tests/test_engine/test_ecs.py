@@ -0,0 +1,66 @@
+import gc
+
+import pytest
+
+from engine.ecs import (
+    EntityAllocator,
+    GameObject,
+    entity_generation,
+    entity_index,
+    get_entity_allocator,
+)
+from engine.components import Position
+
+
+class TestEntityAllocator:
+    def test_allocate_returns_unique_handles(self):
+        """Test that live handles never collide."""
+        allocator = EntityAllocator()
+        handles = {allocator.allocate() for _ in range(100)}
+        assert len(handles) == 100
+        assert allocator.live_count == 100
+
+    def test_released_index_is_reused_with_new_generation(self):
+        """Test that a freed index comes back with a bumped generation."""
+        allocator = EntityAllocator()
+        old = allocator.allocate()
+        allocator.release(old)
+        new = allocator.allocate()
+
+        assert entity_index(new) == entity_index(old)
+        assert entity_generation(new) == entity_generation(old) + 1
+        assert not allocator.is_alive(old)
+        assert allocator.is_alive(new)
+
+    def test_double_release_is_ignored(self):
+        """Test that releasing a stale handle does not free the index twice."""
+        allocator = EntityAllocator()
+        handle = allocator.allocate()
+        allocator.release(handle)
+        allocator.release(handle)
+
+        assert allocator.allocate() != allocator.allocate()
+
+
+class TestGameObject:
+    def test_game_object_has_live_handle(self):
+        """Test that every GameObject gets a live integer id."""
+        e = GameObject()
+        assert isinstance(e.id, int)
+        assert get_entity_allocator().is_alive(e.id)
+
+    def test_handle_released_when_object_is_collected(self):
+        """Test that the handle goes stale once the GameObject is gone."""
+        e = GameObject()
+        handle = e.id
+        del e
+        gc.collect()
+        assert not get_entity_allocator().is_alive(handle)
+
+    def test_game_object_uses_slots(self):
+        """Test that GameObject and components reject unknown attributes."""
+        e = GameObject()
+        with pytest.raises(AttributeError):
+            e.name = "player"
+        with pytest.raises(AttributeError):
+            Position(0, 0).z = 1
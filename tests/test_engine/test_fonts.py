@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+import pygame
+import pytest
+
+from config import GameConfig
+from engine import AssetLoader, FontRegistry, FontTask
+from engine.fonts import BOLD, ITALIC
+from engine.systems import RenderSystem
+
+
+class TestFontRegistry:
+    @pytest.fixture(autouse=True)
+    def font_module(self):
+        pygame.font.init()
+
+    def test_font_is_loaded_once(self):
+        """Test that the same size/path/style returns the shared font."""
+        fonts = FontRegistry()
+
+        first = fonts.get(20)
+        second = fonts.get(20)
+
+        assert first is second
+        assert fonts.loads == 1
+        assert len(fonts) == 1
+
+    def test_style_picks_bundled_font(self):
+        """Test that bold/italic without a path load the bundled style files."""
+        fonts = FontRegistry()
+        with patch("engine.fonts.load_font_with_fallback") as load:
+            load.side_effect = lambda size, path: pygame.font.Font(None, size)
+            fonts.get(16, style=BOLD)
+            fonts.get(16, style=ITALIC)
+
+        paths = [call.args[1] for call in load.call_args_list]
+        assert paths == [GameConfig.BOLD_FONT_PATH, GameConfig.ITALIC_FONT_PATH]
+
+    def test_style_is_applied_to_explicit_path(self):
+        """Test that a style on an explicit font file uses set_bold/set_italic."""
+        fonts = FontRegistry()
+
+        bold = fonts.get(16, GameConfig.DEFAULT_FONT_PATH, BOLD)
+        regular = fonts.get(16, GameConfig.DEFAULT_FONT_PATH)
+
+        assert bold is not regular
+        assert bold.get_bold()
+        assert not regular.get_bold()
+
+    def test_system_fonts_are_cached(self):
+        """Test that system fonts are loaded once per name/size/style."""
+        fonts = FontRegistry()
+
+        first = fonts.system(GameConfig.DEFAULT_FONT, 18)
+        second = fonts.system(GameConfig.DEFAULT_FONT, 18)
+
+        assert first is second
+        assert (f"sys:{GameConfig.DEFAULT_FONT}", 18, "regular") in fonts
+
+    def test_font_task_preloads(self):
+        """Test that a FontTask run by the AssetLoader fills the registry."""
+        fonts = FontRegistry()
+        loader = AssetLoader(frames_per_task=1)
+        loader.add_task(FontTask("Fonts", fonts, [(18,), (24, None, BOLD)]))
+
+        loader.execute_next_task(0.016)
+
+        assert fonts.loads == 2
+        assert fonts.get(18) is fonts.get(18)
+        assert fonts.loads == 2
+
+    def test_render_system_shares_registry(self):
+        """Test that the render system takes its fonts from a passed registry."""
+        fonts = FontRegistry()
+        screen = pygame.Surface((640, 480))
+
+        render = RenderSystem(screen, fonts.get(18), fonts=fonts)
+
+        assert render.fonts is fonts
+        assert render.h1_font is fonts.get(GameConfig.H1_FONT_SIZE)
@@ -0,0 +1,115 @@
+import pygame
+import pytest
+
+from engine.components import InputFieldComponent, LabelComponent, Position
+from engine.fonts import FontRegistry
+from engine.glyph_atlas import GlyphAtlas
+from engine.systems import RenderSystem
+
+
+@pytest.fixture(autouse=True)
+def font_module():
+    pygame.font.init()
+
+
+@pytest.fixture
+def font():
+    # The bundled font has no kerning pairs, so composed text matches font.size
+    return FontRegistry().get(24)
+
+
+class CountingFont(pygame.font.Font):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.renders = 0
+
+    def render(self, *args, **kwargs):
+        self.renders += 1
+        return super().render(*args, **kwargs)
+
+
+class TestGlyphAtlas:
+    def test_text_size_matches_font(self, font):
+        """Test that composed text is as wide as the font renders it."""
+        atlas = GlyphAtlas(font, (255, 255, 255))
+
+        assert atlas.size("Attempts: 12") == font.size("Attempts: 12")
+
+    def test_draw_is_centered(self, font):
+        """Test that draw centers the text and returns the covered area."""
+        atlas = GlyphAtlas(font, (255, 255, 255))
+        screen = pygame.Surface((200, 100))
+
+        rect = atlas.draw(screen, "42", (100, 50))
+
+        assert rect.center == (100, 50)
+        assert rect.size == atlas.size("42")
+        assert screen.get_bounding_rect().colliderect(rect)
+
+    def test_missing_glyph_rebuilds_into_new_surface(self, font):
+        """Test that an unknown character rebuilds the atlas without touching the old surface."""
+        atlas = GlyphAtlas(font, (255, 255, 255), charset="0123456789")
+        old = atlas.surface
+
+        atlas.draw(pygame.Surface((100, 50)), "12", (50, 25))
+        assert atlas.builds == 1
+
+        atlas.draw(pygame.Surface((100, 50)), "1-2", (50, 25))
+        assert atlas.builds == 2
+        assert atlas.surface is not old
+
+    def test_glyphs_are_rendered_once(self):
+        """Test that changing strings only render each glyph once."""
+        font = CountingFont(None, 24)
+        atlas = GlyphAtlas(font, (255, 255, 255), charset="")
+        screen = pygame.Surface((200, 100))
+
+        for i in range(50):
+            atlas.draw(screen, f"{i % 10}%", (100, 50))
+
+        # One render per distinct glyph: the ten digits and "%"
+        assert font.renders == 11
+
+
+class TestRenderSystemDynamicText:
+    def test_dynamic_label_skips_text_cache(self, font):
+        """Test that dynamic labels are drawn from the atlas, not the text cache."""
+        render = RenderSystem(pygame.Surface((640, 480)), font)
+        label = LabelComponent("Attempts: 0", (200, 200, 200), dynamic=True)
+
+        for i in range(10):
+            label.text = f"Attempts: {i}"
+            render.draw_label(label, Position(320, 240))
+
+        assert len(render.text_cache) == 0
+        assert len(render.glyph_atlases) == 1
+
+    def test_faded_dynamic_text_reuses_atlas_variant(self, font):
+        """Test that translucent dynamic text reuses one alpha variant of the atlas."""
+        render = RenderSystem(pygame.Surface((640, 480)), font)
+        label = LabelComponent("0%", dynamic=True)
+
+        for i in range(10):
+            label.text = f"{i}%"
+            render.draw_label(label, Position(320, 240), 0.5)
+
+        assert render.alpha_cache.stats()["misses"] == 1
+
+    @pytest.mark.parametrize("alpha", [1.0, 0.5])
+    def test_new_character_is_drawn_on_first_use(self, font, alpha):
+        """Test that a character missing from the atlas shows up the first time."""
+        render = RenderSystem(pygame.Surface((200, 100)), font)
+
+        render.draw_dynamic_text(font, "é", (255, 255, 255), (100, 50), alpha)
+
+        assert any(pygame.image.tobytes(render.screen, "RGB"))
+
+    def test_input_text_uses_atlas(self, font):
+        """Test that typed input text is composed from glyphs."""
+        render = RenderSystem(pygame.Surface((640, 480)), font)
+        inp = InputFieldComponent()
+        inp.text = "123"
+
+        render.draw_input(inp, Position(320, 240))
+
+        assert len(render.glyph_atlases) == 1
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from engine.components import HierarchyComponent, Position
+from engine.ecs import GameObject
+from engine.hierarchy import attach, detach
+from engine.systems import TransformSystem
+from engine.world import World
+
+
+def make_panel():
+    panel = GameObject().add(Position(320, 240))
+    title = attach(GameObject().add(Position(0, -100)), panel)
+    button = attach(GameObject().add(Position(-70, 30)), panel)
+    return panel, title, button
+
+
+class TestHierarchy:
+    def test_attach_uses_position_as_local_offset(self):
+        """Test that attaching converts the child's Position to a world position."""
+        panel, title, _ = make_panel()
+
+        node = title.get(HierarchyComponent)
+        assert node.parent is panel
+        assert (node.local_x, node.local_y) == (0, -100)
+        assert (title.get(Position).x, title.get(Position).y) == (320, 140)
+        assert panel.get(HierarchyComponent).children[0] is title
+
+    def test_detach_keeps_world_position(self):
+        """Test that a detached child becomes a root where it is."""
+        panel, title, button = make_panel()
+
+        detach(title)
+
+        assert title.get(HierarchyComponent).parent is None
+        assert panel.get(HierarchyComponent).children == [button]
+        assert (title.get(Position).x, title.get(Position).y) == (320, 140)
+
+    def test_reattach_moves_child_between_parents(self):
+        """Test that attaching to a new parent removes the old link."""
+        panel, title, _ = make_panel()
+        other = GameObject().add(Position(0, 0))
+
+        title.get(Position).x, title.get(Position).y = 5, 5
+        attach(title, other)
+
+        assert title not in panel.get(HierarchyComponent).children
+        assert other.get(HierarchyComponent).children == [title]
+
+
+class TestTransformSystem:
+    def test_moving_parent_moves_subtree(self):
+        """Test that children follow a moved container."""
+        panel, title, button = make_panel()
+        world = World([panel, title, button])
+        system = TransformSystem()
+        system.update(world)
+
+        panel.get(Position).set(x=100)
+        system.update(world)
+
+        assert title.get(Position).x == 100
+        assert button.get(Position).x == 30
+        assert title.get(Position).y == 140
+
+    def test_changed_local_offset_is_applied(self):
+        """Test that changing a child's local offset updates its Position."""
+        panel, title, button = make_panel()
+        world = World([panel, title, button])
+        system = TransformSystem()
+        system.update(world)
+
+        title.get(HierarchyComponent).set(local_y=-120)
+        system.update(world)
+
+        assert title.get(Position).y == 120
+
+    def test_nested_children_are_updated(self):
+        """Test that grandchildren follow their grandparent."""
+        panel, title, button = make_panel()
+        icon = attach(GameObject().add(Position(4, 0)), button)
+        world = World([panel, title, button, icon])
+        system = TransformSystem()
+        system.update(world)
+
+        panel.get(Position).set(y=0)
+        system.update(world)
+
+        assert (icon.get(Position).x, icon.get(Position).y) == (254, 30)
+
+    def test_only_dirty_subtrees_are_visited(self):
+        """Test that an unchanged hierarchy is not recomputed."""
+        panel, title, button = make_panel()
+        other, other_child = GameObject().add(Position(0, 0)), GameObject().add(
+            Position(1, 1)
+        )
+        attach(other_child, other)
+        world = World([panel, title, button, other, other_child])
+        system = TransformSystem()
+        system.update(world)
+
+        with patch("engine.systems.transform.propagate") as propagate:
+            system.update(world)
+            propagate.assert_not_called()
+
+            other.get(Position).set(x=10)
+            system.update(world)
+            propagate.assert_called_once_with(other)
+
+    def test_plain_lists_are_supported(self):
+        """Test that the system also works on plain entity lists."""
+        panel, title, button = make_panel()
+        system = TransformSystem()
+
+        panel.get(Position).x = 0
+        system.update([panel, title, button])
+
+        assert title.get(Position).x == 0
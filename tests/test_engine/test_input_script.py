@@ -0,0 +1,67 @@
+import json
+
+import pygame
+import pytest
+
+from engine.input_script import InputScript
+
+
+class TestInputScript:
+    def test_events_are_returned_at_their_frame(self):
+        """Test that scripted events come back only at the frame they were added for."""
+        script = InputScript().key(3, pygame.K_RETURN, "\r").quit(5)
+
+        assert script.events(1) == []
+        assert [e.type for e in script.events(3)] == [pygame.KEYDOWN, pygame.KEYUP]
+        assert script.events(3)[0].key == pygame.K_RETURN
+        assert [e.type for e in script.events(5)] == [pygame.QUIT]
+        assert script.length == 5
+
+    def test_text_types_one_character_per_frame(self):
+        """Test that text() presses one key per frame with its unicode."""
+        script = InputScript().text(10, "42")
+
+        assert script.events(10)[0].unicode == "4"
+        assert script.events(11)[0].key == pygame.K_2
+
+    def test_click_moves_presses_and_releases(self):
+        """Test that click() hovers the position before pressing the button."""
+        script = InputScript().click(1, (100, 50))
+
+        assert [e.type for e in script.events(1)] == [
+            pygame.MOUSEMOTION,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+        ]
+        assert script.events(1)[2].pos == (100, 50)
+
+    def test_repeating_script_starts_over(self):
+        """Test that a repeating script replays its frames after the last one."""
+        script = InputScript(repeat=True).key(2, pygame.K_a, "a").at(4)
+
+        assert script.events(6)[0].unicode == "a"
+        assert script.events(7) == []
+
+    def test_frames_start_at_one(self):
+        """Test that frame 0 is rejected."""
+        with pytest.raises(ValueError):
+            InputScript().quit(0)
+
+    def test_load_json_script(self, tmp_path):
+        """Test that scripts load from JSON with key names and list positions."""
+        path = tmp_path / "script.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"frame": 2, "type": "KEYDOWN", "key": "return", "unicode": "\r"},
+                    {"frame": 3, "type": "MOUSEBUTTONUP", "pos": [10, 20], "button": 1},
+                    {"frame": 4, "type": "QUIT"},
+                ]
+            )
+        )
+
+        script = InputScript.load(str(path))
+
+        assert script.events(2)[0].key == pygame.K_RETURN
+        assert script.events(3)[0].pos == (10, 20)
+        assert script.events(4)[0].type == pygame.QUIT
@@ -0,0 +1,138 @@
+from unittest.mock import Mock
+
+import pytest
+
+from engine.base_scene import BaseScene
+from engine.components import (
+    AlphaComponent,
+    ButtonComponent,
+    InputFieldComponent,
+    Position,
+)
+from engine.ecs import GameObject, get_entity_allocator
+from engine.pool import EntityPool
+from engine.prefab import Prefab
+from engine.service_locator import ServiceLocator
+from engine.systems import InputSystem
+from engine.world import World
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = EntityPool()
+    monkeypatch.setitem(ServiceLocator._services, "entity_pool", pool)
+    return pool
+
+
+class TestEntityPool:
+    def test_acquire_counts_misses_then_hits(self):
+        """Test that released entities are handed out again."""
+        pool = EntityPool()
+        e = pool.acquire()
+        assert pool.misses == 1
+
+        pool.release(e)
+        again = pool.acquire()
+
+        assert again is e
+        assert pool.hits == 1
+        assert again.components == {}
+
+    def test_release_invalidates_handle(self):
+        """Test that a pooled entity's old handle goes stale."""
+        pool = EntityPool()
+        e = GameObject()
+        old_handle = e.id
+
+        pool.release(e)
+        e = pool.acquire()
+
+        assert not get_entity_allocator().is_alive(old_handle)
+        assert get_entity_allocator().is_alive(e.id)
+        assert e.id != old_handle
+
+    def test_release_rejects_entities_in_world(self):
+        """Test that entities must leave their World before pooling."""
+        pool = EntityPool()
+        e = GameObject()
+        World([e])
+        with pytest.raises(ValueError):
+            pool.release(e)
+
+    def test_prefab_reuses_pooled_components(self):
+        """Test that instantiate overwrites pooled components with template values."""
+        pool = EntityPool()
+        prefab = Prefab(Position(0, 0), ButtonComponent(""))
+        old = prefab.instantiate({ButtonComponent: {"text": "Old"}}, pool=pool)
+        old_button = old.get(ButtonComponent)
+        old_button.hover = True
+        pool.release(old)
+
+        new = prefab.instantiate({ButtonComponent: {"text": "New"}}, pool=pool)
+
+        assert new.get(ButtonComponent) is old_button
+        assert old_button.text == "New"
+        assert old_button.hover is False
+        assert pool.stats()["component_hits"] == 2
+
+    def test_max_size_bounds_free_lists(self):
+        """Test that the pool never keeps more than max_size free objects."""
+        pool = EntityPool(max_size=2)
+        pool.acquire_component(Position)
+        pool.release_all(GameObject().add(Position(0, 0)) for _ in range(5))
+
+        stats = pool.stats()
+        assert stats["free_entities"] == 2
+        assert stats["free_components"] == 2
+
+    def test_only_acquired_component_types_are_kept(self):
+        """Test that components no prefab draws from the pool are not kept."""
+        pool = EntityPool()
+        pool.acquire_component(Position)
+        pool.release(GameObject().add(Position(0, 0)).add(AlphaComponent(0.5)))
+
+        assert pool.stats()["free_components"] == 1
+        assert pool.acquire_component(AlphaComponent) is None
+
+    def test_released_components_drop_references(self):
+        """Test that pooled components do not keep click handlers alive."""
+        pool = EntityPool()
+        prefab = Prefab(Position(0, 0), ButtonComponent(""))
+        e = prefab.instantiate({ButtonComponent: {"on_click": lambda: None}}, pool=pool)
+        button = e.get(ButtonComponent)
+
+        pool.release(e)
+
+        assert button.on_click is None
+
+
+class TestSceneRelease:
+    def test_exit_releases_entities_to_pool(self, pool):
+        """Test that BaseScene.exit empties the World into the pool."""
+        scene = BaseScene(Mock())
+        scene.entities = [GameObject().add(Position(0, 0)) for _ in range(3)]
+
+        scene.exit()
+
+        assert len(scene.entities) == 0
+        assert pool.stats()["free_entities"] == 3
+
+    def test_exit_drops_focus_of_released_input(self, pool):
+        """Test that the focused input is unfocused when its entity is pooled."""
+        app = Mock()
+        app.input_system = InputSystem()
+        inp = InputFieldComponent()
+        app.input_system.set_focus(inp)
+        scene = BaseScene(app)
+        scene.entities = [GameObject().add(Position(0, 0)).add(inp)]
+
+        scene.exit()
+
+        assert app.input_system.focused_input is None
+
+    def test_exit_without_pool_keeps_entities(self):
+        """Test that scenes keep their entities when no pool is provided."""
+        scene = BaseScene(Mock())
+        scene.entities = [GameObject()]
+        scene.exit()
+        assert len(scene.entities) == 1
@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+from engine.components import ButtonComponent, LabelComponent, Position, change_tick
+from engine.prefab import Prefab
+from engine.ui_builder import UIBuilder
+
+
+class TestPrefab:
+    def test_instantiate_clones_components(self):
+        """Test that every instance gets its own component objects."""
+        prefab = Prefab(Position(1, 2), LabelComponent("Template"))
+
+        e1 = prefab.instantiate()
+        e2 = prefab.instantiate()
+
+        assert e1.get(Position) is not e2.get(Position)
+        assert e1.get(Position) is not prefab.components[0]
+        assert (e1.get(Position).x, e1.get(Position).y) == (1, 2)
+        assert e1.get(LabelComponent).text == "Template"
+
+    def test_instantiate_applies_overrides(self):
+        """Test that per-component overrides are written to the clones only."""
+        prefab = Prefab(Position(0, 0), LabelComponent("Template"))
+
+        e = prefab.instantiate(
+            {Position: {"x": 5, "y": 6}, LabelComponent: {"text": "Hello"}}
+        )
+
+        assert (e.get(Position).x, e.get(Position).y) == (5, 6)
+        assert e.get(LabelComponent).text == "Hello"
+        assert prefab.components[1].text == "Template"
+
+    def test_clones_count_as_changed(self):
+        """Test that a fresh instance shows up as changed."""
+        prefab = Prefab(LabelComponent("Template"))
+        since = change_tick()
+
+        e = prefab.instantiate()
+
+        assert e.get(LabelComponent).changed_tick > since
+
+    def test_instantiate_many(self):
+        """Test bulk instantiation."""
+        prefab = Prefab(Position(0, 0))
+        entities = prefab.instantiate_many(10)
+        assert len(entities) == 10
+        assert len({id(e.get(Position)) for e in entities}) == 10
+
+
+class TestUIBuilderPrefabs:
+    def test_builder_reuses_prefab_templates(self):
+        """Test that the same prefab serves every button built."""
+        ui = UIBuilder(Mock())
+        ui.button_entity("A", 0, 0, None)
+        prefab = UIBuilder._prefabs["button"]
+        ui.button_entity_with_min_width("B", 0, 0, None, 120)
+
+        assert UIBuilder._prefabs["button"] is prefab
+        assert prefab.components[1].text == ""
+        assert prefab.components[1].min_width == 0
+
+    def test_buttons_do_not_share_state(self):
+        """Test that changing one built button leaves others untouched."""
+        ui = UIBuilder(Mock())
+        b1 = ui.button_entity("A", 0, 0, None).get(ButtonComponent)
+        b2 = ui.button_entity("B", 0, 0, None).get(ButtonComponent)
+
+        b1.hover = True
+
+        assert b2.hover is False
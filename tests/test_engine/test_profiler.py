@@ -0,0 +1,105 @@
+import json
+
+import pygame
+import pytest
+
+from engine.fonts import FontRegistry
+from engine.profiler import FRAME, FrameProfiler, ProfilerOverlay
+from engine.scheduler import Scheduler
+
+
+def _frame(profiler, phases):
+    """Record one frame with the given phase durations (ms)."""
+    profiler.begin_frame()
+    start = 0
+    for name, ms in phases.items():
+        profiler.record(name, start, start + int(ms * 1e6))
+        start += int(ms * 1e6)
+    profiler.end_frame()
+
+
+class TestFrameProfiler:
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler hands out a no-op section and keeps no data."""
+        profiler = FrameProfiler()
+
+        with profiler.section("render"):
+            pass
+        _frame(profiler, {"render": 5})
+
+        assert profiler.frames == 0
+        assert profiler.phases == []
+        assert profiler.stats("render")["avg"] == 0.0
+
+    def test_stats_and_histogram(self):
+        """Test that per-frame phase times give avg/p95/max and histogram counts."""
+        profiler = FrameProfiler(enabled=True)
+        for ms in (2, 6, 10):
+            _frame(profiler, {"render": ms, "sound": 1})
+
+        stats = profiler.stats("render")
+        assert stats["avg"] == pytest.approx(6.0)
+        assert stats["max"] == pytest.approx(10.0)
+        assert profiler.phases == ["render", "sound"]
+        assert sum(profiler.histogram("render")) == 3
+        assert profiler.histogram("render", bounds_ms=(5.0,)) == [1, 2]
+
+    def test_phase_time_adds_up_within_a_frame(self):
+        """Test that a phase recorded twice in a frame is one summed sample."""
+        profiler = FrameProfiler(enabled=True)
+        _frame(profiler, {"render": 1})
+        profiler.begin_frame()
+        profiler.record("render", 0, 1_000_000)
+        profiler.record("render", 0, 2_000_000)
+        profiler.end_frame()
+
+        assert profiler.stats("render")["max"] == pytest.approx(3.0)
+        assert profiler.fps > 0
+
+    def test_chrome_trace_export(self, tmp_path):
+        """Test that spans are written as Chrome trace complete events."""
+        profiler = FrameProfiler(enabled=True)
+        profiler.begin_frame()
+        with profiler.section("events"):
+            pass
+        profiler.end_frame()
+
+        path = profiler.export_chrome_trace(tmp_path / "logs" / "trace.json")
+
+        events = json.loads(path.read_text())["traceEvents"]
+        spans = [event for event in events if event["ph"] == "X"]
+        assert {event["name"] for event in spans} == {"events", FRAME}
+        assert all(event["ts"] >= 0 and event["dur"] >= 0 for event in spans)
+        assert any(event["ph"] == "M" for event in events)
+
+    def test_scheduler_records_system_spans(self):
+        """Test that the scheduler reports each system it runs to its profiler."""
+        profiler = FrameProfiler(enabled=True)
+        scheduler = Scheduler(profiler=profiler)
+        scheduler.add_system("a", lambda dt: None, exclusive=True)
+        scheduler.add_system("b", lambda dt: None)
+
+        profiler.begin_frame()
+        scheduler.run(0.016)
+        profiler.end_frame()
+        scheduler.shutdown()
+
+        assert profiler.phases == ["a", "b"]
+
+
+class TestProfilerOverlay:
+    def test_draw_covers_panel(self):
+        """Test that the overlay draws a panel with a row per phase."""
+        pygame.font.init()
+        profiler = FrameProfiler(enabled=True)
+        _frame(profiler, {"render": 2, "sound": 1})
+        overlay = ProfilerOverlay(profiler, FontRegistry().get(14))
+        target = pygame.Surface((400, 300))
+        target.fill((255, 255, 255))
+
+        rect = overlay.draw(target, (4, 4))
+
+        assert rect.topleft == (4, 4)
+        # Header, frame, two phases and the histogram
+        assert rect.height >= 5 * overlay.line_height
+        assert target.get_at((6, 6)) != target.get_at((399, 299))
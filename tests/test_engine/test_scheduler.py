@@ -0,0 +1,97 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from engine.components import AlphaComponent, LabelComponent, Position, SoundComponent
+from engine.scheduler import Scheduler
+
+
+def _stage_names(scheduler):
+    return [[s.name for s in stage] for stage in scheduler.stages]
+
+
+class TestScheduler:
+    def test_disjoint_systems_share_a_stage(self):
+        """Test that systems touching different data are grouped together."""
+        scheduler = Scheduler()
+        scheduler.add_system("render", Mock(), reads=(Position,), writes=(AlphaComponent,))
+        scheduler.add_system("sound", Mock(), reads=(SoundComponent,), writes=(SoundComponent,))
+
+        assert _stage_names(scheduler) == [["render", "sound"]]
+
+    def test_write_conflicts_keep_registration_order(self):
+        """Test that a reader of written data runs in a later stage."""
+        scheduler = Scheduler()
+        scheduler.add_system("layout", Mock(), writes=(Position,))
+        scheduler.add_system("render", Mock(), reads=(Position, LabelComponent))
+        scheduler.add_system("text", Mock(), writes=(LabelComponent,))
+
+        assert _stage_names(scheduler) == [["layout"], ["render"], ["text"]]
+
+    def test_exclusive_system_gets_own_stage(self):
+        """Test that exclusive systems never share a stage."""
+        scheduler = Scheduler()
+        scheduler.add_system("input", Mock(), exclusive=True)
+        scheduler.add_system("sound", Mock(), reads=(SoundComponent,))
+        scheduler.add_system("render", Mock(), reads=(Position,))
+
+        assert _stage_names(scheduler) == [["input"], ["sound", "render"]]
+
+    def test_run_calls_systems_and_records_timings(self):
+        """Test that run() passes delta time and fills per-system timings."""
+        calls = []
+        scheduler = Scheduler()
+        scheduler.add_system("a", lambda dt: calls.append(("a", dt)), exclusive=True)
+        scheduler.add_system("b", lambda dt: calls.append(("b", dt)))
+
+        scheduler.run(0.5)
+
+        assert calls == [("a", 0.5), ("b", 0.5)]
+        assert set(scheduler.timings) == {"a", "b"}
+        assert all(t >= 0 for t in scheduler.timings.values())
+
+    def test_failing_system_does_not_stop_frame(self):
+        """Test that an exception in one system is logged and others still run."""
+        after = Mock()
+        scheduler = Scheduler()
+        scheduler.add_system("broken", Mock(side_effect=RuntimeError("boom")), exclusive=True)
+        scheduler.add_system("after", after)
+
+        scheduler.run(0.016)
+
+        after.assert_called_once_with(0.016)
+
+    def test_duplicate_names_are_rejected(self):
+        """Test that registering the same name twice raises ValueError."""
+        scheduler = Scheduler()
+        scheduler.add_system("render", Mock())
+        with pytest.raises(ValueError):
+            scheduler.add_system("render", Mock())
+
+    def test_thread_pool_runs_stage_concurrently(self):
+        """Test that with workers a stage's systems run on pool threads."""
+        barrier = threading.Barrier(2, timeout=5)
+        scheduler = Scheduler(workers=2)
+        # Both systems must be running at the same time to pass the barrier
+        scheduler.add_system("a", lambda dt: barrier.wait(), reads=(Position,))
+        scheduler.add_system("b", lambda dt: barrier.wait(), reads=(SoundComponent,))
+
+        try:
+            scheduler.run(0.016)
+        finally:
+            scheduler.shutdown()
+
+        assert not barrier.broken
+
+    def test_sync_callbacks_run_after_every_stage(self):
+        """Test that sync callbacks run between stages."""
+        calls = []
+        scheduler = Scheduler()
+        scheduler.add_system("input", lambda dt: calls.append("input"), exclusive=True)
+        scheduler.add_system("render", lambda dt: calls.append("render"))
+        scheduler.add_sync(lambda: calls.append("sync"))
+
+        scheduler.run(0.016)
+
+        assert calls == ["input", "sync", "render", "sync"]
@@ -0,0 +1,80 @@
+from unittest.mock import Mock, patch
+
+import pygame
+
+from engine.text_cache import TextSurfaceCache
+
+
+def make_font(size=(10, 10)):
+    font = Mock(spec=pygame.font.Font)
+    font.render.side_effect = lambda text, aa, color: pygame.Surface(size)
+    return font
+
+
+class TestTextSurfaceCache:
+    def test_same_text_is_rendered_once(self):
+        """Test that repeated draws of the same text reuse the surface."""
+        cache = TextSurfaceCache(max_bytes=1_000_000)
+        font = make_font()
+
+        first = cache.render(font, "Hello", (255, 255, 255))
+        second = cache.render(font, "Hello", (255, 255, 255))
+
+        assert first is second
+        font.render.assert_called_once_with("Hello", True, (255, 255, 255))
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_key_includes_font_color_and_antialias(self):
+        """Test that different fonts/colors/antialias get separate entries."""
+        cache = TextSurfaceCache(max_bytes=1_000_000)
+        font, other_font = make_font(), make_font()
+
+        cache.render(font, "Hi", (0, 0, 0))
+        cache.render(font, "Hi", (1, 0, 0))
+        cache.render(font, "Hi", (0, 0, 0), antialias=False)
+        cache.render(other_font, "Hi", (0, 0, 0))
+
+        assert len(cache) == 4
+        assert cache.misses == 4
+
+    def test_scaled_result_is_cached(self):
+        """Test that max_width caches the scaled surface."""
+        cache = TextSurfaceCache(max_bytes=1_000_000)
+        font = make_font((200, 20))
+
+        with patch(
+            "engine.text_cache.scale_text_to_width", side_effect=lambda s, w: s
+        ) as scale:
+            cache.render(font, "Title", (0, 0, 0), max_width=100)
+            cache.render(font, "Title", (0, 0, 0), max_width=100)
+
+        scale.assert_called_once()
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the memory budget evicts the oldest unused entries."""
+        font = make_font((10, 10))
+        entry_bytes = pygame.Surface((10, 10)).get_pitch() * 10
+        cache = TextSurfaceCache(max_bytes=entry_bytes * 2)
+
+        cache.render(font, "a", (0, 0, 0))
+        cache.render(font, "b", (0, 0, 0))
+        cache.render(font, "a", (0, 0, 0))  # "b" is now least recently used
+        cache.render(font, "c", (0, 0, 0))
+
+        assert cache.evictions == 1
+        assert cache.bytes == entry_bytes * 2
+        cache.render(font, "a", (0, 0, 0))
+        assert cache.hits == 2
+        cache.render(font, "b", (0, 0, 0))
+        assert cache.misses == 4
+
+    def test_clear_drops_entries(self):
+        """Test that clear empties the cache."""
+        cache = TextSurfaceCache(max_bytes=1_000_000)
+        cache.render(make_font(), "x", (0, 0, 0))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.bytes == 0
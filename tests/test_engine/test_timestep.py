@@ -0,0 +1,82 @@
+import pytest
+
+from engine.components import AlphaComponent, Position
+from engine.ecs import GameObject
+from engine.timestep import FixedTimestep, StateInterpolator
+from engine.world import World
+
+
+class TestFixedTimestep:
+    def test_whole_steps_run_and_remainder_is_kept(self):
+        """Test that frame time turns into whole ticks and the rest carries over."""
+        timestep = FixedTimestep(50)  # 20 ms ticks
+
+        assert timestep.advance(0.05) == 2
+        assert timestep.alpha == pytest.approx(0.5)
+        assert timestep.advance(0.01) == 1
+        assert timestep.alpha == pytest.approx(0.0, abs=1e-9)
+
+    def test_slow_frame_is_capped_and_backlog_dropped(self):
+        """Test that a long frame runs at most max_steps ticks and drops the rest."""
+        timestep = FixedTimestep(100, max_steps=3)
+
+        assert timestep.advance(1.0) == 3
+        assert timestep.dropped == pytest.approx(0.97)
+        # No catch-up on the next frame
+        assert timestep.advance(0.01) == 1
+
+    def test_rate_must_be_positive(self):
+        """Test that a zero tick rate is rejected."""
+        with pytest.raises(ValueError):
+            FixedTimestep(0)
+
+
+class TestStateInterpolator:
+    def tick(self, interpolator, world, change):
+        interpolator.begin_tick(world)
+        change()
+        interpolator.end_tick(world)
+
+    def test_blends_entities_changed_in_last_tick(self):
+        """Test that moved/faded entities are drawn between their last two states."""
+        moving = GameObject().add(Position(0, 0)).add(AlphaComponent(0.0))
+        still = GameObject().add(Position(50, 50))
+        world = World([moving, still])
+        interpolator = StateInterpolator()
+
+        def change():
+            moving.get(Position).set(x=100)
+            moving.get(AlphaComponent).set(alpha=1.0)
+
+        self.tick(interpolator, world, change)
+        interpolator.alpha = 0.25
+
+        pos, alpha = interpolator.blend(moving, moving.get(Position), 1.0)
+        assert (pos.x, pos.y) == (25, 0)
+        assert alpha == pytest.approx(0.25)
+        still_pos = still.get(Position)
+        assert interpolator.blend(still, still_pos, 1.0)[0] is still_pos
+        assert interpolator.active
+
+    def test_stops_blending_after_a_tick_without_changes(self):
+        """Test that entities are drawn as they are once they stop changing."""
+        e = GameObject().add(Position(0, 0))
+        world = World([e])
+        interpolator = StateInterpolator()
+
+        self.tick(interpolator, world, lambda: e.get(Position).set(x=10))
+        self.tick(interpolator, world, lambda: None)
+
+        assert not interpolator.active
+        assert interpolator.blend(e, e.get(Position), 1.0)[0] is e.get(Position)
+
+    def test_new_scene_starts_without_blending(self):
+        """Test that switching entity sets does not blend from stale states."""
+        old = World([GameObject().add(Position(0, 0))])
+        e = GameObject().add(Position(300, 0))
+        interpolator = StateInterpolator()
+        self.tick(interpolator, old, lambda: None)
+
+        self.tick(interpolator, World([e]), lambda: None)
+
+        assert not interpolator.active
@@ -0,0 +1,126 @@
+from engine.ecs import GameObject
+from engine.world import World, query, query_changed
+from engine.components import (
+    AlphaComponent,
+    ButtonComponent,
+    LabelComponent,
+    Position,
+    change_tick,
+)
+
+
+class TestWorld:
+    def test_world_behaves_like_entity_list(self):
+        """Test that World keeps spawn order and list equality."""
+        e1 = GameObject().add(Position(0, 0))
+        e2 = GameObject().add(Position(1, 1))
+        world = World([e1, e2])
+
+        assert world == [e1, e2]
+        assert len(world) == 2
+        assert list(world) == [e1, e2]
+
+    def test_query_returns_only_matching_entities(self):
+        """Test that query yields entities with all required components."""
+        label = GameObject().add(Position(0, 0)).add(LabelComponent("Label"))
+        button = GameObject().add(Position(10, 10)).add(ButtonComponent("OK"))
+        world = World([label, button])
+
+        result = world.query(Position, ButtonComponent)
+
+        assert len(result) == 1
+        entity, pos, btn = result[0]
+        assert entity is button
+        assert pos is button.get(Position)
+        assert btn is button.get(ButtonComponent)
+
+    def test_query_optional_components_are_none_when_missing(self):
+        """Test that optional components are filled with None."""
+        e1 = GameObject().add(Position(0, 0)).add(AlphaComponent(0.5))
+        e2 = GameObject().add(Position(1, 1))
+        world = World([e1, e2])
+
+        result = world.query(Position, optional=(AlphaComponent,))
+
+        assert [r[2] for r in result] == [e1.get(AlphaComponent), None]
+
+    def test_query_is_cached_until_structure_changes(self):
+        """Test that queries are cached and invalidated on structural changes."""
+        e1 = GameObject().add(Position(0, 0))
+        world = World([e1])
+
+        first = world.query(Position)
+        assert world.query(Position) is first
+
+        e2 = GameObject().add(Position(1, 1))
+        world.append(e2)
+        second = world.query(Position)
+        assert second is not first
+        assert [r[0] for r in second] == [e1, e2]
+
+    def test_adding_component_moves_entity_to_new_archetype(self):
+        """Test that GameObject.add on a member entity updates the archetypes."""
+        e = GameObject().add(Position(0, 0))
+        world = World([e])
+        assert world.query(Position, AlphaComponent) == []
+
+        e.add(AlphaComponent(1.0))
+
+        assert frozenset({Position, AlphaComponent}) in world.archetypes()
+        assert frozenset({Position}) not in world.archetypes()
+        assert [r[0] for r in world.query(Position, AlphaComponent)] == [e]
+
+    def test_removed_entities_leave_queries(self):
+        """Test that removing entities detaches them from the world."""
+        e1 = GameObject().add(Position(0, 0))
+        e2 = GameObject().add(Position(1, 1))
+        world = World([e1, e2])
+
+        world.remove(e1)
+
+        assert [r[0] for r in world.query(Position)] == [e2]
+        assert e1._world is None
+        # Further changes to a removed entity don't affect the world
+        e1.add(AlphaComponent(1.0))
+        assert world.query(AlphaComponent) == []
+
+    def test_query_helper_scans_plain_lists(self):
+        """Test that the query helper also works with plain lists."""
+        e1 = GameObject().add(Position(0, 0)).add(ButtonComponent("A"))
+        e2 = GameObject().add(LabelComponent("B"))
+
+        result = query([e1, e2], ButtonComponent, optional=(Position,))
+
+        assert result == [(e1, e1.get(ButtonComponent), e1.get(Position))]
+
+    def test_entity_resolves_handles(self):
+        """Test that entity() finds members by id and ignores removed ones."""
+        e1 = GameObject().add(Position(0, 0))
+        e2 = GameObject().add(Position(1, 1))
+        world = World([e1, e2])
+
+        assert world.entity(e1.id) is e1
+        world.remove(e1)
+        assert world.entity(e1.id) is None
+        assert world.entity(e2.id) is e2
+
+    def test_query_changed_returns_only_changed_rows(self):
+        """Test that query_changed filters rows by change tick."""
+        e1 = GameObject().add(Position(0, 0)).add(LabelComponent("A"))
+        e2 = GameObject().add(Position(1, 1)).add(LabelComponent("B"))
+        world = World([e1, e2])
+        since = change_tick()
+
+        assert world.query_changed(since, LabelComponent) == []
+
+        e2.get(LabelComponent).set(text="C")
+        changed = world.query_changed(since, Position, LabelComponent)
+        assert [row[0] for row in changed] == [e2]
+        assert [row[0] for row in query_changed(list(world), since, LabelComponent)] == [e2]
+
+    def test_query_changed_skips_unstamped_components(self):
+        """Test that a component stored without being stamped counts as unchanged."""
+        e = GameObject()
+        e.components[Position] = Position(0, 0)
+
+        assert query_changed([e], 0, Position) == []
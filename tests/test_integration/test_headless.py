@@ -0,0 +1,53 @@
+import pygame
+import pytest
+
+from engine import ServiceLocator
+from engine.input_script import InputScript
+
+
+@pytest.fixture
+def headless_env(monkeypatch):
+    """Restore the SDL drivers and services a headless GameApp changes."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.setattr(ServiceLocator, "_services", dict(ServiceLocator._services))
+
+
+class TestHeadlessApp:
+    def test_scripted_run_reaches_game_scene(self, headless_env):
+        """Test that a headless app runs scripted input through scene transitions."""
+        from app import GameApp
+        from engine.components import InputFieldComponent
+        from game.scenes.game import GameScene
+
+        script = InputScript().key(60, pygame.K_RETURN, "\r").text(120, "5").quit(150)
+        app = GameApp(headless=True, input_script=script)
+        app.run()
+
+        assert app.frame == 150
+        assert app.fps == 0
+        assert isinstance(app.scene_manager.current, GameScene)
+        scene = app.scene_manager.current
+        assert scene.input_ent.get(InputFieldComponent).text == "5"
+
+    def test_sound_shortcut_redraws_menu_icon(self, headless_env):
+        """Test that the Ctrl+M toggle marks the sound button icon as changed."""
+        from app import GameApp
+        from engine.components import ImageComponent
+        from game.scenes.menu import MenuScene
+
+        app = GameApp(headless=True, input_script=InputScript().quit(30))
+        app.run()
+        scene = app.scene_manager.current
+        assert isinstance(scene, MenuScene)
+        icon = scene.btn_sound.get(ImageComponent)
+        path = icon.image_path
+        app.render_system.needs_redraw(scene.entities)
+        assert not app.render_system.needs_redraw(scene.entities)
+
+        app._dispatch_event(
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m, mod=pygame.KMOD_CTRL)
+        )
+
+        assert icon.image_path != path
+        assert app.render_system.needs_redraw(scene.entities)
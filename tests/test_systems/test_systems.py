@@ -2,8 +2,11 @@ import pytest
 from unittest.mock import Mock, patch
 import pygame
 
-from engine.systems import RenderSystem, InputSystem, SoundSystem
+from engine.systems import AnimationSystem, RenderSystem, InputSystem, SoundSystem
+from config import GameConfig
 from engine.ecs import GameObject
+from engine.world import World
+from engine.draw_list import LAYER_MODAL
 from engine.components import (
     Position,
     LabelComponent,
@@ -11,7 +14,11 @@ from engine.components import (
     InputFieldComponent,
     AlphaComponent,
     SoundComponent,
+    LayerComponent,
+    OverlayComponent,
+    ProgressBarComponent,
 )
+from engine.tweens import cancel_tweens, tween
 
 
 class TestRenderSystem:
@@ -68,6 +75,23 @@ class TestRenderSystem:
             )
             mock_surface.blit.assert_called()
 
+    def test_unchanged_label_is_rendered_once(self, mock_surface, mock_font):
+        """Test that drawing the same label twice reuses the cached text surface."""
+        with patch("pygame.font.Font"), patch("pygame.font.SysFont"):
+            render_system = RenderSystem(mock_surface, mock_font)
+            label = LabelComponent("Cached", (255, 255, 255))
+            position = Position(100, 100)
+
+            mock_surf = Mock()
+            mock_font.render.return_value = mock_surf
+            mock_surf.get_rect.return_value = pygame.Rect(0, 0, 100, 20)
+
+            render_system.draw_label(label, position)
+            render_system.draw_label(label, position)
+
+            mock_font.render.assert_called_once()
+            assert mock_surface.blit.call_count == 2
+
     def test_draw_button_calls_render(self, mock_surface, mock_font):
         """Test that draw_button calls the font's render method."""
         # Patch all pygame operations to avoid initialization issues
@@ -130,22 +154,410 @@ class TestRenderSystem:
             mock_font.render.assert_called_with("Click Me", True, (0, 0, 0))
             mock_draw_rect.assert_called()  # Verify that drawing operations were called
 
-    def test_update_with_alpha_component(self, mock_surface, mock_font):
-        """Test that update processes alpha component for smooth transitions."""
+    def test_update_does_not_animate_alpha(self, mock_surface, mock_font):
+        """Test that update only reads alpha (the AnimationSystem advances it)."""
         with patch("pygame.font.Font"), patch("pygame.font.SysFont"):
             render_system = RenderSystem(mock_surface, mock_font)
 
             entity = GameObject()
-            entity.add(Position(100, 100)).add(LabelComponent("Test")).add(
-                AlphaComponent(0.5)
-            )
+            alpha = AlphaComponent(0.5)
+            alpha.target_alpha = 1.0
+            entity.add(Position(100, 100)).add(LabelComponent("Test")).add(alpha)
 
-            # Mock the draw method
-            with patch.object(render_system, "draw_label"):
+            with patch.object(render_system, "draw_label") as mock_draw_label:
                 render_system.update([entity])
 
-                # Check that alpha was used in draw call
-                # The alpha value should have been processed in the update loop
+            assert alpha.alpha == 0.5
+            assert mock_draw_label.call_args.args[2] == 0.5
+
+
+class TestDirtyRectRendering:
+    @pytest.fixture
+    def render_system(self, make_render_system):
+        return make_render_system(use_dirty_rects=True)
+
+    @staticmethod
+    def label(text, x, y):
+        return GameObject().add(Position(x, y)).add(LabelComponent(text))
+
+    def test_first_frame_redraws_everything(self, render_system):
+        """Test that the first dirty-rect update is a full redraw."""
+        world = World([self.label("A", 100, 100)])
+
+        render_system.update(world)
+
+        assert render_system.dirty_rects == [render_system.screen.get_rect()]
+
+    def test_idle_frame_has_no_dirty_rects(self, render_system):
+        """Test that nothing is redrawn when no component changed."""
+        world = World([self.label("A", 100, 100), self.label("B", 300, 300)])
+        render_system.update(world)
+
+        with patch.object(render_system, "draw_label") as draw_label:
+            render_system.update(world)
+
+        assert render_system.dirty_rects == []
+        draw_label.assert_not_called()
+
+    def test_changed_entity_redraws_only_its_area(self, render_system):
+        """Test that a changed label dirties its old and new area only."""
+        a, b, c = self.label("A", 100, 100), self.label("B", 300, 300), self.label(
+            "C", 500, 100
+        )
+        world = World([a, b, c])
+        render_system.update(world)
+
+        a.get(LabelComponent).set(text="Changed")
+        render_system.update(world)
+
+        assert len(render_system.dirty_rects) == 1
+        dirty = render_system.dirty_rects[0]
+        assert dirty.collidepoint(100, 100)
+        assert not dirty.collidepoint(300, 300)
+
+    def test_removed_entity_area_is_cleared(self, render_system):
+        """Test that removing an entity clears the area it covered."""
+        a, b = self.label("A", 100, 100), self.label("B", 300, 300)
+        world = World([a, b])
+        render_system.update(world)
+        drawn = render_system._drawn[b]
+
+        world.remove(b)
+        render_system.update(world)
+
+        assert render_system.dirty_rects == [drawn]
+        background = render_system.screen.get_at(drawn.center)[:3]
+        assert background == tuple(GameConfig.BACKGROUND_COLOR)[:3]
+
+    def test_result_matches_full_redraw(self, render_system):
+        """Test that partial redraws produce the same pixels as a full redraw."""
+        a, b = self.label("Overlap", 100, 100), self.label("Other", 110, 104)
+        world = World([a, b])
+        render_system.update(world)
+        a.get(Position).set(x=120)
+        render_system.update(world)
+
+        full = RenderSystem(pygame.Surface((640, 400)), render_system.font)
+        full.screen.fill(GameConfig.BACKGROUND_COLOR)
+        full.update(world)
+
+        assert pygame.image.tobytes(render_system.screen, "RGB") == (
+            pygame.image.tobytes(full.screen, "RGB")
+        )
+
+
+class TestRenderLayers:
+    @pytest.fixture
+    def screen(self):
+        return pygame.Surface((640, 400))
+
+    @staticmethod
+    def panel(layer=LAYER_MODAL):
+        return (
+            GameObject()
+            .add(Position(320, 200))
+            .add(OverlayComponent(200, 100, (40, 40, 120), (40, 40, 120)))
+            .add(LayerComponent(layer))
+        )
+
+    @staticmethod
+    def label(text, layer=None):
+        e = GameObject().add(Position(320, 200)).add(LabelComponent(text))
+        return e.add(LayerComponent(layer)) if layer is not None else e
+
+    def test_higher_layer_is_drawn_on_top(self, screen, make_render_system):
+        """Test that a modal panel covers default-layer entities listed after it."""
+        render_system = make_render_system(screen, font_size=40)
+        hidden = self.label("XXXXXXXX")
+
+        render_system.update(World([self.panel(), hidden]))
+
+        colors = {screen.get_at((x, 200))[:3] for x in range(260, 380)}
+        assert colors == {(40, 40, 120)}
+
+    def test_content_on_the_panel_layer_stays_visible(
+        self, screen, make_render_system
+    ):
+        """Test that content sharing the panel's layer is drawn after the panel."""
+        render_system = make_render_system(screen, font_size=40)
+
+        world = World([self.panel(), self.label("XXXXXXXX", LAYER_MODAL)])
+        render_system.update(world)
+
+        colors = {screen.get_at((x, 200))[:3] for x in range(260, 380)}
+        assert (255, 255, 255) in colors
+
+    def test_frame_is_submitted_in_one_batch(self, screen, make_render_system):
+        """Test that a frame of text-only entities is drawn with one blits call."""
+        render_system = make_render_system(screen)
+        world = World([self.label(str(i)) for i in range(5)])
+
+        render_system.update(world)
+
+        assert render_system.draw_list.batches == 1
+
+    def test_dirty_redraw_respects_layers(self, screen, make_render_system):
+        """Test that a partial redraw under a modal panel keeps the panel on top."""
+        render_system = make_render_system(screen, font_size=40, use_dirty_rects=True)
+        below = self.label("A")
+        corner = GameObject().add(Position(20, 20)).add(LabelComponent("x"))
+        world = World([self.panel(), below, corner])
+        render_system.update(world)
+        below.get(LabelComponent).text = "B"
+        render_system.update(world)
+
+        full = RenderSystem(pygame.Surface((640, 400)), render_system.font)
+        full.screen.fill(GameConfig.BACKGROUND_COLOR)
+        full.update(world)
+
+        assert render_system.dirty_rects != [screen.get_rect()]
+        assert pygame.image.tobytes(screen, "RGB") == (
+            pygame.image.tobytes(full.screen, "RGB")
+        )
+
+
+class TestDrawerRegistry:
+    @pytest.fixture
+    def render_system(self, make_render_system):
+        return make_render_system()
+
+    @pytest.fixture
+    def marker_type(self):
+        class MarkerComponent:
+            pass
+
+        yield MarkerComponent
+        RenderSystem.unregister_drawer(MarkerComponent)
+
+    def test_registered_drawer_is_called(self, render_system, marker_type):
+        """Test that a third-party component is drawn by its registered drawer."""
+        calls = []
+
+        def draw_marker(render, component, position, alpha, entity):
+            calls.append((render, component, (position.x, position.y), alpha, entity))
+            area = pygame.Rect(position.x, position.y, 4, 4)
+            return render.screen.fill((255, 0, 0), area)
+
+        RenderSystem.register_drawer(marker_type, draw_marker)
+        marker = marker_type()
+        entity = GameObject().add(Position(10, 20)).add(marker)
+        plain = GameObject().add(Position(50, 50)).add(LabelComponent("A"))
+
+        render_system.update(World([entity, plain]))
+
+        assert calls == [(render_system, marker, (10, 20), 1.0, entity)]
+        assert render_system.screen.get_at((11, 21))[:3] == (255, 0, 0)
+        assert marker_type in RenderSystem.READS
+
+    def test_before_controls_draw_order(self, render_system, marker_type):
+        """Test that a drawer registered before another type runs first."""
+        order = []
+        RenderSystem.register_drawer(
+            marker_type,
+            lambda render, c, pos, alpha, e: order.append("marker"),
+            before=LabelComponent,
+        )
+        entity = GameObject().add(Position(0, 0)).add(LabelComponent("A"))
+        entity.add(marker_type())
+
+        with patch.object(
+            render_system, "draw_label", side_effect=lambda *a: order.append("label")
+        ):
+            render_system.update(World([entity]))
+
+        assert order == ["marker", "label"]
+
+    def test_only_present_components_are_dispatched(self, render_system):
+        """Test that entities only run the drawers of components they have."""
+        world = World([GameObject().add(Position(0, 0)).add(LabelComponent("A"))])
+
+        with (
+            patch.object(render_system, "draw_button") as draw_button,
+            patch.object(render_system, "draw_label") as draw_label,
+        ):
+            render_system.update(world)
+
+        draw_label.assert_called_once()
+        draw_button.assert_not_called()
+        rows = world.query(Position, optional=RenderSystem._row_components)
+        (plan,) = render_system._plans_for(rows)
+        assert [drawer for _, drawer in plan] == [RenderSystem._drawers[LabelComponent]]
+
+    def test_plans_are_reused_until_structure_changes(self, render_system):
+        """Test that a World's draw plans are built once per structure version."""
+        world = World([GameObject().add(Position(0, 0)).add(LabelComponent("A"))])
+        render_system.update(world)
+        plans = render_system._row_plans
+
+        render_system.update(world)
+        assert render_system._row_plans is plans
+
+        world.append(GameObject().add(Position(5, 5)).add(ButtonComponent("B")))
+        render_system.update(world)
+        assert render_system._row_plans is not plans
+        assert len(render_system._row_plans) == 2
+
+
+class TestNeedsRedraw:
+    @pytest.fixture
+    def render_system(self, make_render_system):
+        return make_render_system()
+
+    def test_unchanged_scene_needs_no_redraw(self, render_system):
+        """Test that only the first call and real changes request a redraw."""
+        label = GameObject().add(Position(100, 100)).add(LabelComponent("A"))
+        world = World([label])
+
+        assert render_system.needs_redraw(world)
+        assert not render_system.needs_redraw(world)
+
+        label.get(LabelComponent).set(text="B")
+        assert render_system.needs_redraw(world)
+        assert not render_system.needs_redraw(world)
+
+    def test_structural_changes_need_redraw(self, render_system):
+        """Test that adding/removing entities or a new scene requests a redraw."""
+        world = World([GameObject().add(Position(0, 0)).add(LabelComponent("A"))])
+        render_system.needs_redraw(world)
+
+        world.pop()
+        assert render_system.needs_redraw(world)
+        assert render_system.needs_redraw(World())
+
+    def test_invalidate_forces_redraw(self, render_system):
+        """Test that invalidate() requests a redraw of an unchanged scene."""
+        world = World()
+        render_system.needs_redraw(world)
+
+        render_system.invalidate()
+
+        assert render_system.needs_redraw(world)
+
+
+class TestAnimationSystem:
+    @pytest.fixture
+    def animation_system(self):
+        return AnimationSystem()
+
+    @staticmethod
+    def fading_entity(alpha=0.0, target=1.0, speed=2.0):
+        e = GameObject()
+        comp = AlphaComponent(alpha)
+        comp.target_alpha = target
+        comp.animation_speed = speed
+        return e.add(Position(0, 0)).add(comp)
+
+    def test_alpha_steps_by_delta_time(self, animation_system):
+        """Test that alpha moves by animation_speed * delta_time."""
+        e = self.fading_entity()
+        animation_system.update([e], 0.1)
+        assert e.get(AlphaComponent).alpha == pytest.approx(0.2)
+        animation_system.update([e], 1.0)
+        assert e.get(AlphaComponent).alpha == 1.0
+
+    def test_columnar_world_matches_list(self, animation_system):
+        """Test that columnar worlds animate alpha like plain entity lists."""
+        pytest.importorskip("numpy")
+        plain = self.fading_entity(1.0, 0.0)
+        columnar = self.fading_entity(1.0, 0.0)
+        world = World([columnar], columnar=True)
+        for _ in range(3):
+            animation_system.update([plain], 0.05)
+            animation_system.update(world, 0.05)
+        assert columnar.get(AlphaComponent).alpha == pytest.approx(
+            plain.get(AlphaComponent).alpha
+        )
+
+    def test_progress_steps_by_delta_time(self, animation_system):
+        """Test that progress bars fill towards their target over time."""
+        pb = ProgressBarComponent(0, 0, 100, 10)
+        pb.target_progress = 1.0
+        pb.animation_speed = 0.5
+        animation_system.update([GameObject().add(pb)], 0.5)
+        assert pb.progress == pytest.approx(0.25)
+
+    def test_tween_applies_easing_and_completes(self, animation_system):
+        """Test that a tween follows its easing curve and calls on_complete once."""
+        e = GameObject().add(Position(0, 0))
+        done = Mock()
+        tween(e, Position, "x", 100, 1.0, easing="ease_in_quad", on_complete=done)
+
+        animation_system.update([e], 0.5)
+        assert e.get(Position).x == 25
+        done.assert_not_called()
+
+        animation_system.update([e], 0.5)
+        animation_system.update([e], 0.5)
+        assert e.get(Position).x == 100
+        done.assert_called_once()
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_tweened_alpha_holds_after_completion(self, animation_system, columnar):
+        """Test that the alpha fade does not pull a tweened alpha back."""
+        if columnar:
+            pytest.importorskip("numpy")
+        e = self.fading_entity(1.0, 1.0)
+        entities = World([e], columnar=True) if columnar else [e]
+        tween(e, AlphaComponent, "alpha", 0.25, 0.2)
+
+        for _ in range(10):
+            animation_system.update(entities, 0.05)
+
+        assert e.get(AlphaComponent).alpha == pytest.approx(0.25)
+        assert not animation_system.active
+
+    def test_tweened_progress_holds_after_completion(self, animation_system):
+        """Test that the progress fill does not pull a tweened progress back."""
+        pb = ProgressBarComponent(0, 0, 100, 10)
+        e = GameObject().add(pb)
+        tween(e, ProgressBarComponent, "progress", 0.8, 0.2)
+
+        for _ in range(10):
+            animation_system.update([e], 0.05)
+
+        assert pb.progress == pytest.approx(0.8)
+
+    def test_tween_interpolates_colors(self, animation_system):
+        """Test that tuple attributes such as colors are tweened per channel."""
+        e = GameObject().add(LabelComponent("Hi", color=(0, 0, 0)))
+        tween(e, LabelComponent, "color", (200, 100, 50), 1.0)
+        animation_system.update([e], 0.5)
+        assert e.get(LabelComponent).color == (100, 50, 25)
+
+    def test_tween_delay_and_cancel(self, animation_system):
+        """Test that delayed tweens wait and cancelled tweens stop in place."""
+        e = GameObject().add(Position(0, 0))
+        tween(e, Position, "y", 10, 1.0, delay=0.5)
+        animation_system.update([e], 0.4)
+        assert e.get(Position).y == 0
+        # 0.1s of this frame finish the delay, the other 0.5s run the tween
+        animation_system.update([e], 0.6)
+        assert e.get(Position).y == 5
+
+        assert cancel_tweens(e, Position) == 1
+        animation_system.update([e], 1.0)
+        assert e.get(Position).y == 5
+
+    def test_active_while_anything_moves(self, animation_system):
+        """Test that active stays True until fades and tweens have finished."""
+        e = self.fading_entity(speed=10.0)
+        tween(e, Position, "x", 10, 0.2)
+        animation_system.update([e], 0.1)
+        assert animation_system.active
+
+        # The fade is done, the tween is still running
+        animation_system.update([e], 0.05)
+        assert e.get(AlphaComponent).alpha == 1.0
+        assert animation_system.active
+
+        animation_system.update([e], 0.05)
+        assert not animation_system.active
+
+    def test_tween_rejects_unknown_easing(self):
+        """Test that an unknown easing name raises ValueError."""
+        e = GameObject().add(Position(0, 0))
+        with pytest.raises(ValueError):
+            tween(e, Position, "x", 1, 1.0, easing="bounce")
 
 
 class TestInputSystem:
@@ -300,6 +712,22 @@ class TestInputSystem:
         assert btn1.hover is False
         assert btn2.hover is True
 
+    def test_handle_mouse_up_runs_click_after_iteration(self):
+        """Test that on_click runs once all pressed states have been reset."""
+        input_system = InputSystem()
+
+        entity = GameObject()
+        btn = ButtonComponent("Test")
+        btn.width, btn.height = 50, 20
+        btn.pressed = True
+        pressed_during_click = []
+        btn.on_click = lambda: pressed_during_click.append(btn.pressed)
+        entity.add(Position(100, 100)).add(btn)
+
+        input_system.handle_mouse_up(100, 100, [entity])
+
+        assert pressed_during_click == [False]
+
 
 class TestSoundSystem:
     def test_sound_system_initialization(self):